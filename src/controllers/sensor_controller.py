@@ -6,17 +6,20 @@ Provides thread-safe access to sensor data and connection management.
 Supports TriSonica JSON protocol for sensor information retrieval.
 """
 
+import logging
 import threading
 from collections import deque
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
 from src.utils.logger import get_logger
 from src.workers.sensor_worker import SensorWorker
 from src.models.sensor_data import SensorData
 from src.models.app_config import SensorConfig
+from src.utils.plot_kernels import ERR_THRESH
 
 logger = get_logger(__name__)
 
@@ -37,6 +40,7 @@ class SensorController(QObject):
     Manages:
     - SensorWorker thread lifecycle
     - Data buffer (circular deque with max 200000 entries)
+    - Plot history (NumPy ring buffer of recent timestamps and U/V/W)
     - Connection state and reconnection logic
     - Thread-safe data access
     - Sensor information from JSON protocol
@@ -49,6 +53,9 @@ class SensorController(QObject):
     # Maximum reconnection attempts
     MAX_RECONNECT_ATTEMPTS = 4
     
+    # Number of recent samples kept in the plot ring buffer
+    PLOT_HISTORY_SIZE = 1000
+    
     def __init__(self, sensor_id: str, config: SensorConfig):
         """
         Initialize sensor controller
@@ -67,6 +74,11 @@ class SensorController(QObject):
         self.data_buffer: deque[SensorData] = deque(maxlen=200000)
         self.latest_data: Optional[SensorData] = None
         
+        # Plot ring buffer: rows of (timestamp, u, v, w), error values stored as NaN
+        self._plot_ring = np.full((self.PLOT_HISTORY_SIZE, 4), np.nan, dtype=np.float64)
+        self._plot_count = 0  # Total samples written (monotonic)
+        self._plot_cleared_at = 0  # Value of _plot_count at the last clear
+        
         # Thread synchronization
         self._buffer_lock = threading.Lock()
         
@@ -110,7 +122,7 @@ class SensorController(QObject):
         )
         
         # Connect signals
-        self.worker.data_received.connect(self._on_data_received)
+        self.worker.samples_ready.connect(self._on_samples_ready)
         self.worker.connection_status.connect(self._on_connection_status)
         self.worker.error_occurred.connect(self._on_error_occurred)
         self.worker.initialization_progress.connect(self._on_init_progress)
@@ -147,6 +159,9 @@ class SensorController(QObject):
         else:
             logger.info(f"{self.sensor_id}: Worker thread stopped")
         
+        # Take samples queued before the worker stopped
+        self._on_samples_ready()
+        
         # Clear worker reference
         self.worker = None
         
@@ -175,8 +190,72 @@ class SensorController(QObject):
         """
         with self._buffer_lock:
             self.data_buffer.clear()
+            self._plot_cleared_at = self._plot_count
             logger.debug(f"{self.sensor_id}: Data buffer cleared")
     
+    @property
+    def sample_count(self) -> int:
+        """
+        Total number of samples received
+        
+        Monotonically increasing (not reset by clear_buffer), so views can
+        cheaply detect whether anything new arrived since their last frame.
+        
+        Returns:
+            Sample counter value
+        """
+        with self._buffer_lock:
+            return self._plot_count
+    
+    def get_recent_arrays(self, n: int = PLOT_HISTORY_SIZE, out: Optional[np.ndarray] = None
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the most recent samples as NumPy arrays for plotting
+        
+        Thread-safe access to the plot ring buffer. Error values have
+        already been replaced with NaN at ingestion time.
+        
+        Args:
+            n: Maximum number of samples to return (capped at PLOT_HISTORY_SIZE)
+            out: Optional preallocated float64 array of shape (>= n, 4) to copy
+                into, so per-frame callers avoid a new allocation each call
+            
+        Returns:
+            Tuple of (timestamps, u, v, w) arrays in chronological order.
+            Timestamps are float64 epoch seconds. The arrays are views into
+            a snapshot copied under the lock, safe to use after it is released.
+        """
+        with self._buffer_lock:
+            available = self._plot_count - self._plot_cleared_at
+            return self._plot_slice(min(n, available), out)
+    
+    def _plot_slice(self, count: int, out: Optional[np.ndarray] = None
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Copy the newest rows out of the plot ring buffer
+        
+        Must be called with the buffer lock held. The rows are copied as one
+        contiguous block (two when the range wraps around).
+        
+        Args:
+            count: Number of samples (capped at PLOT_HISTORY_SIZE)
+            out: Optional destination array of shape (>= count, 4)
+            
+        Returns:
+            Tuple of (timestamps, u, v, w) column views of the copied block
+        """
+        count = min(count, self.PLOT_HISTORY_SIZE)
+        start = (self._plot_count - count) % self.PLOT_HISTORY_SIZE
+        end = start + count
+        block = np.empty((count, 4)) if out is None else out[:count]
+        if end <= self.PLOT_HISTORY_SIZE:
+            np.copyto(block, self._plot_ring[start:end])
+        else:
+            split = self.PLOT_HISTORY_SIZE - start
+            np.copyto(block[:split], self._plot_ring[start:])
+            np.copyto(block[split:], self._plot_ring[:end - self.PLOT_HISTORY_SIZE])
+        return block[:, 0], block[:, 1], block[:, 2], block[:, 3]
+    
     def get_latest_data(self) -> Optional[SensorData]:
         """
         Get the most recent data point
@@ -215,31 +294,62 @@ class SensorController(QObject):
         """
         return self.state.reconnect_count
     
-    def _on_data_received(self, data: SensorData) -> None:
+    def _on_samples_ready(self) -> None:
         """
-        Slot for handling received sensor data
+        Slot for the worker's samples_ready wake-up signal
         
-        Called by SensorWorker.data_received signal when new data arrives.
-        Adds data to the circular buffer and updates latest_data.
-        Thread-safe operation using buffer lock.
+        Drains every sample the worker has queued since the last wake-up.
+        """
+        if self.worker is not None:
+            self._on_data_batch_received(self.worker.take_samples())
+    
+    def _on_data_batch_received(self, batch: List[SensorData]) -> None:
+        """
+        Slot for handling a batch of received sensor data
+        
+        Called with the samples drained from the worker queue. Adds the samples
+        to the circular buffer and the plot ring and updates latest_data,
+        taking the buffer lock once per batch.
         
         Args:
-            data: Received SensorData object
+            batch: Received SensorData objects in arrival order
         """
+        if not batch:
+            return
+        
+        # Plot rows (epoch, u, v, w); error codes and non-finite values are
+        # masked to NaN once here so the plot path never has to
+        rows = np.array(
+            [(d.timestamp_epoch, d.u_component, d.v_component, d.w_component) for d in batch],
+            dtype=np.float64
+        )
+        values = rows[:, 1:]
+        values[~(np.abs(values) < ERR_THRESH)] = np.nan
+        if len(rows) > self.PLOT_HISTORY_SIZE:
+            rows = rows[-self.PLOT_HISTORY_SIZE:]
+        
         with self._buffer_lock:
-            # Add to circular buffer (auto-removes oldest if > 10000 entries)
-            self.data_buffer.append(data)
+            # Add to circular buffer (auto-removes oldest if > 200000 entries)
+            self.data_buffer.extend(batch)
+            
+            # Add to plot ring buffer
+            start = self._plot_count + len(batch) - len(rows)
+            index = (start + np.arange(len(rows))) % self.PLOT_HISTORY_SIZE
+            self._plot_ring[index] = rows
+            self._plot_count += len(batch)
             
             # Update latest data reference
-            self.latest_data = data
+            self.latest_data = batch[-1]
         
         # Log debug info (outside lock to minimize lock hold time)
-        logger.debug(
-            f"{self.sensor_id}: Data received - "
-            f"U={data.u_component:.2f}, V={data.v_component:.2f}, W={data.w_component:.2f}, "
-            f"T={data.temperature:.1f}°C, "
-            f"Buffer={len(self.data_buffer)}/200000"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            data = batch[-1]
+            logger.debug(
+                f"{self.sensor_id}: Data received ({len(batch)} samples) - "
+                f"U={data.u_component:.2f}, V={data.v_component:.2f}, W={data.w_component:.2f}, "
+                f"T={data.temperature:.1f}°C, "
+                f"Buffer={len(self.data_buffer)}/200000"
+            )
     
     def _on_connection_status(self, sensor_id: str, is_connected: bool) -> None:
         """
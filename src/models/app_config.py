@@ -4,6 +4,7 @@ Handles loading, saving, and managing configuration persistence
 """
 
 import json
+import os
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Dict, Optional, List
@@ -12,11 +13,14 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorConfig:
     """
     Configuration for a single sensor
     
+    Uses __slots__ (no per-instance __dict__); assigning undeclared
+    attributes raises AttributeError.
+    
     Attributes:
         port: COM port (e.g., "COM3")
         baud: Baud rate (default: 115200)
@@ -27,7 +31,7 @@ class SensorConfig:
     custom_init_commands: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """
     Application-wide configuration
@@ -46,15 +50,20 @@ class AppConfig:
     output_rate: int = 5
     window_geometry: List[int] = field(default_factory=lambda: [100, 100, 1280, 800])
     
+    # Environment variable that overrides the configuration file location
+    # (used by tests and portable installs)
+    CONFIG_PATH_ENV = 'MULTITRISONICA_CONFIG_PATH'
+    
     @staticmethod
     def _get_config_path() -> Path:
         """
         Get the path to the configuration file
         
         Returns:
-            Path to config.json in application root directory
+            Path from the MULTITRISONICA_CONFIG_PATH environment variable if
+            set, otherwise config.json in application root directory
         """
-        return Path("config.json")
+        return Path(os.environ.get(AppConfig.CONFIG_PATH_ENV) or "config.json")
     
     @classmethod
     def load_or_default(cls) -> 'AppConfig':
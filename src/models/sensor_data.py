@@ -2,17 +2,20 @@
 Data model for sensor readings from Trisonica anemometers
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 from src.utils.serial_parser import SerialParser
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensorData:
     """
     Immutable data structure representing a single sensor reading
     
+    Uses __slots__: recordings hold one instance per sample, so dropping the
+    per-instance __dict__ noticeably reduces their memory footprint.
+    
     Note: Humidity field is NOT included as Trisonica sensors do not output RH data.
     Only sonic temperature is available from the sensor.
     
@@ -28,6 +31,8 @@ class SensorData:
         pitch: Pitch angle (PI) in degrees
         roll: Roll angle (RO) in degrees
         is_valid: False if contains error values (-99.9, -99.99)
+        timestamp_epoch: Timestamp as float64 epoch seconds (derived, used on
+            the plot path so that relative times are a single array subtraction)
     """
     
     timestamp: datetime
@@ -41,10 +46,20 @@ class SensorData:
     pitch: float  # PI
     roll: float  # RO
     is_valid: bool
+    timestamp_epoch: float = field(init=False, repr=False, compare=False)
+    
+    # Format of the 8 numeric CSV cells (NUL-separated, split after), so a
+    # row's values are formatted in one %-operation
+    _CSV_VALUES_FORMAT = '\x00'.join(['%.2f'] * 8)
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived fields must be set via object.__setattr__
+        object.__setattr__(self, 'timestamp_epoch', self.timestamp.timestamp())
     
     @classmethod
     def from_parsed_dict(cls, sensor_id: str, parsed: Dict[str, float], 
-                        timestamp: Optional[datetime] = None) -> 'SensorData':
+                        timestamp: Optional[datetime] = None,
+                        timestamp_ns: Optional[int] = None) -> 'SensorData':
         """
         Create SensorData from a parsed dictionary
         
@@ -52,12 +67,14 @@ class SensorData:
             sensor_id: Identifier for the sensor
             parsed: Dictionary of tag-value pairs from SerialParser
             timestamp: Optional timestamp (uses current time if not provided)
+            timestamp_ns: Optional epoch time in nanoseconds (time.time_ns()
+                scale), used when timestamp is not provided
             
         Returns:
             SensorData instance
             
         Raises:
-            KeyError: If required tags are missing
+            KeyError: If required tags are missing (the message lists them)
             ValueError: If sensor_id is empty
             
         Example:
@@ -69,14 +86,21 @@ class SensorData:
             raise ValueError("sensor_id cannot be empty")
         
         if timestamp is None:
-            timestamp = datetime.now()
+            if timestamp_ns is not None:
+                timestamp = datetime.fromtimestamp(timestamp_ns / 1e9)
+            else:
+                timestamp = datetime.now()
         
-        # Extract required fields (will raise KeyError if missing)
-        speed_2d = parsed['S']
-        direction = parsed['D']
-        u_component = parsed['U']
-        v_component = parsed['V']
-        w_component = parsed['W']
+        # Extract required fields; the missing set is only computed on failure
+        try:
+            speed_2d = parsed['S']
+            direction = parsed['D']
+            u_component = parsed['U']
+            v_component = parsed['V']
+            w_component = parsed['W']
+        except KeyError:
+            missing = SerialParser.REQUIRED_TAGS - parsed.keys()
+            raise KeyError(f"Missing required tags: {', '.join(sorted(missing))}") from None
         
         # Extract optional fields with defaults
         # Temperature may not have a tag on some sensors
@@ -87,8 +111,7 @@ class SensorData:
         # Check if any values are error codes
         values_to_check = [speed_2d, direction, u_component, v_component, 
                           w_component, temperature, pitch, roll]
-        has_errors = any(SerialParser.is_error_value(v) for v in values_to_check)
-        is_valid = not has_errors
+        is_valid = SerialParser.ERROR_VALUES.isdisjoint(values_to_check)
         
         return cls(
             timestamp=timestamp,
@@ -131,22 +154,30 @@ class SensorData:
             ['2024-01-01 12:00:00.000', 'COM3', '9.89', '134.0', '-4.52', 
              '4.36', '-7.64', '27.96', '2.1', '-1.3']
         """
-        # Format timestamp in ISO 8601 with milliseconds
-        timestamp_str = self.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        
+        # Timestamp in ISO 8601 with milliseconds (isoformat truncates like
+        # strftime('%f')[:-3]), values in a single %-format pass
         return [
-            timestamp_str,
+            self.timestamp.isoformat(' ', 'milliseconds'),
             self.sensor_id,
-            f"{self.speed_2d:.2f}",
-            f"{self.direction:.2f}",
-            f"{self.u_component:.2f}",
-            f"{self.v_component:.2f}",
-            f"{self.w_component:.2f}",
-            f"{self.temperature:.2f}",
-            f"{self.pitch:.2f}",
-            f"{self.roll:.2f}"
+            *(self._CSV_VALUES_FORMAT % (
+                self.speed_2d, self.direction, self.u_component, self.v_component,
+                self.w_component, self.temperature, self.pitch, self.roll
+            )).split('\x00')
         ]
     
+    @staticmethod
+    def to_csv_rows(records: List['SensorData']) -> List[List[str]]:
+        """
+        Convert a list of readings to CSV rows
+        
+        Args:
+            records: SensorData objects
+            
+        Returns:
+            One to_csv_row() list per record, in order
+        """
+        return [record.to_csv_row() for record in records]
+    
     def __str__(self) -> str:
         """String representation for debugging"""
         return (f"SensorData({self.sensor_id} @ {self.timestamp.strftime('%H:%M:%S')}: "
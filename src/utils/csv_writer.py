@@ -4,9 +4,22 @@ Handles single and multi-sensor data export with proper formatting
 """
 
 import csv
-from datetime import datetime, timedelta
+import functools
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; export batches then keep their size
+    psutil = None
+
 from src.models.sensor_data import SensorData
 from src.utils.validators import Validators
 from src.utils.logger import get_logger
@@ -27,13 +40,43 @@ class CSVWriter:
     # Tolerance for timestamp matching (seconds)
     TIMESTAMP_TOLERANCE = timedelta(seconds=0.5)
     
+    # Numeric columns (CSV tag, SensorData attribute) in export order
+    VALUE_COLUMNS = (
+        ('S', 'speed_2d'), ('D', 'direction'), ('U', 'u_component'),
+        ('V', 'v_component'), ('W', 'w_component'), ('T', 'temperature'),
+        ('PI', 'pitch'), ('RO', 'roll')
+    )
+    
+    # Numeric values of one sample as a tuple in VALUE_COLUMNS order (one C call)
+    _VALUES_GETTER = attrgetter(*(attr for _, attr in VALUE_COLUMNS))
+    
+    # Format of the numeric cells of one sample (NUL-separated, split after)
+    _VALUES_FORMAT = '\x00'.join(['%.2f'] * len(VALUE_COLUMNS))
+    
+    # Rows formatted and written per batch when streaming column data
+    CHUNK_ROWS = 8192
+    
+    # Smallest multi-sensor batch when memory is tight, and how many batches
+    # are written between memory checks
+    MIN_CHUNK_ROWS = 512
+    MEMORY_CHECK_CHUNKS = 10
+    
+    # Characters that make csv.writer quote a field (default dialect)
+    _QUOTE_RE = re.compile(r'[,"\r\n]')
+    
+    # Output file buffer size (bytes); rows reach the OS in 1 MiB writes
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     @staticmethod
     def _format_timestamp(timestamp: datetime) -> str:
         """
         Format timestamp in ISO 8601 format with milliseconds
         
+        Uses datetime.isoformat (about 3x faster than strftime); it truncates
+        to milliseconds like the former strftime('%f')[:-3].
+        
         Args:
-            timestamp: Datetime object to format
+            timestamp: Naive (local) datetime object to format
             
         Returns:
             Formatted string: YYYY-MM-DD HH:mm:ss.fff
@@ -43,7 +86,7 @@ class CSVWriter:
             >>> CSVWriter._format_timestamp(dt)
             '2024-01-01 12:00:00.123'
         """
-        return timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        return timestamp.isoformat(' ', 'milliseconds')
     
     @staticmethod
     def _validate_filepath(filepath: str) -> tuple[bool, str]:
@@ -58,6 +101,152 @@ class CSVWriter:
         """
         return Validators.validate_csv_path(filepath)
     
+    @staticmethod
+    def sensor_data_to_columns(data: List[SensorData]) -> Dict[str, np.ndarray]:
+        """
+        Convert a list of SensorData to column arrays (structure of arrays)
+        
+        Args:
+            data: List of SensorData objects
+            
+        Returns:
+            Dictionary with 'timestamp' (datetime64[us], local wall time),
+            'sensor_id' (str array) and one float64 array per CSV tag
+            
+        Example:
+            >>> columns = CSVWriter.sensor_data_to_columns(sensor_data)
+            >>> columns['U'].mean()
+        """
+        n = len(data)
+        columns = {
+            'timestamp': CSVWriter._local_datetime64(
+                np.fromiter((d.timestamp_epoch for d in data), dtype=np.float64, count=n),
+                data
+            ),
+            'sensor_id': np.array([d.sensor_id for d in data], dtype=str),
+        }
+        for tag, attr in CSVWriter.VALUE_COLUMNS:
+            columns[tag] = np.fromiter((getattr(d, attr) for d in data),
+                                       dtype=np.float64, count=n)
+        return columns
+    
+    @staticmethod
+    def _local_datetime64(epoch: np.ndarray, data: List[SensorData]) -> np.ndarray:
+        """
+        Convert epoch seconds back to local wall-clock datetime64[us]
+        
+        Uses one UTC offset for the whole array when the data does not span
+        a UTC offset change (DST); otherwise converts the datetimes directly.
+        
+        Args:
+            epoch: Epoch seconds (SensorData.timestamp_epoch)
+            data: Source SensorData objects (used for the fallback)
+            
+        Returns:
+            datetime64[us] array of the original (naive, local) timestamps
+        """
+        if len(epoch) == 0:
+            return np.array([], dtype='datetime64[us]')
+        
+        def utc_offset(seconds: float) -> timedelta:
+            utc = datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+            return datetime.fromtimestamp(seconds) - utc
+        
+        first, last = float(epoch.min()), float(epoch.max())
+        offset = utc_offset(first)
+        if offset != utc_offset(last) or last - first > 86400:
+            return np.array([d.timestamp for d in data], dtype='datetime64[us]')
+        
+        micros = np.rint(epoch * 1e6).astype(np.int64)
+        return micros.astype('datetime64[us]') + np.timedelta64(offset)
+    
+    @staticmethod
+    def _split_columns(columns: Dict[str, np.ndarray],
+                       chunk_rows: int) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Split column arrays into row ranges
+        
+        Args:
+            columns: Column arrays as returned by sensor_data_to_columns()
+            chunk_rows: Maximum rows per chunk
+            
+        Yields:
+            Tuple of (timestamps, sensor_ids, value_block) for one chunk, where
+            value_block is an (n, 8) array in VALUE_COLUMNS order
+        """
+        tags = [tag for tag, _ in CSVWriter.VALUE_COLUMNS]
+        n = len(columns['timestamp'])
+        
+        for start in range(0, n, chunk_rows):
+            chunk = slice(start, start + chunk_rows)
+            block = np.column_stack([columns[tag][chunk] for tag in tags])
+            yield columns['timestamp'][chunk], columns['sensor_id'][chunk], block
+    
+    @staticmethod
+    def _format_rows(timestamps: np.ndarray, sensor_ids: np.ndarray,
+                     block: np.ndarray) -> Iterator[tuple]:
+        """
+        Format one chunk of column data into CSV row tuples
+        
+        Timestamps are formatted with one vectorized NumPy call; the numeric
+        block is formatted with a single %-format over the raveled values
+        instead of one f-string call per cell.
+        
+        Args:
+            timestamps: datetime64 array
+            sensor_ids: Sensor ID array
+            block: (n, 8) value array in VALUE_COLUMNS order
+            
+        Returns:
+            Iterator of row tuples
+        """
+        width = block.shape[1]
+        
+        # 'YYYY-MM-DDTHH:MM:SS.fff' -> replace the 'T' separator in place
+        ts_text = np.datetime_as_string(timestamps, unit='ms')
+        ts_text.view('U1').reshape(len(ts_text), -1)[:, 10] = ' '
+        
+        cells = ('%.2f\x00' * block.size % tuple(block.ravel().tolist())).split('\x00')[:-1]
+        return zip(ts_text.tolist(), sensor_ids.tolist(),
+                   *(cells[i::width] for i in range(width)))
+    
+    @staticmethod
+    def _is_plain(values: Iterable[str]) -> bool:
+        """
+        Check that no value needs CSV quoting (no comma, quote or newline)
+        
+        Args:
+            values: Free-text field values (e.g., sensor IDs)
+            
+        Returns:
+            True if rows made of these values can be joined without csv.writer
+        """
+        return not any(CSVWriter._QUOTE_RE.search(value) for value in values)
+    
+    @staticmethod
+    def _rows_to_text(rows: Iterable[Sequence[str]], plain: bool) -> str:
+        """
+        Join formatted rows into CSV text
+        
+        Plain rows are joined directly (about 5x faster than csv.writer, same
+        output: ',' separators and '\r\n' line endings); otherwise csv.writer
+        quotes the fields that need it.
+        
+        Args:
+            rows: Rows of formatted string fields
+            plain: True if no field needs quoting (see _is_plain)
+            
+        Returns:
+            CSV text of the rows
+        """
+        if plain:
+            text = '\r\n'.join(map(','.join, rows))
+            return text + '\r\n' if text else text
+        
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    
     @staticmethod
     def write_single_sensor(filepath: str, data: List[SensorData]) -> tuple[bool, str]:
         """
@@ -89,16 +278,20 @@ class CSVWriter:
             # Create parent directories if they don't exist
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
+            columns = CSVWriter.sensor_data_to_columns(data)
+            
             # Write with UTF-8 BOM for Excel compatibility
-            with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+            with open(filepath, 'w', encoding='utf-8-sig', newline='',
+                      buffering=CSVWriter.WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write header
                 writer.writerow(CSVWriter.SINGLE_SENSOR_HEADER)
                 
-                # Write data rows
-                for sensor_data in data:
-                    writer.writerow(sensor_data.to_csv_row())
+                # Stream data rows in column-formatted chunks
+                plain = CSVWriter._is_plain(np.unique(columns['sensor_id']).tolist())
+                for chunk in CSVWriter._split_columns(columns, CSVWriter.CHUNK_ROWS):
+                    f.write(CSVWriter._rows_to_text(CSVWriter._format_rows(*chunk), plain))
             
             logger.info(f"Wrote {len(data)} records to {filepath}")
             return True, f"Successfully wrote {len(data)} records"
@@ -118,17 +311,65 @@ class CSVWriter:
             logger.error(error_msg)
             return False, error_msg
     
+    @staticmethod
+    def write_per_sensor(path_pattern: str,
+                         sensor_data_dict: Dict[str, List[SensorData]]) -> Dict[str, tuple[bool, str]]:
+        """
+        Write each sensor's data to its own single-sensor CSV file in parallel
+        
+        Skips timestamp synchronization entirely (for use cases that do not
+        need aligned rows); the files are written on one thread per sensor so
+        that disk write latency overlaps.
+        
+        Args:
+            path_pattern: Output path containing '{sensor_id}'
+                (e.g., "C:/data/run1_{sensor_id}.csv")
+            sensor_data_dict: Dictionary mapping sensor_id to list of SensorData
+            
+        Returns:
+            Dictionary mapping sensor_id to (success, message) of its file
+            
+        Example:
+            >>> results = CSVWriter.write_per_sensor("out_{sensor_id}.csv", data_dict)
+            >>> all(success for success, _ in results.values())
+            True
+        """
+        if '{sensor_id}' not in path_pattern:
+            error_msg = "Path pattern must contain {sensor_id}"
+            logger.error(error_msg)
+            return {sensor_id: (False, error_msg) for sensor_id in sensor_data_dict}
+        
+        if not sensor_data_dict:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(sensor_data_dict)) as pool:
+            futures = {
+                sensor_id: pool.submit(
+                    CSVWriter.write_single_sensor,
+                    path_pattern.replace('{sensor_id}', sensor_id),
+                    data
+                )
+                for sensor_id, data in sensor_data_dict.items()
+            }
+        
+        return {sensor_id: future.result() for sensor_id, future in futures.items()}
+    
     @staticmethod
     def _synchronize_timestamps(sensor_data_dict: Dict[str, List[SensorData]]) -> List[Dict[str, SensorData]]:
         """
         Synchronize data from multiple sensors by timestamp using nearest-neighbor matching
         
         Algorithm:
-        1. Collect all unique timestamps from all sensors
-        2. Sort timestamps
-        3. For each timestamp, find the nearest data point from each sensor (within ±0.5s tolerance)
+        1. Sort each sensor's data by timestamp once
+        2. Merge the sorted timestamps of all sensors, dropping duplicates
+        3. Walk the timestamps in order with one forward-only cursor per sensor:
+           the nearest data point is one of the two samples around the cursor
+           (within ±0.5s tolerance; on a tie the later sample wins)
         4. Create synchronized rows with matched data or N/A for missing sensors
         
+        Runs in O(total samples × sensors) instead of scanning every sample
+        of every sensor for each timestamp.
+        
         Args:
             sensor_data_dict: Dictionary mapping sensor_id to list of SensorData
             
@@ -145,40 +386,164 @@ class CSVWriter:
         if not sensor_data_dict:
             return []
         
-        # Collect all timestamps
-        all_timestamps = set()
-        for sensor_data_list in sensor_data_dict.values():
-            for data in sensor_data_list:
-                all_timestamps.add(data.timestamp)
+        # Sort each sensor's data once (stable: equal timestamps keep their order)
+        sorted_data = {
+            sensor_id: sorted(sensor_data_list, key=lambda d: d.timestamp)
+            for sensor_id, sensor_data_list in sensor_data_dict.items()
+        }
         
-        # Sort timestamps
-        sorted_timestamps = sorted(all_timestamps)
+        # Collect all timestamps; concatenated sorted runs sort in about
+        # O(N log sensors) (Timsort merges runs), then adjacent duplicates go
+        all_timestamps = [
+            data.timestamp
+            for sensor_data_list in sorted_data.values()
+            for data in sensor_data_list
+        ]
+        all_timestamps.sort()
+        sorted_timestamps = [
+            t for t, following in zip(all_timestamps, all_timestamps[1:] + [None])
+            if t != following
+        ]
         
         # Build synchronized rows
-        synchronized_rows = []
+        synchronized_rows = [{'timestamp': t} for t in sorted_timestamps]
+        tolerance = CSVWriter.TIMESTAMP_TOLERANCE
         
-        for target_timestamp in sorted_timestamps:
-            row = {'timestamp': target_timestamp}
+        for sensor_id, sensor_data_list in sorted_data.items():
+            times = [data.timestamp for data in sensor_data_list]
+            n = len(times)
+            cursor = 0  # First sample at or after the current timestamp
             
-            # Find nearest data point from each sensor
-            for sensor_id, sensor_data_list in sensor_data_dict.items():
+            for row in synchronized_rows:
+                target_timestamp = row['timestamp']
+                while cursor < n and times[cursor] < target_timestamp:
+                    cursor += 1
+                
                 nearest_data = None
-                min_time_diff = CSVWriter.TIMESTAMP_TOLERANCE
+                min_time_diff = tolerance
                 
-                for data in sensor_data_list:
-                    time_diff = abs(data.timestamp - target_timestamp)
-                    if time_diff <= min_time_diff:
-                        min_time_diff = time_diff
-                        nearest_data = data
+                # Sample before the target (last of its run of equal timestamps)
+                if cursor > 0 and target_timestamp - times[cursor - 1] <= min_time_diff:
+                    min_time_diff = target_timestamp - times[cursor - 1]
+                    nearest_data = sensor_data_list[cursor - 1]
+                
+                # Sample at/after the target (last of its run); wins ties
+                if cursor < n and times[cursor] - target_timestamp <= min_time_diff:
+                    last = cursor
+                    while last + 1 < n and times[last + 1] == times[cursor]:
+                        last += 1
+                    nearest_data = sensor_data_list[last]
                 
                 row[sensor_id] = nearest_data
-            
-            synchronized_rows.append(row)
         
         return synchronized_rows
     
     @staticmethod
-    def write_multi_sensor(filepath: str, sensor_data_dict: Dict[str, List[SensorData]]) -> tuple[bool, str]:
+    @functools.lru_cache(maxsize=32)
+    def _multi_header(sensor_ids: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Build the multi-sensor CSV header (cached per sensor ID tuple)
+        
+        Args:
+            sensor_ids: Sensor IDs in column order
+            
+        Returns:
+            Header: 'Timestamp', then {sensor_id}_ID and one column per CSV tag
+            for each sensor
+            
+        Example:
+            >>> CSVWriter._multi_header(('Sensor1',))[:3]
+            ('Timestamp', 'Sensor1_ID', 'Sensor1_S')
+        """
+        fields = ('ID',) + tuple(tag for tag, _ in CSVWriter.VALUE_COLUMNS)
+        return ('Timestamp',) + tuple(
+            f'{sensor_id}_{field}' for sensor_id in sensor_ids for field in fields
+        )
+    
+    @staticmethod
+    def _multi_rows(synchronized_rows: List[Dict[str, SensorData]],
+                    sensor_ids: List[str]) -> Iterator[List[str]]:
+        """
+        Format synchronized rows into multi-sensor CSV rows
+        
+        A sample usually matches several consecutive timestamps, so the cells
+        of each sensor's last sample are kept and reused; every sample is
+        formatted once (one attrgetter call and one %-format for all values)
+        while memory stays constant.
+        
+        Args:
+            synchronized_rows: Rows as returned by _synchronize_timestamps()
+            sensor_ids: Sensor IDs in column order
+            
+        Yields:
+            CSV row (timestamp, then 9 columns per sensor; N/A if no match)
+        """
+        missing = ['N/A'] * 9
+        last_formatted = {}  # sensor_id -> (last SensorData, its 9 cells)
+        values_format = CSVWriter._VALUES_FORMAT
+        get_values = CSVWriter._VALUES_GETTER
+        
+        for row in synchronized_rows:
+            csv_row = [CSVWriter._format_timestamp(row['timestamp'])]
+            
+            for sensor_id in sensor_ids:
+                sensor_data = row.get(sensor_id)
+                
+                if sensor_data is None:
+                    # No data for this sensor at this timestamp
+                    csv_row.extend(missing)
+                    continue
+                
+                last_data, cells = last_formatted.get(sensor_id, (None, None))
+                if last_data is not sensor_data:
+                    cells = [sensor_data.sensor_id, *(
+                        values_format % get_values(sensor_data)
+                    ).split('\x00')]
+                    last_formatted[sensor_id] = (sensor_data, cells)
+                
+                # Add sensor data
+                csv_row.extend(cells)
+            
+            yield csv_row
+    
+    @staticmethod
+    def _adapt_chunk_rows(chunk_rows: int, max_memory_mb: float) -> int:
+        """
+        Adapt the multi-sensor batch size to the current memory usage
+        
+        Halves the batch size (down to MIN_CHUNK_ROWS) while the process RSS
+        is above max_memory_mb, and doubles it back (up to CHUNK_ROWS) once
+        usage is below the limit again.
+        
+        Without psutil the batch size is left unchanged.
+        
+        Args:
+            chunk_rows: Current rows per batch
+            max_memory_mb: RSS limit in MB
+            
+        Returns:
+            Rows per batch to use next
+        """
+        if psutil is None:
+            return chunk_rows
+        
+        try:
+            rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return chunk_rows
+        
+        if rss_mb > max_memory_mb:
+            new_rows = max(chunk_rows // 2, CSVWriter.MIN_CHUNK_ROWS)
+        else:
+            new_rows = min(chunk_rows * 2, CSVWriter.CHUNK_ROWS)
+        
+        if new_rows != chunk_rows:
+            logger.debug(f"CSV batch size {chunk_rows} -> {new_rows} rows (RSS {rss_mb:.0f} MB)")
+        return new_rows
+    
+    @staticmethod
+    def write_multi_sensor(filepath: str, sensor_data_dict: Dict[str, List[SensorData]],
+                           max_memory_mb: float = 512.0) -> tuple[bool, str]:
         """
         Write multi-sensor synchronized data to CSV file
         
@@ -186,9 +551,13 @@ class CSVWriter:
         Timestamp, Sensor1_ID, S1_S, S1_D, S1_U, S1_V, S1_W, S1_T, S1_PI, S1_RO,
         Sensor2_ID, S2_S, S2_D, S2_U, S2_V, S2_W, S2_T, S2_PI, S2_RO, ...
         
+        Rows are written in batches whose size adapts to memory pressure
+        (see _adapt_chunk_rows).
+        
         Args:
             filepath: Output CSV file path
             sensor_data_dict: Dictionary mapping sensor_id to list of SensorData
+            max_memory_mb: Process RSS above which the row batches shrink
             
         Returns:
             Tuple of (success, message)
@@ -222,55 +591,33 @@ class CSVWriter:
             
             # Build header
             sensor_ids = sorted(sensor_data_dict.keys())
-            header = ['Timestamp']
-            for sensor_id in sensor_ids:
-                header.extend([
-                    f'{sensor_id}_ID',
-                    f'{sensor_id}_S',
-                    f'{sensor_id}_D',
-                    f'{sensor_id}_U',
-                    f'{sensor_id}_V',
-                    f'{sensor_id}_W',
-                    f'{sensor_id}_T',
-                    f'{sensor_id}_PI',
-                    f'{sensor_id}_RO'
-                ])
+            header = CSVWriter._multi_header(tuple(sensor_ids))
             
             # Create parent directories if they don't exist
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
             # Write with UTF-8 BOM for Excel compatibility
-            with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+            with open(filepath, 'w', encoding='utf-8-sig', newline='',
+                      buffering=CSVWriter.WRITE_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write header
                 writer.writerow(header)
                 
-                # Write data rows
-                for row in synchronized_rows:
-                    csv_row = [CSVWriter._format_timestamp(row['timestamp'])]
-                    
-                    for sensor_id in sensor_ids:
-                        sensor_data = row.get(sensor_id)
-                        
-                        if sensor_data is None:
-                            # No data for this sensor at this timestamp
-                            csv_row.extend(['N/A'] * 9)
-                        else:
-                            # Add sensor data
-                            csv_row.extend([
-                                sensor_data.sensor_id,
-                                f"{sensor_data.speed_2d:.2f}",
-                                f"{sensor_data.direction:.2f}",
-                                f"{sensor_data.u_component:.2f}",
-                                f"{sensor_data.v_component:.2f}",
-                                f"{sensor_data.w_component:.2f}",
-                                f"{sensor_data.temperature:.2f}",
-                                f"{sensor_data.pitch:.2f}",
-                                f"{sensor_data.roll:.2f}"
-                            ])
-                    
-                    writer.writerow(csv_row)
+                # Write data rows in batches
+                plain = CSVWriter._is_plain({
+                    data.sensor_id
+                    for sensor_data_list in sensor_data_dict.values()
+                    for data in sensor_data_list
+                })
+                rows = CSVWriter._multi_rows(synchronized_rows, sensor_ids)
+                chunk_rows = CSVWriter.CHUNK_ROWS
+                written_chunks = 0
+                while chunk := list(islice(rows, chunk_rows)):
+                    f.write(CSVWriter._rows_to_text(chunk, plain))
+                    written_chunks += 1
+                    if written_chunks % CSVWriter.MEMORY_CHECK_CHUNKS == 0:
+                        chunk_rows = CSVWriter._adapt_chunk_rows(chunk_rows, max_memory_mb)
             
             logger.info(f"Wrote {len(synchronized_rows)} synchronized records to {filepath}")
             return True, f"Successfully wrote {len(synchronized_rows)} synchronized records"
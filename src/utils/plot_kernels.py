@@ -0,0 +1,94 @@
+"""
+Array kernels for the real-time plot path
+Reduces sample arrays to what the screen can actually display
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from src.utils.serial_parser import SerialParser
+
+
+# Velocity magnitudes at or above this are sensor error codes (-99.9, -99.99);
+# real U/V/W readings never get close, so one array compare replaces a
+# per-value SerialParser.is_error_value lookup on the plot path
+ERR_THRESH = min(abs(v) for v in SerialParser.ERROR_VALUES)
+
+
+def peak_downsample(times: np.ndarray, values: np.ndarray,
+                    target_n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Peak-preserving downsampling (min/max per bucket)
+
+    Splits the samples into at most target_n buckets of equal size and keeps
+    the minimum and maximum sample of each bucket in time order, so spikes
+    stay visible while the vertex count drops to about 2 * target_n.
+    NaN samples are ignored; an all-NaN bucket yields NaN (a line gap).
+
+    Args:
+        times: Sample times (1-D float array)
+        values: Sample values, same length as times
+        target_n: Number of buckets (typically the axis width in pixels)
+
+    Returns:
+        Tuple of (times, values); the inputs are returned unchanged when
+        there are no more than 2 * target_n samples
+
+    Example:
+        >>> t = np.arange(1000, dtype=float)
+        >>> t_ds, v_ds = peak_downsample(t, np.sin(t), 100)
+        >>> len(t_ds)
+        200
+    """
+    n = len(values)
+    if target_n <= 0 or n <= 2 * target_n:
+        return times, values
+
+    bucket = -(-n // target_n)  # ceil(n / target_n)
+    rows = -(-n // bucket)
+    padded = np.full(rows * bucket, np.nan, dtype=np.float64)
+    padded[:n] = values
+    padded = padded.reshape(rows, bucket)
+
+    nan_mask = np.isnan(padded)
+    lo = np.where(nan_mask, np.inf, padded).argmin(axis=1)
+    hi = np.where(nan_mask, -np.inf, padded).argmax(axis=1)
+
+    base = np.arange(rows) * bucket
+    idx = np.sort(np.stack((base + lo, base + hi), axis=1), axis=1).ravel()
+    return times[idx], values[idx]
+
+
+def fit_ylim(ax, values: np.ndarray, force: bool = False) -> bool:
+    """
+    Update an axis' Y limits from the data extents with hysteresis
+
+    Limits are reset (10% margin, 0.5 for constant data) only when the data
+    leaves the current view, or when non-constant data occupies less than
+    half of it (so the view shrinks again once a spike scrolls out), instead
+    of rescaling on every frame.
+
+    Args:
+        ax: Matplotlib axes (anything with get_ylim/set_ylim)
+        values: Plotted values (NaN for error values)
+        force: Reset the limits even if the data fits the current view
+
+    Returns:
+        True if the limits changed (a full redraw is required)
+
+    Example:
+        >>> if fit_ylim(axes_u, u_view):
+        ...     canvas.draw_idle()
+    """
+    if np.isnan(values).all():
+        return False
+    v_min = float(np.nanmin(values))
+    v_max = float(np.nanmax(values))
+    y_lo, y_hi = ax.get_ylim()
+    span = v_max - v_min
+    if force or v_min < y_lo or v_max > y_hi or 0 < span < 0.5 * (y_hi - y_lo):
+        margin = 0.1 * span or 0.5
+        ax.set_ylim(v_min - margin, v_max + margin)
+        return True
+    return False
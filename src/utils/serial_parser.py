@@ -4,7 +4,7 @@ Handles tagged data format with variable spacing
 """
 
 import re
-from typing import Dict, Optional
+from typing import AbstractSet, Dict, List, Optional
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -37,15 +37,22 @@ class SerialParser:
         'RO': 'Roll (degrees)'
     }
     
+    # Known tag names as a set for the well-formed line fast path
+    KNOWN_TAG_SET = frozenset(KNOWN_TAGS)
+    
     # Required tags for valid data packet
     # Note: T (temperature) is optional as some sensors don't include it
-    REQUIRED_TAGS = ['S', 'D', 'U', 'V', 'W']
+    # (frozenset: missing tags are a single set difference)
+    REQUIRED_TAGS = frozenset({'S', 'D', 'U', 'V', 'W'})
     
     # Known error values from sensor
-    ERROR_VALUES = [-99.9, -99.99]
+    # (frozenset: an error check is a single hash lookup; the sensor prints
+    # them as "-99.9"/"-99.99", which float() parses to exactly these values)
+    ERROR_VALUES = frozenset({-99.9, -99.99})
     
     @staticmethod
-    def parse_line(line: str) -> Dict[str, float]:
+    def parse_line(line: str,
+                   required_tags: Optional[AbstractSet[str]] = None) -> Optional[Dict[str, float]]:
         """
         Parse a line of tagged sensor data
         
@@ -55,9 +62,13 @@ class SerialParser:
         
         Args:
             line: Raw data line from sensor
+            required_tags: Optional set of tags that must be present; when
+                given, incomplete lines return None (replaces a separate
+                validate_data() call)
             
         Returns:
-            Dictionary mapping tag names to float values
+            Dictionary mapping tag names to float values, or None if
+            required_tags is given and not all of them were found
             
         Raises:
             ParseError: If line format is invalid or cannot be parsed
@@ -75,6 +86,39 @@ class SerialParser:
         if len(tokens) == 0:
             raise ParseError("No tokens in line")
         
+        # Fast path: strict "TAG value" pairs of known tags (the usual sensor
+        # output) convert in one zip instead of the per-token loop below
+        tags = tokens[::2]
+        if len(tokens) % 2 == 0 and SerialParser.KNOWN_TAG_SET.issuperset(tags):
+            try:
+                parsed_data = dict(zip(tags, map(float, tokens[1::2])))
+            except ValueError:
+                parsed_data = SerialParser._parse_tokens(tokens)
+        else:
+            parsed_data = SerialParser._parse_tokens(tokens)
+        
+        if not parsed_data:
+            raise ParseError(f"No valid tag-value pairs found in line: {line[:50]}")
+        
+        if required_tags is not None and not required_tags <= parsed_data.keys():
+            return None
+        
+        return parsed_data
+    
+    @staticmethod
+    def _parse_tokens(tokens: List[str]) -> Dict[str, float]:
+        """
+        Pair up tags and values token by token
+        
+        Skips tokens that do not form a tag-value pair (untagged values,
+        tags without a numeric value).
+        
+        Args:
+            tokens: Whitespace-split line
+            
+        Returns:
+            Dictionary mapping tag names to float values (may be empty)
+        """
         parsed_data = {}
         i = 0
         
@@ -108,9 +152,6 @@ class SerialParser:
             # Skip this token and try next
             i += 1
         
-        if not parsed_data:
-            raise ParseError(f"No valid tag-value pairs found in line: {line[:50]}")
-        
         return parsed_data
     
     @staticmethod
@@ -130,8 +171,7 @@ class SerialParser:
             >>> SerialParser.is_error_value(5.3)
             False
         """
-        # Use approximate comparison due to floating point precision
-        return any(abs(value - err) < 0.001 for err in SerialParser.ERROR_VALUES)
+        return value in SerialParser.ERROR_VALUES
     
     @staticmethod
     def validate_data(parsed: Dict[str, float]) -> bool:
@@ -153,10 +193,10 @@ class SerialParser:
             return False
         
         # Check that all required tags are present
-        for tag in SerialParser.REQUIRED_TAGS:
-            if tag not in parsed:
-                logger.warning(f"Missing required tag: {tag}")
-                return False
+        missing = SerialParser.REQUIRED_TAGS - parsed.keys()
+        if missing:
+            logger.warning(f"Missing required tags: {', '.join(sorted(missing))}")
+            return False
         
         return True
     
@@ -171,4 +211,4 @@ class SerialParser:
         Returns:
             True if any value is an error code
         """
-        return any(SerialParser.is_error_value(v) for v in parsed.values())
+        return not SerialParser.ERROR_VALUES.isdisjoint(parsed.values())
@@ -3,6 +3,8 @@ Input validation utilities for Multi-Trisonica GUI Application
 Validates COM ports, baud rates, file paths, and sensor parameters
 """
 
+import functools
+import os
 import re
 from pathlib import Path
 from typing import Union
@@ -13,12 +15,19 @@ class Validators:
     Collection of validation methods for user inputs and configuration
     """
     
-    # Valid baud rates for serial communication
-    VALID_BAUD_RATES = [9600, 19200, 38400, 57600, 115200]
+    # Valid baud rates for serial communication, in display order
+    VALID_BAUD_RATES_ORDERED = (9600, 19200, 38400, 57600, 115200)
+    
+    # Same rates as a frozenset for validation (hash lookup)
+    VALID_BAUD_RATES = frozenset(VALID_BAUD_RATES_ORDERED)
     
     # COM port pattern (Windows)
     COM_PORT_PATTERN = re.compile(r'^COM\d+$', re.IGNORECASE)
     
+    # Sensor ID pattern: alphanumeric and underscores, 1-20 characters
+    # (used with fullmatch, so a trailing newline is rejected too)
+    SENSOR_ID_PATTERN = re.compile(r'[a-zA-Z0-9_]{1,20}')
+    
     @staticmethod
     def validate_com_port(port: str) -> bool:
         """
@@ -69,9 +78,11 @@ class Validators:
         Validate CSV file path for security and format
         
         Checks:
-        - No path traversal attempts (..)
+        - No path traversal attempts (..), with either separator
         - Has .csv extension
-        - Is an absolute path or relative to current directory
+        
+        Pure string checks (no resolve(), which stats every path component);
+        results are cached per path string.
         
         Args:
             filepath: File path to validate
@@ -88,28 +99,38 @@ class Validators:
         if not filepath:
             return False, "File path is empty"
         
-        try:
-            path = Path(filepath)
-            
-            # Check for path traversal
-            if ".." in path.parts:
-                return False, "Path contains invalid traversal (..)"
-            
-            # Check for .csv extension
-            if path.suffix.lower() != '.csv':
-                return False, "File must have .csv extension"
-            
-            # Resolve to absolute path and check if it's within allowed directories
-            abs_path = path.resolve()
-            
-            # Additional security check: ensure resolved path doesn't escape
-            if ".." in str(abs_path):
-                return False, "Resolved path contains invalid traversal"
-            
-            return True, ""
+        return Validators._validate_csv_path_cached(os.fspath(filepath))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _validate_csv_path_cached(filepath: str) -> tuple[bool, str]:
+        """
+        Uncached body of validate_csv_path (memoized per path string)
+        
+        Args:
+            filepath: Non-empty file path string
             
-        except (ValueError, OSError) as e:
-            return False, f"Invalid path: {str(e)}"
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if '\x00' in filepath:
+            return False, "Invalid path: embedded null byte"
+        
+        # Split on both separators so Windows-style paths are checked on
+        # every platform
+        parts = filepath.replace('\\', '/').split('/')
+        
+        # Check for path traversal
+        if '..' in parts:
+            return False, "Path contains invalid traversal (..)"
+        
+        # Check for .csv extension (Path.suffix rules: a bare ".csv" name has
+        # no suffix)
+        name = parts[-1]
+        if len(name) <= 4 or name[-4:].lower() != '.csv':
+            return False, "File must have .csv extension"
+        
+        return True, ""
     
     @staticmethod
     def validate_output_rate(rate: Union[int, float, str]) -> bool:
@@ -151,7 +172,6 @@ class Validators:
             >>> Validators.validate_sensor_id("")
             False
         """
-        if not sensor_id or not isinstance(sensor_id, str):
+        if not isinstance(sensor_id, str):
             return False
-        # Allow alphanumeric and underscores, 1-20 characters
-        return bool(re.match(r'^[a-zA-Z0-9_]{1,20}$', sensor_id))
+        return Validators.SENSOR_ID_PATTERN.fullmatch(sensor_id) is not None
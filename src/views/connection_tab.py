@@ -88,7 +88,7 @@ class SensorConnectionPanel(QGroupBox):
         self.baud_combo = QComboBox()
         self.baud_combo.setMinimumWidth(100)
         # Populate with valid baud rates
-        for baud in Validators.VALID_BAUD_RATES:
+        for baud in Validators.VALID_BAUD_RATES_ORDERED:
             self.baud_combo.addItem(str(baud), baud)
         # Set default to 115200
         default_index = self.baud_combo.findData(115200)
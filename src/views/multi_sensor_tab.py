@@ -8,20 +8,22 @@ import logging
 import numpy as np
 from datetime import datetime
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QProgressBar,
     QPushButton, QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, pyqtSlot
+from PyQt5.QtGui import QFont, QBrush
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     from src.controllers.app_controller import AppController
 
 from src.utils.validators import Validators
 from src.models.sensor_data import SensorData
+from src.views.plot_canvas import PlotCanvas
+from src.views.workers import CsvExportTask
+from src.utils.plot_kernels import fit_ylim, peak_downsample
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +48,16 @@ class MultiSensorTab(QWidget):
         temp_humidity_table: QTableWidget for temperature/humidity display
         start_button, stop_button, clear_button, save_button: Control buttons
         update_timer: Timer for plot updates (30 FPS)
+        temp_timer: Timer for temperature table updates (2 Hz)
         is_recording: Recording state flag
     """
     
+    # Number of samples shown per sensor in the rolling plot window
+    PLOT_WINDOW = 1000
+    
+    # Temperature changes on second timescales; refresh the table at 2 Hz
+    TEMP_UPDATE_INTERVAL_MS = 500
+    
     def __init__(self, controller: 'AppController'):
         """
         Initialize multi-sensor tab
@@ -63,6 +72,24 @@ class MultiSensorTab(QWidget):
         # Axes and lines storage
         self.axes: Dict[str, tuple] = {}  # {sensor_id: (axes_u, axes_v, axes_w)}
         self.lines: Dict[str, tuple] = {}  # {sensor_id: (line_u, line_v, line_w)}
+        self._nodata: Dict[str, List] = {}  # {sensor_id: [text_u, text_v, text_w]}
+        self._axis_px_width = 0  # Subplot width in pixels (downsampling target)
+        self._last_seen_counts: Optional[tuple] = None  # Sample counts at last frame
+        self._backgrounds: List = []  # Cached axes backgrounds for blitting (12 axes)
+        
+        # Per-sensor frame buffers (time, u, v, w columns), reused every frame
+        self._frame_blocks = {
+            sensor_id: np.empty((self.PLOT_WINDOW, 4))
+            for sensor_id in ("Sensor1", "Sensor2", "Sensor3", "Sensor4")
+        }
+        
+        # Temperature table cache: last displayed value per row ('--' for error)
+        self._last_temp_rounded: List[Optional[Union[float, str]]] = [None] * 4
+        self._last_temp_warning: List[Optional[bool]] = [None] * 4
+        self._temp_brushes = {False: QBrush(Qt.black), True: QBrush(Qt.darkYellow)}
+        
+        # Running background CSV export (None when idle)
+        self._export_task: Optional[CsvExportTask] = None
         
         self._setup_ui()
         self._setup_plots()
@@ -71,6 +98,10 @@ class MultiSensorTab(QWidget):
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._update_plots)
         
+        # Temperature table timer (decoupled from the plot frame rate)
+        self.temp_timer = QTimer()
+        self.temp_timer.timeout.connect(self._update_temperatures)
+        
         logger.info("MultiSensorTab initialized")
     
     def _setup_ui(self):
@@ -100,6 +131,15 @@ class MultiSensorTab(QWidget):
         self.save_button.clicked.connect(self._on_save_csv_clicked)
         control_layout.addWidget(self.save_button)
         
+        # Busy indicator while a CSV export runs in the background
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 0)  # Indeterminate
+        self.export_progress.setFormat("Exporting...")
+        self.export_progress.setTextVisible(True)
+        self.export_progress.setMaximumWidth(150)
+        self.export_progress.setVisible(False)
+        control_layout.addWidget(self.export_progress)
+        
         control_layout.addStretch()
         
         layout.addWidget(control_group)
@@ -130,7 +170,9 @@ class MultiSensorTab(QWidget):
         plot_group.setLayout(plot_layout)
         
         self.figure = Figure(figsize=(12, 10))
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = PlotCanvas(self.figure)
+        self.canvas.mpl_connect('resize_event', self._update_axis_width)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         plot_layout.addWidget(self.canvas)
         
         layout.addWidget(plot_group)
@@ -138,6 +180,7 @@ class MultiSensorTab(QWidget):
     def _setup_plots(self):
         """Setup matplotlib subplots in 4x3 grid"""
         self.figure.clear()
+        self._backgrounds = []
         
         sensor_ids = ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]
         component_labels = ["U (East-West)", "V (North-South)", "W (Vertical)"]
@@ -146,6 +189,7 @@ class MultiSensorTab(QWidget):
         for row, sensor_id in enumerate(sensor_ids):
             axes_list = []
             lines_list = []
+            self._nodata[sensor_id] = []
             
             for col, (component, color) in enumerate(zip(component_labels, colors)):
                 # Create subplot (4 rows, 3 columns)
@@ -163,6 +207,16 @@ class MultiSensorTab(QWidget):
                 
                 # Create empty line
                 line, = ax.plot([], [], color=color, linewidth=1)
+                line.set_animated(True)  # Drawn by blitting, not by full redraws
+                
+                # Persistent "No Data" label, toggled instead of re-created
+                nodata = ax.text(0.5, 0.5, 'No Data',
+                                 horizontalalignment='center',
+                                 verticalalignment='center',
+                                 transform=ax.transAxes,
+                                 fontsize=12, color='gray')
+                nodata.set_visible(False)
+                self._nodata[sensor_id].append(nodata)
                 
                 axes_list.append(ax)
                 lines_list.append(line)
@@ -173,14 +227,70 @@ class MultiSensorTab(QWidget):
         
         self.figure.tight_layout()
         self.canvas.draw()
+        self._update_axis_width()
         
         logger.debug("Multi-sensor plots initialized")
     
+    def _clear_plot_data(self):
+        """
+        Remove plotted data without rebuilding the 4x3 subplot grid
+        
+        Much cheaper than _setup_plots(): only line data and the "No Data"
+        labels are touched, avoiding subplot creation and tight_layout.
+        """
+        for sensor_id, lines in self.lines.items():
+            for line in lines:
+                line.set_data([], [])
+            for text in self._nodata[sensor_id]:
+                text.set_visible(True)
+        self.canvas.draw_idle()
+    
+    def _update_axis_width(self, event=None):
+        """
+        Cache the subplot width in pixels
+        
+        All subplots share the same width, which is used as the bucket count
+        for peak downsampling. Recomputed whenever the canvas is resized.
+        
+        Args:
+            event: Matplotlib resize event (unused)
+        """
+        ax = self.axes["Sensor1"][0]
+        self._axis_px_width = max(1, int(ax.get_window_extent().width))
+    
+    def _on_draw(self, event):
+        """
+        Re-cache axes backgrounds after a full redraw
+        
+        Called by matplotlib on every full draw (setup, resize, rescale,
+        "No Data" toggling). The animated lines are drawn on top so they
+        stay visible.
+        
+        Args:
+            event: Matplotlib draw event
+        """
+        self._backgrounds = []
+        for sensor_id, axes in self.axes.items():
+            for ax, line in zip(axes, self.lines[sensor_id]):
+                self._backgrounds.append(self.canvas.copy_from_bbox(ax.bbox))
+                ax.draw_artist(line)
+    
+    def _blit_lines(self):
+        """Redraw only the 12 lines over the cached axes backgrounds"""
+        backgrounds = iter(self._backgrounds)
+        for sensor_id, axes in self.axes.items():
+            for ax, line in zip(axes, self.lines[sensor_id]):
+                self.canvas.restore_region(next(backgrounds))
+                ax.draw_artist(line)
+        # One repaint of the canvas instead of one per subplot
+        self.canvas.blit(self.figure.bbox)
+    
     @pyqtSlot()
     def _on_start_clicked(self):
         """Handle Start All button click"""
         self.is_recording = True
         self.update_timer.start(33)  # 30 FPS
+        self.temp_timer.start(self.TEMP_UPDATE_INTERVAL_MS)
         
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -192,6 +302,7 @@ class MultiSensorTab(QWidget):
         """Handle Stop All button click"""
         self.is_recording = False
         self.update_timer.stop()
+        self.temp_timer.stop()
         
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
@@ -219,13 +330,17 @@ class MultiSensorTab(QWidget):
             if sensor_controller:
                 sensor_controller.clear_buffer()
         
-        # Clear plots
-        self._setup_plots()
+        # Clear plot lines (axes, titles and layout are kept)
+        self._clear_plot_data()
         
-        # Reset temperature/humidity table
+        # Reset temperature/humidity table (text and warning color)
         for row in range(4):
-            self.temp_humidity_table.item(row, 0).setText("--°C")
+            temp_item = self.temp_humidity_table.item(row, 0)
+            temp_item.setText("--°C")
+            temp_item.setData(Qt.ForegroundRole, None)  # Default foreground
             self.temp_humidity_table.item(row, 1).setText("N/A")
+        self._last_temp_rounded = [None] * 4
+        self._last_temp_warning = [None] * 4
         
         logger.info("All sensor data cleared")
     
@@ -235,9 +350,22 @@ class MultiSensorTab(QWidget):
         if not self.is_recording:
             return
         
+        # Skip all render work while another tab is shown
+        if not self.isVisible():
+            return
+        
+        # Skip the frame when no sensor produced a new sample
+        counts = tuple(
+            controller.sample_count
+            for controller in self.controller.sensor_controllers.values()
+        )
+        if counts == self._last_seen_counts:
+            return
+        self._last_seen_counts = counts
+        
         try:
             # Find global time range across all sensors
-            all_times = []
+            x_max = None
             sensor_data_map = {}
             
             for sensor_id in ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]:
@@ -245,59 +373,51 @@ class MultiSensorTab(QWidget):
                 if not sensor_controller:
                     continue
                 
-                data_buffer = sensor_controller.get_data_buffer()
-                if not data_buffer:
+                ts, u, v, w = sensor_controller.get_recent_arrays(
+                    self.PLOT_WINDOW, out=self._frame_blocks[sensor_id])
+                if len(ts) == 0:
                     sensor_data_map[sensor_id] = None
                     continue
                 
-                # Get latest 1000 points
-                recent_data = data_buffer[-1000:]
-                sensor_data_map[sensor_id] = recent_data
+                # Relative times (seconds), computed in place in the frame buffer
+                times = np.subtract(ts, ts[0], out=ts)
+                sensor_data_map[sensor_id] = (times, u, v, w)
                 
-                # Collect timestamps for synchronization
-                if recent_data:
-                    first_time = recent_data[0].timestamp
-                    times = [(d.timestamp - first_time).total_seconds() for d in recent_data]
-                    all_times.extend(times)
+                # Track latest relative time for synchronization
+                sensor_max = float(times.max())
+                x_max = sensor_max if x_max is None else max(x_max, sensor_max)
             
-            # Determine common X-axis limits
-            if all_times:
-                x_min = min(all_times)
-                x_max = max(all_times)
-            else:
-                x_min, x_max = 0, 1
+            # Common X-axis limits: grow with 10% headroom, shrink when the
+            # data spans under half the view (avoids resetting every frame)
+            full_redraw = not self._backgrounds
+            _, x_hi = self.axes["Sensor1"][0].get_xlim()
+            if x_max is None:
+                x_hi = 1.0
+            elif x_max > x_hi or x_max < 0.5 * x_hi:
+                x_hi = x_max * 1.1 if x_max > 0 else 1.0
             
             # Update each sensor's plots
             for sensor_id in ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]:
                 axes_u, axes_v, axes_w = self.axes[sensor_id]
                 line_u, line_v, line_w = self.lines[sensor_id]
                 
-                recent_data = sensor_data_map.get(sensor_id)
+                entry = sensor_data_map.get(sensor_id)
                 
-                if recent_data:
-                    # Extract data
-                    first_time = recent_data[0].timestamp
-                    times = [(d.timestamp - first_time).total_seconds() for d in recent_data]
-                    u_values = [d.u_component if not d.is_error_value(d.u_component) else np.nan for d in recent_data]
-                    v_values = [d.v_component if not d.is_error_value(d.v_component) else np.nan for d in recent_data]
-                    w_values = [d.w_component if not d.is_error_value(d.w_component) else np.nan for d in recent_data]
+                if entry:
+                    # Error values are already NaN (masked at ingestion)
+                    times, u_values, v_values, w_values = entry
                     
-                    # Update lines
-                    line_u.set_data(times, u_values)
-                    line_v.set_data(times, v_values)
-                    line_w.set_data(times, w_values)
+                    full_redraw |= self._set_nodata_visible(sensor_id, False)
                     
-                    # Rescale Y axes
-                    axes_u.relim()
-                    axes_u.autoscale_view(scalex=False)
-                    axes_v.relim()
-                    axes_v.autoscale_view(scalex=False)
-                    axes_w.relim()
-                    axes_w.autoscale_view(scalex=False)
+                    # Update lines (downsampled to about 2 points per pixel column)
+                    target = self._axis_px_width
+                    line_u.set_data(*peak_downsample(times, u_values, target))
+                    line_v.set_data(*peak_downsample(times, v_values, target))
+                    line_w.set_data(*peak_downsample(times, w_values, target))
                     
-                    # Update temperature/humidity table
-                    latest_data = recent_data[-1]
-                    self._update_temp_humidity_table(sensor_id, latest_data)
+                    # Set Y limits from NumPy extents (no relim/autoscale scan)
+                    for ax, values in ((axes_u, u_values), (axes_v, v_values), (axes_w, w_values)):
+                        full_redraw |= fit_ylim(ax, values)
                     
                 else:
                     # No data - show "No Data" text
@@ -305,32 +425,62 @@ class MultiSensorTab(QWidget):
                     line_v.set_data([], [])
                     line_w.set_data([], [])
                     
-                    # Clear text if exists, then add new one
-                    for ax in [axes_u, axes_v, axes_w]:
-                        # Remove old "No Data" texts
-                        for txt in ax.texts:
-                            txt.remove()
-                        ax.text(0.5, 0.5, 'No Data', 
-                               horizontalalignment='center',
-                               verticalalignment='center',
-                               transform=ax.transAxes,
-                               fontsize=12, color='gray')
+                    full_redraw |= self._set_nodata_visible(sensor_id, True)
                 
                 # Synchronize X-axis
-                axes_u.set_xlim(x_min, x_max)
-                axes_v.set_xlim(x_min, x_max)
-                axes_w.set_xlim(x_min, x_max)
+                for ax in (axes_u, axes_v, axes_w):
+                    if ax.get_xlim() != (0.0, x_hi):
+                        ax.set_xlim(0.0, x_hi)
+                        full_redraw = True
             
-            # Redraw canvas
-            self.canvas.draw()
+            # Full redraw only when static artists changed; otherwise blit
+            # the lines (draw_idle lets Qt coalesce pending full draws)
+            if full_redraw:
+                self.canvas.draw_idle()
+            else:
+                self._blit_lines()
             
         except Exception as e:
             logger.error(f"Error updating multi-sensor plots: {e}", exc_info=True)
     
+    def _set_nodata_visible(self, sensor_id: str, visible: bool) -> bool:
+        """
+        Show or hide a sensor's "No Data" labels
+        
+        Args:
+            sensor_id: Sensor identifier
+            visible: Desired visibility
+            
+        Returns:
+            True if the visibility changed (a full redraw is required)
+        """
+        texts = self._nodata[sensor_id]
+        if texts[0].get_visible() == visible:
+            return False
+        for text in texts:
+            text.set_visible(visible)
+        return True
+    
+    def _update_temperatures(self):
+        """Refresh the temperature table from each sensor's latest sample (called by temp_timer)"""
+        if not self.is_recording or not self.isVisible():
+            return
+        for sensor_id in ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]:
+            sensor_controller = self.controller.sensor_controllers.get(sensor_id)
+            if not sensor_controller:
+                continue
+            latest_data = sensor_controller.get_latest_data()
+            if latest_data is not None:
+                self._update_temp_humidity_table(sensor_id, latest_data)
+    
     def _update_temp_humidity_table(self, sensor_id: str, data: SensorData):
         """
         Update temperature/humidity table for a specific sensor
         
+        The cell is only touched when the displayed (2-decimal) value or the
+        warning color changes, avoiding redundant QTableWidget repaints.
+        Humidity is always N/A and is set when the table is created/cleared.
+        
         Args:
             sensor_id: Sensor identifier
             data: Latest sensor data
@@ -339,24 +489,25 @@ class MultiSensorTab(QWidget):
             # Determine row index
             sensor_ids = ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]
             row = sensor_ids.index(sensor_id)
+            item = self.temp_humidity_table.item(row, 0)
             
             # Update temperature
             if data.is_error_value(data.temperature):
-                temp_text = "--°C"
-            else:
-                temp = data.temperature
-                temp_text = f"{temp:.2f}°C"
-                
-                # Warn if out of range
-                if temp < -40 or temp > 60:
-                    self.temp_humidity_table.item(row, 0).setForeground(Qt.darkYellow)
-                else:
-                    self.temp_humidity_table.item(row, 0).setForeground(Qt.black)
+                if self._last_temp_rounded[row] != "--":
+                    item.setText("--°C")
+                    self._last_temp_rounded[row] = "--"
+                return
             
-            self.temp_humidity_table.item(row, 0).setText(temp_text)
+            temp = round(data.temperature, 2)
+            if temp != self._last_temp_rounded[row]:
+                item.setText(f"{temp:.2f}°C")
+                self._last_temp_rounded[row] = temp
             
-            # Humidity is always N/A
-            self.temp_humidity_table.item(row, 1).setText("N/A")
+            # Warn if out of range
+            warning = temp < -40 or temp > 60
+            if warning != self._last_temp_warning[row]:
+                item.setForeground(self._temp_brushes[warning])
+                self._last_temp_warning[row] = warning
             
         except Exception as e:
             logger.error(f"Error updating temp/humidity table: {e}")
@@ -369,7 +520,7 @@ class MultiSensorTab(QWidget):
             has_data = False
             for sensor_id in ["Sensor1", "Sensor2", "Sensor3", "Sensor4"]:
                 sensor_controller = self.controller.sensor_controllers.get(sensor_id)
-                if sensor_controller and sensor_controller.get_data_buffer():
+                if sensor_controller and sensor_controller.get_buffer_size() > 0:
                     has_data = True
                     break
             
@@ -390,30 +541,22 @@ class MultiSensorTab(QWidget):
                 return  # User cancelled
             
             # Validate filepath
-            if not Validators.validate_csv_path(filepath):
+            is_valid, error_msg = Validators.validate_csv_path(filepath)
+            if not is_valid:
                 QMessageBox.warning(
                     self,
                     "Invalid Path",
-                    "Invalid file path. Please use a valid path with .csv extension."
+                    f"Invalid file path: {error_msg}\nPlease use a valid path with .csv extension."
                 )
                 return
             
-            # Export multi-sensor CSV
-            success = self.controller.export_multi_sensor_csv(filepath)
+            # Export multi-sensor CSV in the background
+            self.save_button.setEnabled(False)
+            self.export_progress.setVisible(True)
             
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Multi-sensor CSV file saved successfully:\n{filepath}"
-                )
-                logger.info(f"Multi-sensor CSV exported to {filepath}")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Export Failed",
-                    "Failed to export CSV file. Check logs for details."
-                )
+            self._export_task = CsvExportTask(self.controller.export_multi_sensor_csv, filepath)
+            self._export_task.signals.finished.connect(self._on_export_finished)
+            QThreadPool.globalInstance().start(self._export_task)
             
         except OSError as e:
             logger.error(f"OSError during CSV export: {e}")
@@ -429,3 +572,31 @@ class MultiSensorTab(QWidget):
                 "Error",
                 f"An unexpected error occurred:\n{e}"
             )
+    
+    @pyqtSlot(bool, str)
+    def _on_export_finished(self, success: bool, message: str):
+        """
+        Handle completion of a background multi-sensor CSV export
+        
+        Args:
+            success: True if the file was written
+            message: Result message from the controller
+        """
+        filepath = self._export_task.filepath if self._export_task else ""
+        self._export_task = None
+        self.export_progress.setVisible(False)
+        self.save_button.setEnabled(True)
+        
+        if success:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Multi-sensor CSV file saved successfully:\n{filepath}\n\n{message}"
+            )
+            logger.info(f"Multi-sensor CSV exported to {filepath}")
+        else:
+            QMessageBox.warning(
+                self,
+                "Export Failed",
+                f"Failed to export CSV file:\n{message}"
+            )
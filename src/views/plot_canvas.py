@@ -0,0 +1,56 @@
+"""
+Plot Canvas for Multi-Trisonica GUI Application
+
+This module provides the matplotlib canvas shared by the plotting tabs.
+"""
+
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QImage, QPainter
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+
+
+class PlotCanvas(FigureCanvasQTAgg):
+    """
+    FigureCanvasQTAgg that paints straight from the Agg buffer
+
+    The stock paintEvent copies the damaged region out of the Agg renderer
+    (copy_from_bbox) before wrapping it in a QImage. Here the QImage wraps
+    the renderer's own RGBA buffer (buffer_rgba() memoryview) and only the
+    damaged source rectangle is drawn, so no intermediate copy is made.
+
+    Example:
+        >>> canvas = PlotCanvas(Figure(figsize=(10, 8)))
+        >>> layout.addWidget(canvas)
+    """
+
+    def paintEvent(self, event):
+        """
+        Paint the damaged region of the widget from the Agg buffer
+
+        Args:
+            event: Qt paint event
+        """
+        self._draw_idle()  # Only does something if a draw is pending
+
+        # No renderer yet: wait for the first FigureCanvasAgg.draw()
+        if not hasattr(self, 'renderer'):
+            return
+
+        painter = QPainter(self)
+        try:
+            # Keep the memoryview referenced while the QImage uses it
+            buf = self.buffer_rgba()
+            height, width = buf.shape[0], buf.shape[1]
+            image = QImage(buf, width, height, width * 4, QImage.Format_RGBA8888)
+
+            rect = event.rect()
+            ratio = self.device_pixel_ratio
+            source = QRectF(rect.left() * ratio, rect.top() * ratio,
+                            rect.width() * ratio, rect.height() * ratio)
+            painter.eraseRect(rect)
+            painter.drawImage(QRectF(rect), image, source)
+
+            # Zoom rectangle etc. drawn by the navigation toolbar
+            self._draw_rect_callback(painter)
+        finally:
+            painter.end()
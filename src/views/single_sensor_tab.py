@@ -5,23 +5,26 @@ This module implements the single sensor visualization tab with real-time plotti
 """
 
 import logging
+import time
+from functools import partial
 import numpy as np
-from collections import deque
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, 
-    QComboBox, QPushButton, QFileDialog, QMessageBox
+    QComboBox, QPushButton, QFileDialog, QMessageBox, QProgressBar
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, pyqtSlot
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional, List, Tuple
 
 if TYPE_CHECKING:
     from src.controllers.app_controller import AppController
 
 from src.utils.validators import Validators
 from src.models.sensor_data import SensorData
+from src.views.plot_canvas import PlotCanvas
+from src.views.workers import CsvExportTask
+from src.utils.plot_kernels import fit_ylim, peak_downsample
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +50,31 @@ class SingleSensorTab(QWidget):
         temp_label: Temperature display label
         humidity_label: Humidity display label
         start_button, stop_button, clear_button, save_button: Control buttons
-        update_timer: Timer for plot updates (30 FPS)
+        update_timer: Timer for plot updates (adaptive, targets TARGET_FPS)
+        temp_timer: Timer for temperature display updates (2 Hz)
         is_recording: Recording state flag
-        plot_data: Dictionary holding plot data buffers
     """
     
+    # Number of samples shown in the rolling plot window
+    PLOT_WINDOW = 1000
+    
+    # Temperature label style sheets by warning state (None: no reading)
+    TEMP_STYLES = {
+        None: "font-weight: bold; font-size: 14px;",
+        'ok': "font-weight: bold; font-size: 14px; color: #000000;",
+        'warn': "font-weight: bold; font-size: 14px; color: #FFA500;",
+    }
+    
+    # Target plot refresh rate; the timer interval adapts to hold it
+    TARGET_FPS = 30
+    
+    # Smoothing factor of the frame-time moving average (EWMA); 0.2 weights
+    # roughly the last 9 frames, so single slow frames do not swing the timer
+    DELAY_SMOOTHING = 0.2
+    
+    # Temperature changes on second timescales; refresh it at 2 Hz
+    TEMP_UPDATE_INTERVAL_MS = 500
+    
     def __init__(self, controller: 'AppController'):
         """
         Initialize single sensor tab
@@ -64,21 +87,38 @@ class SingleSensorTab(QWidget):
         self.is_recording = False
         self.selected_sensor = None
         
-        # Plot data buffers (for efficient plotting)
-        self.plot_data = {
-            'timestamps': deque(maxlen=1000),
-            'u': deque(maxlen=1000),
-            'v': deque(maxlen=1000),
-            'w': deque(maxlen=1000)
-        }
+        # Frame buffer (time, u, v, w columns) the controller's plot window is
+        # copied into every frame; error values are already NaN at ingestion
+        self._frame_block = np.empty((self.PLOT_WINDOW, 4))
+        self._last_seen_count = -1  # Controller sample count at the last drawn frame
+        
+        # Blitting state (axes backgrounds cached after each full redraw)
+        self._backgrounds: List = []
+        self._limits_initialized = False
+        self._axis_px_width = 0  # Axes width in pixels (downsampling target)
+        
+        # Temperature label cache (Qt text/style set only when they change)
+        self._last_temp_text = "--°C"
+        self._last_temp_style: Optional[str] = None
         
         self._setup_ui()
         self._setup_plots()
         
-        # Update timer (30 FPS = ~33ms)
+        # Running CSV export (kept referenced until its signal is delivered)
+        self._export_task: Optional[CsvExportTask] = None
+        
+        # Adaptive frame-rate state (EWMA of net frame times in seconds)
+        self._frame_delay: Optional[float] = None
+        self._skip_next_frame = False
+        
+        # Update timer (interval adjusted after every frame)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._update_plots)
         
+        # Temperature timer (decoupled from the plot frame rate)
+        self.temp_timer = QTimer()
+        self.temp_timer.timeout.connect(self._update_temperature)
+        
         logger.info("SingleSensorTab initialized")
     
     def _setup_ui(self):
@@ -123,6 +163,15 @@ class SingleSensorTab(QWidget):
         self.save_button.setEnabled(False)
         control_layout.addWidget(self.save_button)
         
+        # Busy indicator shown while a CSV export runs in the background
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 0)  # Indeterminate
+        self.export_progress.setFormat("Exporting...")
+        self.export_progress.setTextVisible(True)
+        self.export_progress.setMaximumWidth(150)
+        self.export_progress.setVisible(False)
+        control_layout.addWidget(self.export_progress)
+        
         layout.addWidget(control_group)
         
         # Temperature and Humidity display
@@ -132,7 +181,7 @@ class SingleSensorTab(QWidget):
         
         temp_humidity_layout.addWidget(QLabel("Temperature:"))
         self.temp_label = QLabel("--°C")
-        self.temp_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.temp_label.setStyleSheet(self.TEMP_STYLES[None])
         temp_humidity_layout.addWidget(self.temp_label)
         
         temp_humidity_layout.addStretch()
@@ -150,7 +199,8 @@ class SingleSensorTab(QWidget):
         plot_group.setLayout(plot_layout)
         
         self.figure = Figure(figsize=(10, 8))
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = PlotCanvas(self.figure)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         plot_layout.addWidget(self.canvas)
         
         layout.addWidget(plot_group)
@@ -183,11 +233,85 @@ class SingleSensorTab(QWidget):
         self.line_w, = self.axes_w.plot([], [], 'r-', linewidth=1)
         self.axes_w.set_title('W Component (Vertical)')
         
+        # Lines are drawn by blitting only, never into the cached backgrounds
+        for line in (self.line_u, self.line_v, self.line_w):
+            line.set_animated(True)
+        self._limits_initialized = False
+        
         self.figure.tight_layout()
         self.canvas.draw()
         
         logger.debug("Plots initialized")
     
+    def _clear_plot_data(self):
+        """
+        Remove plotted data without rebuilding the axes
+        
+        Much cheaper than _setup_plots(): only the line data is reset, and the
+        next full draw re-caches the axes backgrounds.
+        """
+        for line in (self.line_u, self.line_v, self.line_w):
+            line.set_data([], [])
+        self._limits_initialized = False
+        self.canvas.draw_idle()
+    
+    def _on_draw(self, event):
+        """
+        Re-cache axes backgrounds after a full redraw
+        
+        Called by matplotlib on every full draw (initial setup, resize,
+        rescale). The animated lines are drawn on top so they stay visible.
+        
+        Args:
+            event: Matplotlib draw event
+        """
+        axes = (self.axes_u, self.axes_v, self.axes_w)
+        self._backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax in axes]
+        self._axis_px_width = max(1, int(self.axes_u.bbox.width))
+        for ax, line in zip(axes, (self.line_u, self.line_v, self.line_w)):
+            ax.draw_artist(line)
+    
+    def _blit_lines(self):
+        """Redraw only the three lines over the cached axes backgrounds"""
+        for background, ax, line in zip(self._backgrounds,
+                                        (self.axes_u, self.axes_v, self.axes_w),
+                                        (self.line_u, self.line_v, self.line_w)):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+            self.canvas.blit(ax.bbox)
+    
+    def _update_limits(self, times: np.ndarray, u: np.ndarray,
+                       v: np.ndarray, w: np.ndarray) -> bool:
+        """
+        Fit axis limits to the data, resetting them only when needed
+        
+        Args:
+            times: Relative times (seconds)
+            u, v, w: Velocity components (NaN for error values)
+            
+        Returns:
+            True if any limit changed (a full redraw is required)
+        """
+        changed = False
+        force = not self._limits_initialized
+        
+        # X: grow with 10% headroom, shrink when data spans under half the view
+        x_max = float(times[-1])
+        _, x_hi = self.axes_u.get_xlim()
+        if force or x_max > x_hi or x_max < 0.5 * x_hi:
+            x_hi = x_max * 1.1 if x_max > 0 else 1.0
+            for ax in (self.axes_u, self.axes_v, self.axes_w):
+                ax.set_xlim(0, x_hi)
+            changed = True
+        
+        # Y: shared fit_ylim policy (grow on overflow, shrink
+        # with hysteresis once a spike leaves the window)
+        for ax, values in ((self.axes_u, u), (self.axes_v, v), (self.axes_w, w)):
+            changed |= fit_ylim(ax, values, force)
+        
+        self._limits_initialized = True
+        return changed
+    
     @pyqtSlot(str)
     def _on_sensor_changed(self, sensor_id: str):
         """
@@ -204,6 +328,7 @@ class SingleSensorTab(QWidget):
             self.save_button.setEnabled(False)
         else:
             self.selected_sensor = sensor_id
+            self._last_seen_count = -1
             self.start_button.setEnabled(True)
             self.clear_button.setEnabled(True)
             self.save_button.setEnabled(True)
@@ -216,7 +341,10 @@ class SingleSensorTab(QWidget):
             return
         
         self.is_recording = True
-        self.update_timer.start(33)  # 30 FPS
+        self._frame_delay = None
+        self._skip_next_frame = False
+        self.update_timer.start(int(1000 / self.TARGET_FPS))
+        self.temp_timer.start(self.TEMP_UPDATE_INTERVAL_MS)
         
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -229,6 +357,7 @@ class SingleSensorTab(QWidget):
         """Handle Stop Recording button click"""
         self.is_recording = False
         self.update_timer.stop()
+        self.temp_timer.stop()
         
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
@@ -259,105 +388,149 @@ class SingleSensorTab(QWidget):
         if sensor_controller:
             sensor_controller.clear_buffer()
         
-        # Clear local plot buffers
-        self.plot_data['timestamps'].clear()
-        self.plot_data['u'].clear()
-        self.plot_data['v'].clear()
-        self.plot_data['w'].clear()
+        # Redraw from the (now empty) controller buffer on the next frame
+        self._last_seen_count = -1
         
-        # Clear plots
-        self._setup_plots()
+        # Clear plot lines (axes, titles and layout are kept)
+        self._clear_plot_data()
         
         # Reset temperature display
-        self.temp_label.setText("--°C")
+        self._set_temp_label("--°C", None)
         
         logger.info(f"Data cleared for {self.selected_sensor}")
     
     @pyqtSlot()
     def _update_plots(self):
-        """Update plots with latest data (called by timer)"""
+        """
+        Update plots with latest data (called by timer)
+        
+        Measures the net frame time and adapts the timer interval so that
+        frame time plus idle time matches 1 / TARGET_FPS. A frame is skipped
+        after one that overran the frame period.
+        """
         if not self.selected_sensor or not self.is_recording:
             return
         
+        if self._skip_next_frame:
+            self._skip_next_frame = False
+            return
+        
+        start = time.perf_counter()
+        self._render_frame()
+        self._adapt_frame_rate(time.perf_counter() - start)
+    
+    def _adapt_frame_rate(self, delay: float):
+        """
+        Adjust the update timer interval from recent frame times
+        
+        The next frame time is predicted with an exponentially weighted
+        moving average of the measured ones; the interval is the frame
+        period minus that prediction: w = 1/r - max(min(E(N|T), 1/r - 0.001), 0).
+        
+        Args:
+            delay: Net time spent in the last frame (seconds)
+        """
+        period = 1.0 / self.TARGET_FPS
+        
+        if delay > period:
+            self._skip_next_frame = True
+        
+        if self._frame_delay is None:
+            self._frame_delay = delay
+        else:
+            self._frame_delay += self.DELAY_SMOOTHING * (delay - self._frame_delay)
+        
+        predicted = max(min(self._frame_delay, period - 0.001), 0.0)
+        self.update_timer.setInterval(max(1, int((period - predicted) * 1000)))
+    
+    def _render_frame(self):
+        """Pull new samples and redraw the plots"""
         try:
             # Get sensor controller
             sensor_controller = self.controller.sensor_controllers.get(self.selected_sensor)
             if not sensor_controller:
                 return
             
-            # Get latest data from buffer
-            data_buffer = sensor_controller.get_data_buffer()
+            # Nothing new since the last frame: skip array work and redraw
+            current_count = sensor_controller.sample_count
+            if current_count == self._last_seen_count:
+                return
+            self._last_seen_count = current_count
             
-            if not data_buffer:
+            # Copy the plot window straight into the reusable frame buffer
+            ts, u_view, v_view, w_view = sensor_controller.get_recent_arrays(
+                self.PLOT_WINDOW, out=self._frame_block)
+            if len(ts) == 0:
                 return
             
-            # Extract latest 1000 points (rolling window)
-            recent_data = data_buffer[-1000:]
+            # Relative times (seconds), computed in place in the frame buffer
+            times = np.subtract(ts, ts[0], out=ts)
             
-            # Extract timestamps and velocity components
-            if recent_data:
-                # Get first timestamp for relative time
-                first_time = recent_data[0].timestamp
-                
-                times = [(d.timestamp - first_time).total_seconds() for d in recent_data]
-                u_values = [d.u_component if not d.is_error_value(d.u_component) else np.nan for d in recent_data]
-                v_values = [d.v_component if not d.is_error_value(d.v_component) else np.nan for d in recent_data]
-                w_values = [d.w_component if not d.is_error_value(d.w_component) else np.nan for d in recent_data]
-                
-                # Update line data
-                self.line_u.set_data(times, u_values)
-                self.line_v.set_data(times, v_values)
-                self.line_w.set_data(times, w_values)
-                
-                # Rescale axes
-                self.axes_u.relim()
-                self.axes_u.autoscale_view()
-                self.axes_v.relim()
-                self.axes_v.autoscale_view()
-                self.axes_w.relim()
-                self.axes_w.autoscale_view()
-                
-                # Update temperature display
-                latest_data = recent_data[-1]
-                self._update_temp_humidity(latest_data)
-                
-                # Redraw canvas
-                self.canvas.draw()
+            # Update line data (min/max per pixel column when denser than the axes)
+            target = self._axis_px_width
+            self.line_u.set_data(*peak_downsample(times, u_view, target))
+            self.line_v.set_data(*peak_downsample(times, v_view, target))
+            self.line_w.set_data(*peak_downsample(times, w_view, target))
+            
+            # Full redraw only when limits change; otherwise blit the lines
+            if self._update_limits(times, u_view, v_view, w_view) or not self._backgrounds:
+                self.canvas.draw_idle()
+            else:
+                self._blit_lines()
                 
         except Exception as e:
             logger.error(f"Error updating plots: {e}", exc_info=True)
     
+    def _update_temperature(self):
+        """Refresh the temperature display from the latest sample (called by temp_timer)"""
+        if not self.selected_sensor or not self.is_recording:
+            return
+        sensor_controller = self.controller.sensor_controllers.get(self.selected_sensor)
+        if not sensor_controller:
+            return
+        latest_data = sensor_controller.get_latest_data()
+        if latest_data is not None:
+            self._update_temp_humidity(latest_data)
+    
     def _update_temp_humidity(self, data: SensorData):
         """
-        Update temperature and humidity display
+        Update temperature display
+        
+        Humidity is always N/A for this sensor and is set once in _setup_ui.
         
         Args:
             data: Latest sensor data
         """
         try:
             if data.is_error_value(data.temperature):
-                self.temp_label.setText("--°C")
-                self.temp_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+                self._set_temp_label("--°C", None)
             else:
                 temp = data.temperature
-                self.temp_label.setText(f"{temp:.2f}°C")
-                
                 # Warning for out-of-range temperature
-                if temp < -40 or temp > 60:
-                    self.temp_label.setStyleSheet(
-                        "font-weight: bold; font-size: 14px; color: #FFA500;"
-                    )
-                else:
-                    self.temp_label.setStyleSheet(
-                        "font-weight: bold; font-size: 14px; color: #000000;"
-                    )
-            
-            # Humidity is always N/A for this sensor
-            self.humidity_label.setText("N/A")
+                state = 'warn' if temp < -40 or temp > 60 else 'ok'
+                self._set_temp_label(f"{temp:.2f}°C", state)
             
         except Exception as e:
             logger.error(f"Error updating temperature/humidity: {e}")
     
+    def _set_temp_label(self, text: str, state: Optional[str]):
+        """
+        Set temperature label text and style, skipping unchanged values
+        
+        setStyleSheet() re-polishes the widget, so it is only called when the
+        warning state actually changes.
+        
+        Args:
+            text: Label text
+            state: 'ok', 'warn', or None for no reading
+        """
+        if text != self._last_temp_text:
+            self.temp_label.setText(text)
+            self._last_temp_text = text
+        if state != self._last_temp_style:
+            self.temp_label.setStyleSheet(self.TEMP_STYLES[state])
+            self._last_temp_style = state
+    
     @pyqtSlot()
     def _on_save_csv_clicked(self):
         """Handle Save CSV button click"""
@@ -372,8 +545,7 @@ class SingleSensorTab(QWidget):
                 return
             
             # Check if there's data to save
-            data_buffer = sensor_controller.get_data_buffer()
-            if not data_buffer:
+            if sensor_controller.get_buffer_size() == 0:
                 QMessageBox.information(self, "No Data", "No data to save")
                 return
             
@@ -390,30 +562,24 @@ class SingleSensorTab(QWidget):
                 return  # User cancelled
             
             # Validate filepath
-            if not Validators.validate_csv_path(filepath):
+            is_valid, error_msg = Validators.validate_csv_path(filepath)
+            if not is_valid:
                 QMessageBox.warning(
                     self,
                     "Invalid Path",
-                    "Invalid file path. Please use a valid path with .csv extension."
+                    f"Invalid file path: {error_msg}\nPlease use a valid path with .csv extension."
                 )
                 return
             
-            # Export CSV
-            success = self.controller.export_single_sensor_csv(self.selected_sensor, filepath)
+            # Export CSV in the background
+            self.save_button.setEnabled(False)
+            self.export_progress.setVisible(True)
             
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"CSV file saved successfully:\n{filepath}"
-                )
-                logger.info(f"CSV exported to {filepath}")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Export Failed",
-                    "Failed to export CSV file. Check logs for details."
-                )
+            self._export_task = CsvExportTask(
+                partial(self.controller.export_single_sensor_csv, self.selected_sensor), filepath
+            )
+            self._export_task.signals.finished.connect(self._on_export_finished)
+            QThreadPool.globalInstance().start(self._export_task)
             
         except OSError as e:
             logger.error(f"OSError during CSV export: {e}")
@@ -429,3 +595,31 @@ class SingleSensorTab(QWidget):
                 "Error",
                 f"An unexpected error occurred:\n{e}"
             )
+    
+    @pyqtSlot(bool, str)
+    def _on_export_finished(self, success: bool, message: str):
+        """
+        Handle completion of a background CSV export
+        
+        Args:
+            success: True if the file was written
+            message: Result message from the controller
+        """
+        filepath = self._export_task.filepath if self._export_task else ""
+        self._export_task = None
+        self.export_progress.setVisible(False)
+        self.save_button.setEnabled(self.selected_sensor is not None)
+        
+        if success:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"CSV file saved successfully:\n{filepath}\n\n{message}"
+            )
+            logger.info(f"CSV exported to {filepath}")
+        else:
+            QMessageBox.warning(
+                self,
+                "Export Failed",
+                f"Failed to export CSV file:\n{message}"
+            )
@@ -0,0 +1,61 @@
+"""
+Background tasks shared by the visualization tabs
+
+This module provides the QThreadPool plumbing used by the single- and
+multi-sensor tabs to export CSV files off the GUI thread.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from typing import Callable, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class WorkerSignals(QObject):
+    """
+    Signals for background tasks run on QThreadPool
+    
+    QRunnable is not a QObject, so its signals live on this helper object.
+    """
+    
+    finished = pyqtSignal(bool, str)  # (success, message)
+
+
+class CsvExportTask(QRunnable):
+    """
+    CSV export executed on the global QThreadPool
+    
+    Keeps the GUI thread responsive while large buffers are written; any
+    unexpected exception is reported as a failed (success, message) result,
+    so the tab always gets signals.finished.
+    
+    Example:
+        >>> task = CsvExportTask(controller.export_multi_sensor_csv, "out.csv")
+        >>> task.signals.finished.connect(on_finished)
+        >>> QThreadPool.globalInstance().start(task)
+    """
+    
+    def __init__(self, export: Callable[[str], Tuple[bool, str]], filepath: str):
+        """
+        Initialize export task
+        
+        Args:
+            export: Export function called with filepath on a pool thread,
+                returning (success, message)
+            filepath: Output CSV file path
+        """
+        super().__init__()
+        self.export = export
+        self.filepath = filepath
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Run the export and report (success, message) via signals.finished"""
+        try:
+            success, message = self.export(self.filepath)
+        except Exception as e:
+            logger.error(f"Error during CSV export: {e}", exc_info=True)
+            success, message = False, f"An unexpected error occurred:\n{e}"
+        self.signals.finished.emit(success, message)
@@ -4,10 +4,14 @@ Handles serial I/O, initialization, and data streaming in a separate thread
 Supports TriSonica JSON protocol (firmware 3.0.0+)
 """
 
+import functools
+import os
+import re
+import select
 import time
 import json
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from collections import deque
+from typing import Callable, List, Optional, Dict, Any
 
 from PyQt5.QtCore import QThread, pyqtSignal
 import serial
@@ -29,19 +33,87 @@ class SensorWorker(QThread):
     """
     
     # Qt Signals for cross-thread communication
-    data_received = pyqtSignal(SensorData)  # Emitted when valid data is parsed
+    samples_ready = pyqtSignal()  # Wake-up: samples queued (see take_samples)
     connection_status = pyqtSignal(str, bool)  # (sensor_id, is_connected)
     error_occurred = pyqtSignal(str, str)  # (sensor_id, error_message)
     initialization_progress = pyqtSignal(str, str)  # (sensor_id, command_sent)
     sensor_info_received = pyqtSignal(str, dict)  # (sensor_id, info_dict)
     
+    # Legacy command pacing: write one character at a time with CHAR_DELAY
+    # between them. Off by default (the whole command is written at once);
+    # can be re-enabled for sensors/tests that need it.
+    SLOW_PACING = False
+    CHAR_DELAY = 0.01  # Seconds between characters when SLOW_PACING is set
+    
+    # Error indicators in legacy CLI responses (matched on raw bytes)
+    _ERROR_RE = re.compile(rb'error|invalid', re.IGNORECASE)
+    
+    # Output settings keys (from the 'settings' JSON response) and the data
+    # tags they enable, in output order
+    TAG_MAPPING = (
+        ('Wind Speed', 'S'),
+        ('Wind Direction', 'D'),
+        ('Vertical Direction', 'DV'),
+        ('U', 'U'),
+        ('V', 'V'),
+        ('W', 'W'),
+        ('Sonic Temperature', 'T'),
+        ('Pitch', 'PI'),
+        ('Roll', 'RO'),
+        ('Status', 'ST'),
+    )
+    
+    # Tags a data line must contain to become a sample
+    REQUIRED_TAGS = SerialParser.REQUIRED_TAGS
+    
+    # Prefixes of streamed data lines interleaved with command responses
+    _DATA_LINE_PREFIXES = (b'S ', b's ')
+    
+    # Lines of interest in a plain-text version response, matched per line
+    # in priority order: model line, 'Serial Number: ...', 'Version: ...'
+    _VERSION_RE = re.compile(
+        r'^(?:(?=[^\n]*TriSonica)([^\n]*)'
+        r'|[^\n]*?Serial Number:([^\n]*)'
+        r'|[^\n]*?Version:([^\n]*))',
+        re.MULTILINE
+    )
+    
+    # Shared decoder for incremental parsing of JSON command responses
+    _JSON_DECODER = json.JSONDecoder()
+    
+    # Maximum bytes taken from the port file descriptor per read (larger
+    # than RX_OVERFLOW_BYTES so a backlog is seen in a single read)
+    READ_SIZE = 65536
+    
+    # Unprocessed receive data above this many bytes means the read loop has
+    # fallen behind; the buffers are flushed (see _read_loop)
+    RX_OVERFLOW_BYTES = 32768
+    
+    # Driver buffer sizes requested on open (honoured on Windows only)
+    RX_BUFFER_SIZE = 65536
+    TX_BUFFER_SIZE = 8192
+    
+    # in_waiting poll interval while waiting for responses without a file
+    # descriptor (Windows)
+    POLL_INTERVAL = 0.005
+    
+    # Capacity of the parsed-sample queue handed to the GUI thread (oldest
+    # samples are dropped if the consumer stalls for longer than this)
+    SAMPLE_QUEUE_SIZE = 8192
+    
+    # Minimum time between samples_ready wake-ups (about one display
+    # refresh); samples arriving in between are delivered together
+    WAKEUP_INTERVAL = 0.016
+    
     def __init__(self, sensor_id: str, port: str, baud: int, init_commands: List[str]):
         """
         Initialize sensor worker thread
         
         Args:
             sensor_id: Identifier for this sensor
-            port: COM port (e.g., "COM3")
+            port: COM port (e.g., "COM3") or a pyserial URL such as
+                "socket://host:port", "loop://" or
+                "spy://COM3?file=trace.txt" (for testing and profiling)
             baud: Baud rate (e.g., 115200)
             init_commands: List of initialization commands to send
         """
@@ -52,9 +124,35 @@ class SensorWorker(QThread):
         self.baud = baud
         self.init_commands = init_commands
         
+        # Wire format of each init command, encoded once (None if not ASCII)
+        self._init_cmd_bytes: List[Optional[bytes]] = [
+            self._encode_cli_command(cmd) for cmd in init_commands
+        ]
+        
         self._stop_requested = False
         self.serial_port: Optional[serial.Serial] = None
         self.buffer_overflow_count = 0
+        # Receive buffer shared by initialization and the read loop, so bytes
+        # are never dropped between phases
+        self._rx = bytearray()
+        # Complete data lines that arrived during initialization, handed to
+        # the read loop instead of being flushed
+        self._held_data = bytearray()
+        # Preallocated buffer for direct fd reads (filled in place, no
+        # per-read bytes allocation)
+        self._read_view = memoryview(bytearray(self.READ_SIZE))
+        
+        # Sample timestamps are time.monotonic_ns() + this offset (wall-clock
+        # epoch ns); re-anchored when the read loop starts
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+        
+        # Single-producer/single-consumer sample queue: the worker appends,
+        # the GUI thread drains it in take_samples(). deque append/popleft are
+        # atomic in CPython, so no lock is needed. samples_ready is emitted
+        # only when no wake-up is already pending.
+        self.samples: deque = deque(maxlen=self.SAMPLE_QUEUE_SIZE)
+        self._wakeup_pending = False
+        self._next_wakeup = 0.0  # time.monotonic() of the earliest next wake-up
         
         logger.info(f"SensorWorker created for {sensor_id} on {port} @ {baud} baud")
     
@@ -71,8 +169,9 @@ class SensorWorker(QThread):
         try:
             # Open serial port
             logger.info(f"{self.sensor_id}: Opening serial port {self.port}")
-            self.serial_port = serial.Serial(
-                port=self.port,
+            self.serial_port = serial.serial_for_url(
+                self.port,
+                do_not_open=True,
                 baudrate=self.baud,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
@@ -80,6 +179,16 @@ class SensorWorker(QThread):
                 timeout=1.0,
                 write_timeout=2.0
             )
+            self.serial_port.open()
+            
+            # Enlarge the driver buffers so short GUI stalls do not overflow
+            # them (pyserial only implements this on Windows)
+            try:
+                self.serial_port.set_buffer_size(
+                    rx_size=self.RX_BUFFER_SIZE, tx_size=self.TX_BUFFER_SIZE
+                )
+            except AttributeError:
+                pass
             
             # Flush any existing data in buffers
             self.serial_port.reset_input_buffer()
@@ -153,12 +262,7 @@ class SensorWorker(QThread):
         try:
             logger.info(f"{self.sensor_id}: Sending command: {command}")
             
-            # Send command character by character (JSON protocol)
-            for char in command:
-                self.serial_port.write(char.encode('ascii'))
-                time.sleep(0.01)  # 10ms delay between characters
-            
-            self.serial_port.flush()
+            self._write_command(command)
             
             # Brief delay to allow sensor to process
             time.sleep(0.1)
@@ -170,6 +274,25 @@ class SensorWorker(QThread):
             logger.error(f"{self.sensor_id}: Failed to send command: {e}")
             return False
     
+    def _write_command(self, command: str):
+        """
+        Write a command to the serial port and flush it
+        
+        The command is encoded once and written with a single call; with
+        SLOW_PACING it is sent one character at a time (legacy behaviour).
+        
+        Args:
+            command: Command string (ASCII)
+        """
+        data = command.encode('ascii')
+        if self.SLOW_PACING:
+            for i in range(len(data)):
+                self.serial_port.write(data[i:i + 1])
+                time.sleep(self.CHAR_DELAY)
+        else:
+            self.serial_port.write(data)
+        self.serial_port.flush()
+    
     def _try_json_initialization(self) -> Optional[Dict[str, Any]]:
         """
         Try to initialize sensor using JSON protocol (firmware 3.0.0+)
@@ -189,11 +312,6 @@ class SensorWorker(QThread):
         try:
             logger.info(f"{self.sensor_id}: Attempting JSON protocol initialization")
             
-            # Clear any existing data with longer wait time
-            time.sleep(0.5)  # Increased from 0.3 to 0.5 seconds
-            self.serial_port.reset_input_buffer()
-            time.sleep(0.2)  # Additional delay after buffer clear
-            
             # Step 1: Check JSON protocol support with {json} command (with retry)
             json_response = None
             for attempt in range(2):  # Try up to 2 times
@@ -205,7 +323,6 @@ class SensorWorker(QThread):
                 if attempt == 0:
                     logger.debug(f"{self.sensor_id}: First JSON attempt failed, retrying...")
                     time.sleep(0.5)
-                    self.serial_port.reset_input_buffer()
             
             if not json_response or 'error' in json_response:
                 logger.info(f"{self.sensor_id}: JSON protocol not supported or not available (tried 2 times)")
@@ -235,13 +352,14 @@ class SensorWorker(QThread):
             if version_response and 'raw' in version_response:
                 raw_version = version_response['raw']
                 # Extract model, serial number from text response
-                for line in raw_version.split('\n'):
-                    if 'TriSonica' in line:
-                        sensor_info['model'] = line.strip()
-                    elif 'Serial Number:' in line:
-                        sensor_info['serial_number'] = line.split(':', 1)[1].strip()
-                    elif 'Version:' in line and 'firmware_version' not in sensor_info:
-                        sensor_info['firmware_version'] = line.split(':', 1)[1].strip()
+                for match in self._VERSION_RE.finditer(raw_version):
+                    model, serial_num, version = match.groups()
+                    if model is not None:
+                        sensor_info['model'] = model.strip()
+                    elif serial_num is not None:
+                        sensor_info['serial_number'] = serial_num.strip()
+                    elif 'firmware_version' not in sensor_info:
+                        sensor_info['firmware_version'] = version.strip()
                 
                 self.initialization_progress.emit(
                     self.sensor_id,
@@ -274,23 +392,10 @@ class SensorWorker(QThread):
                 # Extract enabled tags from Output configuration
                 output_config = settings.get('Output', {})
                 if output_config:
-                    enabled_tags = []
-                    tag_mapping = {
-                        'Wind Speed': 'S',
-                        'Wind Direction': 'D',
-                        'Vertical Direction': 'DV',
-                        'U': 'U',
-                        'V': 'V',
-                        'W': 'W',
-                        'Sonic Temperature': 'T',
-                        'Pitch': 'PI',
-                        'Roll': 'RO',
-                        'Status': 'ST'
-                    }
-                    
-                    for key, tag in tag_mapping.items():
-                        if output_config.get(key) == 'Yes':
-                            enabled_tags.append(tag)
+                    enabled_tags = [
+                        tag for key, tag in self.TAG_MAPPING
+                        if output_config.get(key) == 'Yes'
+                    ]
                     
                     if enabled_tags:
                         sensor_info['enabled_tags'] = enabled_tags
@@ -316,10 +421,6 @@ class SensorWorker(QThread):
                     "Settings: Not available (using defaults)"
                 )
             
-            # Small delay before starting data acquisition
-            time.sleep(0.2)
-            self.serial_port.reset_input_buffer()
-            
             logger.info(f"{self.sensor_id}: JSON initialization completed successfully")
             return sensor_info
             
@@ -344,52 +445,31 @@ class SensorWorker(QThread):
         try:
             logger.info(f"{self.sensor_id}: Sending JSON command: {command} (timeout: {timeout}s)")
             
-            # Clear input buffer before sending command
-            self.serial_port.reset_input_buffer()
-            time.sleep(0.1)
-            
-            # Send command character by character (as observed in protocol log)
-            for char in command:
-                self.serial_port.write(char.encode('ascii'))
-                time.sleep(0.01)  # 10ms delay between characters
+            # Drop stale responses to earlier commands (data lines are kept)
+            self._discard_input()
             
-            self.serial_port.flush()
-            time.sleep(0.1)  # Additional delay after flush
+            self._write_command(command)
             
-            # Read response
+            # Read response, decoding JSON incrementally as lines arrive
             response_lines = []
-            start_time = time.time()
-            brace_count = 0
-            in_json = False
-            
-            while (time.time() - start_time) < timeout:
-                if self.serial_port.in_waiting > 0:
-                    try:
-                        line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-                        
-                        # Skip sensor data lines (start with "S ")
-                        if line.startswith('S ') or line.startswith('s '):
-                            continue
-                        
-                        if line:
-                            logger.debug(f"{self.sensor_id}: JSON response line: {line}")
-                            response_lines.append(line)
-                            
-                            # Track braces to detect complete JSON
-                            if '{' in line:
-                                in_json = True
-                                brace_count += line.count('{')
-                            if '}' in line:
-                                brace_count -= line.count('}')
-                            
-                            # Complete JSON received
-                            if in_json and brace_count <= 0:
-                                break
-                    
-                    except Exception as e:
-                        logger.warning(f"{self.sensor_id}: Error reading JSON response: {e}")
+            response_text = ""
+            scan_pos = 0  # Where to look for the next candidate '{'
+            parsed = None
+            
+            def on_line(line_bytes: bytes) -> bool:
+                nonlocal response_text, scan_pos, parsed
+                line = line_bytes.decode('ascii', errors='ignore')
+                logger.debug(f"{self.sensor_id}: JSON response line: {line}")
+                # Grow one buffer instead of re-joining every line so far
+                response_text += '\n' + line if response_lines else line
+                response_lines.append(line)
                 
-                time.sleep(0.05)
+                # An object can only complete on a line with '}'
+                if '}' in line:
+                    parsed, scan_pos = self._decode_json_object(response_text, scan_pos)
+                return parsed is not None
+            
+            self._read_until(timeout, on_line)
             
             if not response_lines:
                 logger.warning(f"{self.sensor_id}: No response to JSON command: {command} (timeout: {timeout}s)")
@@ -397,44 +477,58 @@ class SensorWorker(QThread):
             
             logger.info(f"{self.sensor_id}: Received {len(response_lines)} lines in response to {command}")
             
-            # Join response lines
-            response_text = '\n'.join(response_lines)
-            
             # Check for error messages
             if 'Invalid Parameter' in response_text or 'Invalid Command' in response_text:
                 logger.warning(f"{self.sensor_id}: JSON command rejected: {response_text}")
                 return {'error': 'Invalid command'}
             
-            # Try to parse as JSON
-            try:
-                # Handle nested JSON (outer braces may be wrapper)
-                if response_text.startswith('{') and response_text.endswith('}'):
-                    # Try parsing the full response
-                    try:
-                        parsed = json.loads(response_text)
-                        # If it's a wrapper with single key, unwrap it
-                        if len(parsed) == 1 and isinstance(list(parsed.values())[0], dict):
-                            return list(parsed.values())[0]
-                        return parsed
-                    except json.JSONDecodeError:
-                        # Try finding inner JSON
-                        inner_start = response_text.find('{', 1)
-                        inner_end = response_text.rfind('}', 0, -1)
-                        if inner_start > 0 and inner_end > inner_start:
-                            inner_json = response_text[inner_start:inner_end + 1]
-                            return json.loads(inner_json)
-                
+            if parsed is None:
                 # Return as raw text if not parseable as JSON
                 return {'raw': response_text}
-                
-            except json.JSONDecodeError as e:
-                logger.debug(f"{self.sensor_id}: Could not parse as JSON: {e}")
-                return {'raw': response_text}
+            
+            # If it's a wrapper with single key, unwrap it
+            if len(parsed) == 1:
+                inner = next(iter(parsed.values()))
+                if isinstance(inner, dict):
+                    return inner
+            return parsed
         
         except Exception as e:
             logger.error(f"{self.sensor_id}: Error sending JSON command: {e}")
             return {'error': str(e)}
     
+    @staticmethod
+    def _decode_json_object(text: str, scan_pos: int) -> tuple:
+        """
+        Try to decode a complete JSON object from a growing response
+        
+        Candidates start at each '{' from scan_pos on. A candidate that is
+        merely incomplete is kept for the next call; one that is malformed
+        (e.g. an echoed "{json}" command) is skipped for good, so every
+        character is rejected at most once.
+        
+        Args:
+            text: Response text received so far
+            scan_pos: Position returned by the previous call (0 initially)
+            
+        Returns:
+            Tuple of (object or None, scan_pos for the next call)
+        """
+        decoder = SensorWorker._JSON_DECODER
+        start = text.find('{', scan_pos)
+        while start >= 0:
+            try:
+                obj, _ = decoder.raw_decode(text, start)
+            except json.JSONDecodeError as e:
+                if e.pos >= len(text) or e.msg.startswith('Unterminated string'):
+                    return None, start  # Incomplete: wait for more lines
+                start = text.find('{', start + 1)
+                continue
+            if isinstance(obj, dict):
+                return obj, start
+            start = text.find('{', start + 1)
+        return None, len(text)
+    
     def _ensure_all_tags_enabled(self):
         """
         Ensure all output values have tags enabled
@@ -483,8 +577,8 @@ class SensorWorker(QThread):
             logger.info(f"{self.sensor_id}: Waiting 2 seconds for configuration to take effect...")
             time.sleep(2.0)
             
-            # Clear any old data that was sent with previous configuration
-            self.serial_port.reset_input_buffer()
+            # Drop any old data that was sent with previous configuration
+            self._discard_input(keep_data=False)
             
             logger.info(f"{self.sensor_id}: Tag configuration applied successfully")
             self.initialization_progress.emit(self.sensor_id, "Tags applied ✓")
@@ -493,6 +587,22 @@ class SensorWorker(QThread):
             logger.warning(f"{self.sensor_id}: Error configuring tags: {e}")
             # Continue anyway - sensor may still work with current configuration
     
+    @staticmethod
+    def _encode_cli_command(cmd: str) -> Optional[bytes]:
+        """
+        Encode a legacy CLI command with its line terminator
+        
+        Args:
+            cmd: Command string
+            
+        Returns:
+            ASCII bytes ending in CRLF, or None if the command is not ASCII
+        """
+        try:
+            return (cmd + '\r\n').encode('ascii')
+        except UnicodeEncodeError:
+            return None
+    
     def _send_init_commands(self):
         """
         Send legacy CLI initialization commands (fallback for older firmware)
@@ -519,72 +629,63 @@ class SensorWorker(QThread):
             self.initialization_progress.emit(self.sensor_id, "Ctrl+C (entering CLI mode)")
             
             # Step 2: Wait for prompt '>' to confirm CLI mode entry
-            start_time = time.time()
-            cli_mode_entered = False
             prompt_response = []
             
-            while (time.time() - start_time) < 2.0:  # 2 second timeout for CLI mode entry
-                if self.serial_port.in_waiting > 0:
-                    try:
-                        line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-                        if line:
-                            prompt_response.append(line)
-                            logger.debug(f"{self.sensor_id}: CLI response: {line}")
-                            
-                            # Look for '>' prompt indicating CLI mode
-                            if '>' in line:
-                                cli_mode_entered = True
-                                logger.info(f"{self.sensor_id}: CLI mode confirmed (prompt received)")
-                                break
-                    except Exception as e:
-                        logger.warning(f"{self.sensor_id}: Error reading CLI prompt: {e}")
-                
-                time.sleep(0.05)
+            def on_prompt_line(line_bytes: bytes) -> bool:
+                line = line_bytes.decode('ascii', errors='ignore')
+                prompt_response.append(line)
+                logger.debug(f"{self.sensor_id}: CLI response: {line}")
+                return b'>' in line_bytes
+            
+            # Look for '>' prompt indicating CLI mode (it may not end in a newline)
+            cli_mode_entered = self._read_until(
+                2.0, on_prompt_line, on_partial=lambda rest: b'>' in rest
+            )  # 2 second timeout for CLI mode entry
             
-            if not cli_mode_entered:
+            if cli_mode_entered:
+                logger.info(f"{self.sensor_id}: CLI mode confirmed (prompt received)")
+                # Small delay after prompt before sending commands
+                time.sleep(0.1)
+            else:
                 logger.warning(
                     f"{self.sensor_id}: CLI prompt '>' not detected. "
                     f"Received: {prompt_response}. Attempting to continue anyway..."
                 )
-            else:
-                # Small delay after prompt before sending commands
-                time.sleep(0.1)
             
             # Step 3: Send each initialization command
-            for cmd in self.init_commands:
+            for cmd, cmd_bytes in zip(self.init_commands, self._init_cmd_bytes):
                 if self._stop_requested:
                     logger.warning(f"{self.sensor_id}: Initialization interrupted by stop request")
                     return
                 
                 try:
                     # Send command
-                    cmd_bytes = (cmd + '\r\n').encode('ascii')
+                    if cmd_bytes is None:
+                        error_msg = f"Command '{cmd}' contains non-ASCII characters"
+                        logger.error(f"{self.sensor_id}: {error_msg}")
+                        self.error_occurred.emit(self.sensor_id, error_msg)
+                        continue
                     logger.debug(f"{self.sensor_id}: Sending command: {cmd}")
                     self.serial_port.write(cmd_bytes)
                     self.serial_port.flush()
                     self.initialization_progress.emit(self.sensor_id, cmd)
                     
-                    # Wait for response with timeout
-                    start_time = time.time()
+                    # Collect responses for the full 2 second window
                     response_lines = []
                     
-                    while (time.time() - start_time) < 2.0:  # 2 second timeout
-                        if self.serial_port.in_waiting > 0:
-                            try:
-                                line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-                                if line:
-                                    response_lines.append(line)
-                                    logger.debug(f"{self.sensor_id}: Response: {line}")
-                                    
-                                    # Check for error indicators
-                                    if 'error' in line.lower() or 'invalid' in line.lower():
-                                        error_msg = f"Command '{cmd}' returned error: {line}"
-                                        logger.error(f"{self.sensor_id}: {error_msg}")
-                                        self.error_occurred.emit(self.sensor_id, error_msg)
-                            except Exception as e:
-                                logger.warning(f"{self.sensor_id}: Error reading response: {e}")
+                    def on_response_line(line_bytes: bytes) -> bool:
+                        line = line_bytes.decode('ascii', errors='ignore')
+                        response_lines.append(line)
+                        logger.debug(f"{self.sensor_id}: Response: {line}")
                         
-                        time.sleep(0.05)  # Small delay between checks
+                        # Check for error indicators
+                        if self._ERROR_RE.search(line_bytes):
+                            error_msg = f"Command '{cmd}' returned error: {line}"
+                            logger.error(f"{self.sensor_id}: {error_msg}")
+                            self.error_occurred.emit(self.sensor_id, error_msg)
+                        return False
+                    
+                    self._read_until(2.0, on_response_line)  # 2 second timeout
                     
                     # Check if we got any response
                     if not response_lines:
@@ -606,9 +707,8 @@ class SensorWorker(QThread):
             
             logger.info(f"{self.sensor_id}: Initialization sequence completed successfully")
             
-            # Clear any remaining data in buffer before starting data acquisition
-            time.sleep(0.2)
-            self.serial_port.reset_input_buffer()
+            # Drop leftover command responses; data lines go to the read loop
+            self._discard_input()
             
         except SerialException as e:
             error_msg = f"Serial error during initialization: {str(e)}"
@@ -626,105 +726,92 @@ class SensorWorker(QThread):
         """
         Continuous data reading loop
         
-        Reads lines from serial port, parses them, and emits signals.
+        Drains all pending bytes with one read per pass into a receive
+        buffer (os.read on the port's file descriptor on POSIX, pyserial
+        elsewhere), splits complete lines off it, parses them and emits signals.
         Handles buffer overflow, timeouts, and parsing errors.
         Continues until stop is requested or connection is lost.
         
         Error handling:
-        - Buffer overflow (>4096 bytes): Flush and log warning
+        - Buffer overflow (>RX_OVERFLOW_BYTES unprocessed): Flush and log warning
         - SerialException: Emit connection_status(False) and exit
         - ParseError: Log and continue (data line is skipped)
-        - Timeout (2s): Log and continue
+        - Timeout (1s without data): Continue
         - Error codes (-99.9, -99.99): Emit data with is_valid=False
         """
         logger.info(f"{self.sensor_id}: Entering data read loop")
         parser = SerialParser()
+        # Data lines held during initialization are processed first
+        self._rx[:0] = self._held_data
+        self._held_data.clear()
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+        fd = self._native_fd()
+        
+        # Hoist attribute lookups out of the per-line loop (rx is cleared in
+        # place, never rebound, so the bound methods stay valid)
+        rx = self._rx
+        rfind = rx.rfind
+        process_line = self._process_line
+        publish = self._publish
+        if fd is not None:
+            read = functools.partial(self._read_native, fd)
+        else:
+            read = self._read_pyserial
         
         while not self._stop_requested:
             try:
-                # Check for buffer overflow (4096 bytes threshold)
-                if self.serial_port and self.serial_port.in_waiting > 4096:
+                # Read everything available in one call; with nothing pending
+                # this waits up to the 1 second port timeout
+                try:
+                    if self.samples and not self._wakeup_pending:
+                        # A wake-up is deferred: wait no longer than its due time
+                        chunk = self._read_available(
+                            fd, max(self._next_wakeup - time.monotonic(), 0.0)
+                        )
+                    else:
+                        chunk = read()
+                except (SerialException, OSError) as e:
+                    logger.error(f"{self.sensor_id}: Serial error reading data: {e}")
+                    self.connection_status.emit(self.sensor_id, False)
+                    break
+                
+                if not chunk:
+                    self._wake_consumer()  # Deliver any deferred samples
+                    continue  # Timeout
+                rx += chunk
+                
+                # Check for buffer overflow: this much unprocessed data means
+                # the loop has fallen behind the sensor
+                if len(rx) > self.RX_OVERFLOW_BYTES:
                     self.buffer_overflow_count += 1
                     logger.warning(
                         f"{self.sensor_id}: Input buffer overflow detected "
-                        f"({self.serial_port.in_waiting} bytes). "
+                        f"({len(rx)} bytes). "
                         f"Flushing buffer. Overflow count: {self.buffer_overflow_count}"
                     )
                     self.serial_port.reset_input_buffer()
+                    rx.clear()
                     continue
                 
-                # Read line with 1 second timeout (set in serial port initialization)
-                try:
-                    line_bytes = self.serial_port.readline()
-                    
-                    # Check if we got a complete line (ends with \n)
-                    if not line_bytes or not line_bytes.endswith(b'\n'):
-                        # Timeout or incomplete data
-                        if line_bytes:
-                            logger.debug(
-                                f"{self.sensor_id}: Incomplete line received, discarding: "
-                                f"{line_bytes[:50]}"
-                            )
-                        continue
-                    
-                    # Decode line
-                    line = line_bytes.decode('ascii', errors='ignore').strip()
-                    
-                    if not line:
-                        continue  # Skip empty lines
-                    
-                    logger.debug(f"{self.sensor_id}: Received: {line}")
-                    
-                except SerialException as e:
-                    logger.error(f"{self.sensor_id}: Serial error reading data: {e}")
-                    self.connection_status.emit(self.sensor_id, False)
-                    break
-                
-                # Parse the line
-                try:
-                    parsed_dict = parser.parse_line(line)
-                    
-                    # Validate parsed data (check for required tags)
-                    if not parser.validate_data(parsed_dict):
-                        logger.warning(
-                            f"{self.sensor_id}: Incomplete data (missing required tags), skipping"
-                        )
-                        continue
-                    
-                    # Convert to SensorData
-                    sensor_data = SensorData.from_parsed_dict(
-                        sensor_id=self.sensor_id,
-                        parsed=parsed_dict,
-                        timestamp=datetime.now()
-                    )
-                    
-                    # Check for error values (but still emit the data)
-                    # The is_valid flag is already set during construction
-                    if not sensor_data.is_valid:
-                        logger.debug(
-                            f"{self.sensor_id}: Data contains error codes (-99.9/-99.99)"
-                        )
-                    
-                    # Emit data signal
-                    self.data_received.emit(sensor_data)
-                    
-                except ParseError as e:
-                    # Non-numeric values or parsing failure
-                    logger.warning(f"{self.sensor_id}: Parse error: {e}. Line: {line}")
+                # Process every complete line; a trailing partial line stays
+                # in the buffer until the rest of it arrives. All complete
+                # lines are cut off and decoded in one go, then split.
+                end = rfind(b'\n')
+                if end < 0:
                     continue
+                text = rx[:end].decode('ascii', errors='ignore')
+                del rx[:end + 1]
                 
-                except ValueError as e:
-                    # Conversion error
-                    logger.warning(f"{self.sensor_id}: Value conversion error: {e}. Line: {line}")
-                    continue
+                received = []
+                for line in text.split('\n'):
+                    line = line.strip()
+                    if line:
+                        sensor_data = process_line(parser, line)
+                        if sensor_data is not None:
+                            received.append(sensor_data)
                 
-                except Exception as e:
-                    # Unexpected parsing error
-                    logger.error(
-                        f"{self.sensor_id}: Unexpected error parsing data: {e}",
-                        exc_info=True
-                    )
-                    continue
+                if received:
+                    publish(received)
                 
             except SerialException as e:
                 # Connection lost
@@ -745,3 +832,264 @@ class SensorWorker(QThread):
             f"{self.sensor_id}: Read loop exited. "
             f"Buffer overflows: {self.buffer_overflow_count}"
         )
+    
+    def _native_fd(self) -> Optional[int]:
+        """
+        Get the port's file descriptor for direct reads (POSIX only)
+        
+        Returns:
+            File descriptor, or None to read through pyserial (Windows,
+            URL handlers and other port types without a usable descriptor)
+        """
+        if os.name != 'posix':
+            return None
+        try:
+            return self.serial_port.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def _read_until(self, timeout: float, on_line: Callable[[bytes], bool],
+                    on_partial: Optional[Callable[[bytes], bool]] = None) -> bool:
+        """
+        Read response lines until a callback accepts one or the timeout expires
+        
+        Event-driven: wakes as soon as bytes arrive (select() on the port's
+        file descriptor, short in_waiting polls elsewhere) instead of
+        sleeping a fixed interval between checks. Bytes are taken from the
+        shared receive buffer; streamed data lines ("S ...") are held for
+        the read loop instead of being passed to on_line, and anything after
+        the accepted line stays buffered.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (0 processes only what
+                is already available)
+            on_line: Called with each complete, stripped, non-empty response
+                line (raw bytes); returning True stops reading
+            on_partial: Optional; called with the stripped unterminated
+                remainder after each read (for prompts without a newline);
+                the remainder is consumed when it returns True
+        
+        Returns:
+            True if a callback returned True, False on timeout
+        """
+        fd = self._native_fd()
+        deadline = time.monotonic() + timeout
+        rx = self._rx
+        
+        while True:
+            end = rx.find(b'\n')
+            while end >= 0:
+                line = bytes(rx[:end]).strip()
+                del rx[:end + 1]
+                if line.startswith(self._DATA_LINE_PREFIXES):
+                    self._hold_data_line(line)
+                elif line and on_line(line):
+                    return True
+                end = rx.find(b'\n')
+            
+            if on_partial is not None and rx and on_partial(bytes(rx).strip()):
+                rx.clear()
+                return True
+            
+            remaining = deadline - time.monotonic()
+            chunk = self._read_available(fd, max(remaining, 0.0))
+            if chunk:
+                rx += chunk
+            elif remaining <= 0:
+                return False
+    
+    def _hold_data_line(self, line: bytes):
+        """
+        Keep a data line received during initialization for the read loop
+        
+        Args:
+            line: Stripped data line (raw bytes)
+        """
+        held = self._held_data
+        held += line
+        held += b'\n'
+        # Keep only the newest lines if initialization runs long
+        if len(held) > self.RX_OVERFLOW_BYTES:
+            del held[:held.index(b'\n', len(held) - self.RX_OVERFLOW_BYTES) + 1]
+    
+    def _discard_input(self, keep_data: bool = True):
+        """
+        Drop pending input without flushing the driver buffer
+        
+        Reads what has already arrived and discards everything except
+        complete data lines, which are held for the read loop. Replaces
+        reset_input_buffer() between initialization steps, which also threw
+        away data samples.
+        
+        Args:
+            keep_data: False to discard held data lines as well (e.g. after
+                the output configuration changed)
+        """
+        self._read_until(0.0, lambda line: False)
+        rx = self._rx
+        if rx and not rx.startswith(self._DATA_LINE_PREFIXES):
+            rx.clear()  # Unterminated fragment of a response or prompt
+        if not keep_data:
+            self._held_data.clear()
+            rx.clear()
+    
+    def _read_available(self, fd: Optional[int], timeout: float) -> bytes:
+        """
+        Wait up to timeout for input and return what is available
+        
+        Args:
+            fd: File descriptor from _native_fd(), or None for pyserial
+            timeout: Maximum wait in seconds
+            
+        Returns:
+            Received bytes (empty if nothing arrived in time); see
+            _read_native for the lifetime of the returned view
+        """
+        if fd is not None:
+            return self._read_native(fd, timeout)
+        pending = self.serial_port.in_waiting
+        if pending:
+            return self.serial_port.read(pending)
+        time.sleep(min(self.POLL_INTERVAL, timeout))
+        return b''
+    
+    def _read_native(self, fd: int, timeout: Optional[float] = None) -> memoryview:
+        """
+        Read all available bytes straight from the port's file descriptor
+        
+        Waits with select() and returns as soon as any data is available,
+        bypassing pyserial's per-call overhead. Data is read into a
+        preallocated buffer (os.readv) instead of a new bytes object.
+        
+        Args:
+            fd: File descriptor from _native_fd()
+            timeout: Maximum wait in seconds (default: the port timeout)
+            
+        Returns:
+            View of the received bytes in the read buffer (empty on timeout);
+            only valid until the next read, so callers copy it out at once
+            
+        Raises:
+            SerialException: Port reported readable but returned no data
+                (device disconnected)
+        """
+        if timeout is None:
+            timeout = self.serial_port.timeout
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return b''
+        view = self._read_view
+        n = os.readv(fd, [view])
+        if not n:
+            raise SerialException("device reports readiness to read but returned no data")
+        return view[:n]
+    
+    def _read_pyserial(self) -> bytes:
+        """
+        Read all available bytes through pyserial (portable fallback)
+        
+        Returns:
+            Received bytes (empty on timeout)
+        """
+        return self.serial_port.read(self.serial_port.in_waiting or 1)
+    
+    def _publish(self, received: List[SensorData]):
+        """
+        Queue parsed samples for the GUI thread and wake it if needed
+        
+        At most one samples_ready signal is in flight at a time, and wake-ups
+        are at least WAKEUP_INTERVAL apart, so GUI wake-ups follow the
+        consumer's pace and the display rate rather than the sample rate.
+        
+        Args:
+            received: Samples parsed from one read
+        """
+        self.samples.extend(received)
+        self._wake_consumer()
+    
+    def _wake_consumer(self):
+        """
+        Emit samples_ready if samples are queued, no wake-up is pending and
+        the previous wake-up was at least WAKEUP_INTERVAL ago
+        
+        Deferred wake-ups are retried by the read loop once they are due.
+        """
+        if not self.samples or self._wakeup_pending:
+            return
+        now = time.monotonic()
+        if now < self._next_wakeup:
+            return
+        self._next_wakeup = now + self.WAKEUP_INTERVAL
+        self._wakeup_pending = True
+        self.samples_ready.emit()
+    
+    def take_samples(self) -> List[SensorData]:
+        """
+        Drain all queued samples (consumer side, called from the GUI thread)
+        
+        Clears the wake-up flag before draining, so samples queued during or
+        after the drain trigger a new samples_ready signal.
+        
+        Returns:
+            Queued samples in arrival order
+        """
+        self._wakeup_pending = False
+        samples = self.samples
+        return [samples.popleft() for _ in range(len(samples))]
+    
+    def _process_line(self, parser: SerialParser, line: str) -> Optional[SensorData]:
+        """
+        Parse one data line into SensorData
+        
+        Args:
+            parser: Parser instance used by the read loop
+            line: Decoded, stripped, non-empty line
+            
+        Returns:
+            Parsed SensorData, or None if the line was skipped
+        """
+        logger.debug(f"{self.sensor_id}: Received: {line}")
+        
+        try:
+            # Parse and check for required tags in one pass
+            parsed_dict = parser.parse_line(line, self.REQUIRED_TAGS)
+            if parsed_dict is None:
+                logger.warning(
+                    f"{self.sensor_id}: Incomplete data (missing required tags), skipping"
+                )
+                return None
+            
+            # Convert to SensorData
+            # Wall-clock base + monotonic clock: samples stay evenly spaced
+            # even if the system clock is adjusted while streaming
+            sensor_data = SensorData.from_parsed_dict(
+                sensor_id=self.sensor_id,
+                parsed=parsed_dict,
+                timestamp_ns=self._clock_offset_ns + time.monotonic_ns()
+            )
+            
+            # Check for error values (but still emit the data)
+            # The is_valid flag is already set during construction
+            if not sensor_data.is_valid:
+                logger.debug(
+                    f"{self.sensor_id}: Data contains error codes (-99.9/-99.99)"
+                )
+            
+            return sensor_data
+            
+        except ParseError as e:
+            # Non-numeric values or parsing failure
+            logger.warning(f"{self.sensor_id}: Parse error: {e}. Line: {line}")
+        
+        except ValueError as e:
+            # Conversion error
+            logger.warning(f"{self.sensor_id}: Value conversion error: {e}. Line: {line}")
+        
+        except Exception as e:
+            # Unexpected parsing error
+            logger.error(
+                f"{self.sensor_id}: Unexpected error parsing data: {e}",
+                exc_info=True
+            )
+        
+        return None
@@ -0,0 +1,157 @@
+"""
+Serial helpers shared by the sensor maintenance scripts
+(enable_temperature_tag, quick_enable_t_tag, get_sensor_settings)
+"""
+
+import time
+from typing import Callable, List, Optional
+
+import serial
+
+
+# Prefixes of sensor data lines interleaved with command responses
+SKIP = (b'S ', b's ')
+
+
+def open_low_latency(port: str, baud: int = 115200) -> serial.Serial:
+    """
+    Open a sensor port (8N1) with low latency and empty buffers
+
+    Args:
+        port: COM port (e.g., "COM7")
+        baud: Baud rate (default: 115200)
+
+    Returns:
+        Open serial port (usable as a context manager)
+
+    Example:
+        >>> with open_low_latency("COM7") as ser:
+        ...     lines = send_and_read(ser, "{version}", 3.0)
+    """
+    ser = serial.Serial(
+        port=port,
+        baudrate=baud,
+        bytesize=serial.EIGHTBITS,
+        parity=serial.PARITY_NONE,
+        stopbits=serial.STOPBITS_ONE,
+        timeout=1.0,
+        write_timeout=2.0
+    )
+
+    # Cut the USB-serial latency timer (16 ms on FTDI) where supported.
+    # On Windows set it in Device Manager instead (FTDI: Port Settings >
+    # Advanced > Latency Timer = 1 ms, stored as the LatencyTimer value under
+    # HKLM\SYSTEM\CurrentControlSet\Enum\FTDIBUS\...\Device Parameters).
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, OSError, ValueError):
+        pass  # Not Linux, or the driver does not support it
+
+    ser.reset_input_buffer()
+    ser.reset_output_buffer()
+    return ser
+
+
+def send_command(ser: serial.Serial, command: str):
+    """
+    Send a command in a single write (the UART paces the bytes)
+
+    Args:
+        ser: Open serial port
+        command: Command string (e.g., "{save}")
+    """
+    ser.write(command.encode('ascii'))
+    ser.flush()
+
+
+def read_response(ser: serial.Serial, timeout: float,
+                  stop: Optional[Callable[[str, List[str]], bool]] = None,
+                  idle_timeout: Optional[float] = None,
+                  echo: bool = False) -> List[str]:
+    """
+    Collect response lines, skipping sensor data lines
+
+    Blocks in read_until() so each line is handled as soon as it arrives.
+
+    Args:
+        ser: Open serial port
+        timeout: Maximum total wait in seconds
+        stop: Optional; called with each new line and all lines so far,
+            returning True ends the read
+        idle_timeout: Optional; end the read when no line arrived for this
+            long after the first one
+        echo: Print each response line
+
+    Returns:
+        Decoded, stripped response lines in arrival order
+    """
+    lines = []
+    # Monotonic clock: immune to wall-clock (NTP) adjustments
+    now = time.monotonic()
+    deadline = now + timeout
+    last_data_time = now
+
+    while (remaining := deadline - now) > 0:
+        try:
+            # Blocks until a full line arrives (or the time is up)
+            ser.timeout = min(remaining, 0.5)
+            raw = ser.read_until(b'\n').strip()
+
+            # Skip sensor data lines before decoding them
+            if raw and not raw.startswith(SKIP):
+                line = raw.decode('ascii', errors='ignore')
+                lines.append(line)
+                last_data_time = time.monotonic()
+                if echo:
+                    print(f"  Response: {line}")
+                if stop is not None and stop(line, lines):
+                    break
+
+        except Exception as e:
+            print(f"  Error reading: {e}")
+
+        now = time.monotonic()
+        if idle_timeout is not None and lines and (now - last_data_time) > idle_timeout:
+            print(f"No more data for {idle_timeout:g} seconds, assuming complete ({len(lines)} lines)")
+            break
+
+    return lines
+
+
+def contains_any(*keywords: str) -> Callable[[str, List[str]], bool]:
+    """
+    Build a read_response() stop predicate matching keywords case-insensitively
+
+    Args:
+        keywords: Lowercase keywords that acknowledge a command
+
+    Returns:
+        Stop predicate
+
+    Example:
+        >>> send_and_read(ser, "{save}", 3.0, stop=contains_any('saved', 'ok'))
+    """
+    def stop(line: str, lines: List[str]) -> bool:
+        lowered = line.lower()
+        return any(keyword in lowered for keyword in keywords)
+    return stop
+
+
+def send_and_read(ser: serial.Serial, command: str, timeout: float,
+                  stop: Optional[Callable[[str, List[str]], bool]] = None,
+                  **kwargs) -> List[str]:
+    """
+    Send a command and collect its response lines
+
+    Args:
+        ser: Open serial port
+        command: Command string
+        timeout: Maximum wait for the response in seconds
+        stop: Optional stop predicate (see read_response)
+        **kwargs: Passed on to read_response (idle_timeout, echo)
+
+    Returns:
+        Response lines
+    """
+    send_command(ser, command)
+    return read_response(ser, timeout, stop, **kwargs)
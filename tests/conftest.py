@@ -0,0 +1,61 @@
+"""
+pytest共通設定
+
+収集対象外:
+- センサー保守スクリプト（enable_*, get_sensor_*, quick_*）とそのヘルパー
+  （COMポートを開き入力待ちになるため、python tests/xxx.py で直接実行する）
+
+カスタムマーカーの登録:
+- disk: FakeFSではなく実ディスクに読み書きするテスト
+- parallel_safe: 独立して並列実行できるテスト
+  （pytest-xdistがあれば pytest -n auto -m parallel_safe で並列実行可能）
+- hardware: 実機センサーが必要なテスト
+  （既定ではスキップ。pytest --hardware --port COM7 で実行）
+"""
+
+import pytest
+
+
+# Maintenance scripts that open COM ports and prompt for input
+collect_ignore_glob = ["enable_*.py", "get_sensor_*.py", "quick_*.py", "_serial_helpers.py"]
+
+
+def pytest_addoption(parser):
+    """実機テスト用のオプションを追加"""
+    parser.addoption(
+        "--hardware", action="store_true", default=False,
+        help="run tests marked 'hardware' (needs a connected sensor)"
+    )
+    parser.addoption(
+        "--port", default="COM7",
+        help="serial port used by hardware tests (default: COM7)"
+    )
+
+
+def pytest_configure(config):
+    """カスタムマーカーを登録"""
+    config.addinivalue_line(
+        "markers", "disk: test reads/writes the real filesystem instead of FakeFS"
+    )
+    config.addinivalue_line(
+        "markers", "parallel_safe: test is isolated and can run under pytest-xdist"
+    )
+    config.addinivalue_line(
+        "markers", "hardware: test needs a sensor on a serial port (run with --hardware)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """--hardware指定がなければ実機テストをスキップ"""
+    if config.getoption("--hardware"):
+        return
+    skip_hardware = pytest.mark.skip(reason="needs a sensor (run with --hardware)")
+    for item in items:
+        if "hardware" in item.keywords:
+            item.add_marker(skip_hardware)
+
+
+@pytest.fixture
+def port(request):
+    """実機テストで使うシリアルポート"""
+    return request.config.getoption("--port")
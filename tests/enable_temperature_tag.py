@@ -3,10 +3,14 @@ Enable T (temperature) tag on TriSonica sensor
 Sets Display.T.Tagged to true so temperature is output with "T" tag
 """
 
-import time
-import serial
+import argparse
 import sys
 
+try:
+    from tests._serial_helpers import contains_any, open_low_latency, send_and_read
+except ImportError:  # Run as a script: tests/ itself is on sys.path
+    from _serial_helpers import contains_any, open_low_latency, send_and_read
+
 
 def enable_temperature_tag(port: str, baud: int = 115200):
     """
@@ -23,111 +27,38 @@ def enable_temperature_tag(port: str, baud: int = 115200):
     try:
         # Open serial port
         print(f"Opening serial port...")
-        ser = serial.Serial(
-            port=port,
-            baudrate=baud,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=1.0,
-            write_timeout=2.0
-        )
-        
-        print(f"Serial port opened successfully\n")
-        
-        # Flush buffers
-        ser.reset_input_buffer()
-        ser.reset_output_buffer()
-        time.sleep(0.5)
-        
-        # Command to enable T tag
-        command = "{set Display.T.Tagged true}"
-        print(f"Sending command: {command}")
-        
-        # Send character by character
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
-        ser.flush()
-        time.sleep(0.2)
-        
-        # Read response
-        print("\nWaiting for response...")
-        start_time = time.time()
-        response_lines = []
-        
-        while (time.time() - start_time) < 3.0:
-            if ser.in_waiting > 0:
-                try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
-                    
-                    # Skip sensor data lines
-                    if line.startswith('S ') or line.startswith('s '):
-                        continue
-                    
-                    if line:
-                        response_lines.append(line)
-                        print(f"  Response: {line}")
-                        
-                        # Check for success
-                        if 'true' in line.lower() or 'ok' in line.lower():
-                            break
-                
-                except Exception as e:
-                    print(f"  Error reading: {e}")
+        with open_low_latency(port, baud) as ser:
+            print(f"Serial port opened successfully\n")
             
-            time.sleep(0.05)
-        
-        if response_lines:
-            print(f"\n✓ Command sent successfully")
-            print(f"  Response: {' '.join(response_lines)}")
-        else:
-            print(f"\n⚠ No response received (command may still have succeeded)")
-        
-        # Now save to non-volatile memory
-        print(f"\n{'=' * 60}")
-        print("Saving configuration to non-volatile memory...")
-        save_command = "{save}"
-        print(f"Sending command: {save_command}")
-        
-        ser.reset_input_buffer()
-        time.sleep(0.2)
-        
-        for char in save_command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
-        ser.flush()
-        time.sleep(0.5)
-        
-        # Read save response
-        response_lines = []
-        start_time = time.time()
-        
-        while (time.time() - start_time) < 3.0:
-            if ser.in_waiting > 0:
-                try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
-                    
-                    if line and not line.startswith('S ') and not line.startswith('s '):
-                        response_lines.append(line)
-                        print(f"  Response: {line}")
-                        
-                        if 'saved' in line.lower() or 'ok' in line.lower():
-                            break
-                
-                except Exception as e:
-                    print(f"  Error reading: {e}")
+            # Command to enable T tag
+            command = "{set Display.T.Tagged true}"
+            print(f"Sending command: {command}")
+            print("\nWaiting for response...")
+            response_lines = send_and_read(
+                ser, command, 3.0, stop=contains_any('true', 'ok'), echo=True
+            )
             
-            time.sleep(0.05)
-        
-        if response_lines:
-            print(f"\n✓ Configuration saved!")
-        else:
-            print(f"\n⚠ No save confirmation (configuration may still be saved)")
-        
-        ser.close()
+            if response_lines:
+                print(f"\n✓ Command sent successfully")
+                print(f"  Response: {' '.join(response_lines)}")
+            else:
+                print(f"\n⚠ No response received (command may still have succeeded)")
+            
+            # Now save to non-volatile memory
+            print(f"\n{'=' * 60}")
+            print("Saving configuration to non-volatile memory...")
+            save_command = "{save}"
+            print(f"Sending command: {save_command}")
+            
+            ser.reset_input_buffer()
+            response_lines = send_and_read(
+                ser, save_command, 3.0, stop=contains_any('saved', 'ok'), echo=True
+            )
+            
+            if response_lines:
+                print(f"\n✓ Configuration saved!")
+            else:
+                print(f"\n⚠ No save confirmation (configuration may still be saved)")
         
         print(f"\n{'=' * 60}")
         print(f"✓ Temperature tag enabled!")
@@ -144,10 +75,14 @@ def enable_temperature_tag(port: str, baud: int = 115200):
 
 
 if __name__ == "__main__":
-    test_port = "COM7"
-    
-    if len(sys.argv) > 1:
-        test_port = sys.argv[1]
+    arg_parser = argparse.ArgumentParser(
+        description="Enable the T (temperature) tag on a TriSonica sensor"
+    )
+    arg_parser.add_argument("port", nargs="?", default="COM7",
+                            help="Serial port (default: COM7)")
+    arg_parser.add_argument("--yes", action="store_true",
+                            help="Do not ask for confirmation")
+    args = arg_parser.parse_args()
     
     print("""
 ╔════════════════════════════════════════════════════════════╗
@@ -156,14 +91,15 @@ if __name__ == "__main__":
 ╚════════════════════════════════════════════════════════════╝
 """)
     
-    print(f"Usage: python {sys.argv[0]} [PORT]")
+    print(f"Usage: python {sys.argv[0]} [PORT] [--yes]")
     print(f"Example: python {sys.argv[0]} COM7\n")
     
     print("⚠ WARNING: This will modify sensor configuration!")
     print("  The change will be saved to non-volatile memory.\n")
     
-    response = input("Continue? (yes/no): ")
-    if response.lower() in ['yes', 'y']:
-        enable_temperature_tag(test_port)
+    # Only prompt on an interactive terminal; scripts must pass --yes
+    if args.yes or (sys.stdin.isatty()
+                    and input("Continue? (yes/no): ").lower() in ['yes', 'y']):
+        enable_temperature_tag(args.port)
     else:
         print("Cancelled.")
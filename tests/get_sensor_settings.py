@@ -3,11 +3,19 @@ Get complete settings from TriSonica sensor
 Specifically to see temperature (T) tag configuration
 """
 
-import time
 import json
-import serial
 import sys
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    from tests._serial_helpers import open_low_latency, send_and_read
+except ImportError:  # Run as a script: tests/ itself is on sys.path
+    from _serial_helpers import open_low_latency, send_and_read
+
 
 def get_complete_settings(port: str, baud: int = 115200):
     """
@@ -22,84 +30,43 @@ def get_complete_settings(port: str, baud: int = 115200):
     print(f"{'=' * 60}\n")
     
     try:
+        decoder = json.JSONDecoder()
+        parsed = None
+        
+        def json_complete(line: str, lines: list) -> bool:
+            """Stop once the lines so far hold a complete JSON object"""
+            nonlocal parsed
+            # An object can only complete on a line with '}'; braces inside
+            # JSON strings are handled by the decoder
+            if '}' not in line:
+                return False
+            text = '\n'.join(lines)
+            json_start = text.find('{')
+            if json_start < 0:
+                return False
+            try:
+                parsed, _ = decoder.raw_decode(text, json_start)
+            except ValueError:
+                return False  # Not complete yet
+            print(f"Complete JSON received ({len(lines)} lines)")
+            return True
+        
         # Open serial port
         print(f"Opening serial port...")
-        ser = serial.Serial(
-            port=port,
-            baudrate=baud,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=1.0,
-            write_timeout=2.0
-        )
-        
-        print(f"Serial port opened successfully\n")
-        
-        # Flush buffers
-        ser.reset_input_buffer()
-        ser.reset_output_buffer()
-        time.sleep(0.5)
-        
-        # Send {settings} command
-        command = "{settings}"
-        print(f"Sending command: {command}")
-        print("(This will take 10-15 seconds to receive all data...)\n")
-        
-        # Send character by character
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
-        ser.flush()
-        time.sleep(0.1)
-        
-        # Read response with very long timeout
-        response_lines = []
-        start_time = time.time()
-        timeout = 15.0  # 15 seconds
-        brace_count = 0
-        in_json = False
-        last_data_time = time.time()
-        
-        print("Reading response...")
-        
-        while (time.time() - start_time) < timeout:
-            if ser.in_waiting > 0:
-                try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
-                    
-                    # Skip sensor data lines
-                    if line.startswith('S ') or line.startswith('s '):
-                        continue
-                    
-                    if line:
-                        response_lines.append(line)
-                        last_data_time = time.time()
-                        
-                        # Track braces
-                        if '{' in line:
-                            in_json = True
-                            brace_count += line.count('{')
-                        if '}' in line:
-                            brace_count -= line.count('}')
-                        
-                        # Complete JSON received
-                        if in_json and brace_count <= 0:
-                            print(f"Complete JSON received ({len(response_lines)} lines)")
-                            break
-                
-                except Exception as e:
-                    print(f"Error reading line: {e}")
+        with open_low_latency(port, baud) as ser:
+            print(f"Serial port opened successfully\n")
             
-            # If no data for 3 seconds after receiving some data, assume complete
-            if response_lines and (time.time() - last_data_time) > 3.0:
-                print(f"No more data for 3 seconds, assuming complete ({len(response_lines)} lines)")
-                break
+            # Send {settings} command
+            command = "{settings}"
+            print(f"Sending command: {command}")
+            print("(This will take 10-15 seconds to receive all data...)\n")
             
-            time.sleep(0.05)
-        
-        ser.close()
+            # Read response with very long timeout (15 seconds); if no data
+            # for 3 seconds after receiving some data, assume complete
+            print("Reading response...")
+            response_lines = send_and_read(
+                ser, command, 15.0, stop=json_complete, idle_timeout=3.0
+            )
         
         if not response_lines:
             print("✗ No response received")
@@ -117,17 +84,22 @@ def get_complete_settings(port: str, baud: int = 115200):
         
         # Try to parse as JSON
         try:
-            # Try to extract JSON
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
+            if parsed is None:
+                # Incomplete capture: try the outermost braces
+                json_start = response_text.find('{')
+                json_end = response_text.rfind('}') + 1
+                if json_start >= 0 and json_end > json_start:
+                    json_text = response_text[json_start:json_end]
+                    parsed = orjson.loads(json_text) if orjson else json.loads(json_text)
             
-            if json_start >= 0 and json_end > json_start:
-                json_text = response_text[json_start:json_end]
-                parsed = json.loads(json_text)
-                
+            if parsed is not None:
                 # Pretty print to file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(parsed, f, indent=2)
+                if orjson:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(parsed, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(parsed, f, indent=2)
                 
                 print(f"  Formatted JSON saved to: {filename}")
                 
@@ -2,8 +2,10 @@
 Quick script to enable T tag on COM7 without confirmation prompt
 """
 
-import time
-import serial
+try:
+    from tests._serial_helpers import contains_any, open_low_latency, send_and_read
+except ImportError:  # Run as a script: tests/ itself is on sys.path
+    from _serial_helpers import contains_any, open_low_latency, send_and_read
 
 
 def enable_t_tag_com7():
@@ -13,49 +15,18 @@ def enable_t_tag_com7():
     print(f"Enabling T tag on {port}...")
     
     try:
-        ser = serial.Serial(
-            port=port,
-            baudrate=baud,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=1.0,
-            write_timeout=2.0
-        )
-        
-        print("  Port opened")
-        
-        # Clear buffers
-        ser.reset_input_buffer()
-        ser.reset_output_buffer()
-        time.sleep(0.5)
-        
-        # Send command to enable T tag
-        command = "{set Display.T.Tagged true}"
-        print(f"  Sending: {command}")
-        
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
-        ser.flush()
-        time.sleep(0.5)
-        
-        # Clear response
-        ser.reset_input_buffer()
-        
-        # Save configuration
-        command = "{save}"
-        print(f"  Sending: {command}")
-        
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
-        ser.flush()
-        time.sleep(0.5)
-        
-        ser.close()
+        with open_low_latency(port, baud) as ser:
+            print("  Port opened")
+            
+            # Send command to enable T tag, then wait for the acknowledgement
+            command = "{set Display.T.Tagged true}"
+            print(f"  Sending: {command}")
+            send_and_read(ser, command, 1.0, stop=contains_any('true', 'ok'))
+            
+            # Save configuration
+            command = "{save}"
+            print(f"  Sending: {command}")
+            send_and_read(ser, command, 1.0, stop=contains_any('saved', 'ok'))
         
         print("  ✓ T tag enabled and saved!")
         print("\nNow test data reception:")
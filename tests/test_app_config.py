@@ -6,12 +6,18 @@ AppConfigとSensorConfigクラスの機能を検証:
 - load_or_default()のJSON破損テスト
 - save()とラウンドトリップ(保存→読み込み)テスト
 - デフォルト値の検証テスト
+
+保存・読み込みテストは既定でメモリ上のFakeFSを使う。
+実ディスクへの書き込みを確認するテストは@pytest.mark.diskで指定する。
 """
 
 import pytest
+import copy
+import io
 import json
 import tempfile
 from pathlib import Path
+from src.models import app_config
 from src.models.app_config import AppConfig, SensorConfig
 
 
@@ -42,12 +48,85 @@ class TestSensorConfig:
         assert config.custom_init_commands == ["test1", "test2"]
 
 
+class FakeFS:
+    """メモリ上のファイルシステム（ファイル名 -> テキスト）"""
+
+    def __init__(self):
+        self.files = {}
+
+    def open(self, path, mode='r', encoding=None):
+        """組み込みopen()の代替（テキストモードのみ）"""
+        name = str(path)
+        if 'w' in mode:
+            return _FakeFile(self.files, name)
+        if name not in self.files:
+            raise FileNotFoundError(name)
+        return io.StringIO(self.files[name])
+
+
+class _FakeFile(io.StringIO):
+    """close時に内容をFakeFSへ書き戻すファイル"""
+
+    def __init__(self, files, name):
+        super().__init__()
+        self._files = files
+        self._name = name
+
+    def close(self):
+        if not self.closed:
+            self._files[self._name] = self.getvalue()
+        super().close()
+
+
+class FakePath:
+    """FakeFS上のファイルを指すPath互換オブジェクト"""
+
+    def __init__(self, fs, name):
+        self.fs = fs
+        self.name = str(name)
+
+    def exists(self):
+        return self.name in self.fs.files
+
+    def read_text(self, encoding=None):
+        with self.fs.open(self.name) as f:
+            return f.read()
+
+    def write_text(self, text, encoding=None):
+        with self.fs.open(self.name, 'w') as f:
+            f.write(text)
+
+    def __str__(self):
+        return self.name
+
+
+@pytest.fixture(autouse=True)
+def config_path(request, tmp_path, monkeypatch):
+    """設定ファイルの保存先を環境変数で指定（diskマーク以外はFakeFS上）"""
+    monkeypatch.setenv(AppConfig.CONFIG_PATH_ENV, str(tmp_path / "cfg.json"))
+    if request.node.get_closest_marker('disk'):
+        return tmp_path / "cfg.json"
+    
+    # app_configモジュールのPath/openをFakeFSに差し替える
+    fs = FakeFS()
+    monkeypatch.setattr(app_config, 'Path', lambda name: FakePath(fs, name))
+    monkeypatch.setattr(app_config, 'open', fs.open, raising=False)
+    return FakePath(fs, tmp_path / "cfg.json")
+
+
+@pytest.fixture(scope="session")
+def default_config_template():
+    """デフォルトAppConfigをセッションで1回だけ生成（変更するテストはコピーを使う）"""
+    return AppConfig()
+
+
+@pytest.mark.parallel_safe
 class TestAppConfig:
-    """AppConfigクラスのテストスイート"""
+    """AppConfigクラスのテストスイート（設定ファイルはテストごとに分離）"""
 
-    def test_app_config_default_values(self):
+    def test_app_config_default_values(self, default_config_template):
         """AppConfigのデフォルト値検証"""
-        config = AppConfig()
+        config = default_config_template
         
         assert len(config.sensors) == 4
         assert 'Sensor1' in config.sensors
@@ -57,11 +136,10 @@ class TestAppConfig:
         assert config.output_rate == 5
         assert config.window_geometry == [100, 100, 1280, 800]
 
-    def test_load_or_default_file_not_exists(self, monkeypatch, tmp_path):
+    def test_load_or_default_file_not_exists(self, config_path):
         """ファイル欠損時はデフォルト値を返す"""
-        # _get_config_path()をモックして存在しないパスを返す
-        non_existent_path = tmp_path / "nonexistent_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', lambda: non_existent_path)
+        # 環境変数で指すファイルはまだ存在しない
+        assert not config_path.exists()
         
         config = AppConfig.load_or_default()
         
@@ -70,13 +148,10 @@ class TestAppConfig:
         assert len(config.sensors) == 4
         assert config.window_geometry == [100, 100, 1280, 800]
 
-    def test_load_or_default_corrupted_json(self, monkeypatch, tmp_path):
+    def test_load_or_default_corrupted_json(self, config_path):
         """JSON破損時はデフォルト値を返す"""
         # 破損したJSONファイルを作成
-        corrupted_file = tmp_path / "corrupted_config.json"
-        corrupted_file.write_text("{ invalid json content }", encoding='utf-8')
-        
-        monkeypatch.setattr(AppConfig, '_get_config_path', lambda: corrupted_file)
+        config_path.write_text("{ invalid json content }", encoding='utf-8')
         
         config = AppConfig.load_or_default()
         
@@ -84,13 +159,10 @@ class TestAppConfig:
         assert config.output_rate == 5
         assert len(config.sensors) == 4
 
-    def test_save_and_load_roundtrip(self, monkeypatch, tmp_path):
+    def test_save_and_load_roundtrip(self, default_config_template, config_path):
         """保存→読み込みのラウンドトリップテスト"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
         # カスタム設定を作成
-        original_config = AppConfig()
+        original_config = copy.deepcopy(default_config_template)
         original_config.output_rate = 10
         original_config.window_geometry = [200, 200, 1920, 1080]
         original_config.sensors['Sensor1'].port = "COM3"
@@ -99,7 +171,7 @@ class TestAppConfig:
         # 保存
         success = original_config.save()
         assert success is True
-        assert config_file.exists()
+        assert config_path.exists()
         
         # 読み込み
         loaded_config = AppConfig.load_or_default()
@@ -110,19 +182,17 @@ class TestAppConfig:
         assert loaded_config.sensors['Sensor1'].port == "COM3"
         assert loaded_config.sensors['Sensor1'].baud == 9600
 
-    def test_save_creates_valid_json(self, monkeypatch, tmp_path):
+    @pytest.mark.disk
+    def test_save_creates_valid_json(self, default_config_template, config_path):
         """save()が有効なJSON形式で保存すること"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         config.output_rate = 8
         config.save()
         
         # ファイルが存在し、有効なJSONであること
-        assert config_file.exists()
+        assert config_path.exists()
         
-        with open(config_file, 'r', encoding='utf-8') as f:
+        with open(config_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         assert 'sensors' in data
@@ -130,21 +200,22 @@ class TestAppConfig:
         assert 'window_geometry' in data
         assert data['output_rate'] == 8
 
-    def test_save_write_failure(self, monkeypatch):
+    @pytest.mark.disk
+    def test_save_write_failure(self, default_config_template, monkeypatch, tmp_path):
         """書き込み失敗時にFalseを返し、例外を発生させないこと"""
-        # 書き込み不可能なパスを設定（Windowsでは無効なパス文字を使用）
-        invalid_path = Path("Z:\\nonexistent\\invalid<>path\\config.json")
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: invalid_path))
+        # 存在しないディレクトリ配下のパス（どのOSでもopen()がOSErrorになる）
+        invalid_path = tmp_path / "nonexistent" / "config.json"
+        monkeypatch.setenv(AppConfig.CONFIG_PATH_ENV, str(invalid_path))
         
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         success = config.save()
         
         # Falseを返すが例外は発生しない
         assert success is False
 
-    def test_get_sensor_config(self):
+    def test_get_sensor_config(self, default_config_template):
         """get_sensor_config()でセンサー設定を取得"""
-        config = AppConfig()
+        config = default_config_template
         
         sensor1_config = config.get_sensor_config('Sensor1')
         assert sensor1_config is not None
@@ -154,9 +225,9 @@ class TestAppConfig:
         non_existent = config.get_sensor_config('NonExistent')
         assert non_existent is None
 
-    def test_update_sensor_config(self):
+    def test_update_sensor_config(self, default_config_template):
         """update_sensor_config()でセンサー設定を更新"""
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         
         new_sensor_config = SensorConfig(port="COM5", baud=19200)
         config.update_sensor_config('Sensor2', new_sensor_config)
@@ -165,13 +236,10 @@ class TestAppConfig:
         assert updated.port == "COM5"
         assert updated.baud == 19200
 
-    def test_load_with_custom_init_commands(self, monkeypatch, tmp_path):
+    def test_load_with_custom_init_commands(self, default_config_template):
         """カスタム初期化コマンドの保存と読み込み"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
         # カスタムコマンドを設定
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         config.sensors['Sensor1'].custom_init_commands = ["cmd1", "cmd2", "cmd3"]
         config.save()
         
@@ -179,17 +247,14 @@ class TestAppConfig:
         loaded = AppConfig.load_or_default()
         assert loaded.sensors['Sensor1'].custom_init_commands == ["cmd1", "cmd2", "cmd3"]
 
-    def test_load_with_missing_sensors_uses_defaults(self, monkeypatch, tmp_path):
+    def test_load_with_missing_sensors_uses_defaults(self, config_path):
         """sensors欠損時はデフォルト4センサーを使用"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', lambda: config_file)
-        
         # sensorsキーを含まないJSONを作成
         data = {
             'output_rate': 7,
             'window_geometry': [0, 0, 800, 600]
         }
-        config_file.write_text(json.dumps(data), encoding='utf-8')
+        config_path.write_text(json.dumps(data), encoding='utf-8')
         
         loaded = AppConfig.load_or_default()
         
@@ -198,11 +263,8 @@ class TestAppConfig:
         assert 'Sensor1' in loaded.sensors
         assert loaded.output_rate == 7  # 他の値は読み込まれる
 
-    def test_load_with_partial_sensor_data(self, monkeypatch, tmp_path):
+    def test_load_with_partial_sensor_data(self, config_path):
         """一部のセンサー設定項目が欠損していても動作すること"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', lambda: config_file)
-        
         # baudとcustom_init_commandsが欠損
         data = {
             'sensors': {
@@ -211,7 +273,7 @@ class TestAppConfig:
             'output_rate': 5,
             'window_geometry': [100, 100, 1280, 800]
         }
-        config_file.write_text(json.dumps(data), encoding='utf-8')
+        config_path.write_text(json.dumps(data), encoding='utf-8')
         
         loaded = AppConfig.load_or_default()
         
@@ -220,13 +282,10 @@ class TestAppConfig:
         assert loaded.sensors['Sensor1'].baud == 115200  # デフォルト
         assert len(loaded.sensors['Sensor1'].custom_init_commands) > 0  # デフォルトコマンド
 
-    def test_multiple_save_and_load_cycles(self, monkeypatch, tmp_path):
+    def test_multiple_save_and_load_cycles(self, default_config_template):
         """複数回の保存→読み込みサイクルが正常に動作すること"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
         # サイクル1
-        config1 = AppConfig()
+        config1 = copy.deepcopy(default_config_template)
         config1.output_rate = 3
         config1.save()
         
@@ -240,27 +299,22 @@ class TestAppConfig:
         loaded2 = AppConfig.load_or_default()
         assert loaded2.output_rate == 7
 
-    def test_config_file_encoding_utf8(self, monkeypatch, tmp_path):
+    @pytest.mark.disk
+    def test_config_file_encoding_utf8(self, default_config_template, config_path):
         """UTF-8エンコーディングで保存・読み込み可能"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         config.save()
         
         # UTF-8で読み込み可能
-        with open(config_file, 'r', encoding='utf-8') as f:
+        with open(config_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         assert isinstance(content, str)
         json.loads(content)  # パース可能
 
-    def test_window_geometry_persistence(self, monkeypatch, tmp_path):
+    def test_window_geometry_persistence(self, default_config_template):
         """ウィンドウジオメトリの永続化"""
-        config_file = tmp_path / "test_config.json"
-        monkeypatch.setattr(AppConfig, '_get_config_path', staticmethod(lambda: config_file))
-        
-        config = AppConfig()
+        config = copy.deepcopy(default_config_template)
         config.window_geometry = [50, 50, 1600, 900]
         config.save()
         
@@ -3,7 +3,9 @@ CSVWriter単体テスト
 
 CSVWriterクラスの機能を検証:
 - 単一センサーCSVフォーマットとヘッダーテスト
+- 列配列(SoA)によるチャンク書き込みテスト
 - マルチセンサーCSV同期ロジックテスト
+- センサー別CSVの並列書き込みテスト
 - タイムスタンプフォーマット(ISO 8601)テスト
 - 欠損データ(N/A値)の処理テスト
 - _validate_filepath()のパストラバーサル攻撃防止テスト
@@ -122,6 +124,67 @@ class TestCSVWriter:
         # UTF-8 BOMは 0xEF, 0xBB, 0xBF
         assert first_bytes == b'\xef\xbb\xbf'
 
+    def test_write_single_sensor_chunked_matches_to_csv_row(self, tmp_path, monkeypatch):
+        """チャンク分割書き込みの各行がto_csv_row()と一致する"""
+        monkeypatch.setattr(CSVWriter, 'CHUNK_ROWS', 2)
+        output_file = tmp_path / "chunked.csv"
+        
+        base_time = datetime(2024, 1, 15, 13, 45, 30, 123456)
+        sensor_data_list = [
+            SensorData.from_parsed_dict(
+                "Sensor1",
+                {'S': 5.23 + i, 'D': 270.15, 'U': -99.9, 'V': -0.001, 'W': 0.125,
+                 'T': 23.45, 'PI': 45.2, 'RO': 1013.2},
+                timestamp=base_time + timedelta(milliseconds=40 * i)
+            )
+            for i in range(5)
+        ]
+        
+        CSVWriter.write_single_sensor(str(output_file), sensor_data_list)
+        
+        with open(output_file, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.reader(f))
+        
+        assert len(rows) == 6  # ヘッダー + データ5行（3チャンク）
+        assert rows[1:] == [d.to_csv_row() for d in sensor_data_list]
+
+    def test_large_export_spans_chunks(self, tmp_path):
+        """CHUNK_ROWSを超える大量データも同一プロセス内で全行を書き出す"""
+        output_file = tmp_path / "large.csv"
+        
+        base_time = datetime(2024, 1, 15, 13, 45, 30, 123456)
+        sensor_data_list = [
+            SensorData.from_parsed_dict(
+                "Sensor1",
+                {'S': 0.5 * i, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45},
+                timestamp=base_time + timedelta(milliseconds=40 * i)
+            )
+            for i in range(CSVWriter.CHUNK_ROWS + 3)
+        ]
+        
+        success, _ = CSVWriter.write_single_sensor(str(output_file), sensor_data_list)
+        
+        with open(output_file, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.reader(f))
+        
+        assert success
+        assert len(rows) == len(sensor_data_list) + 1
+        assert rows[-1] == sensor_data_list[-1].to_csv_row()
+
+    def test_sensor_data_to_columns(self):
+        """SensorDataリストを列配列(SoA)に変換"""
+        timestamp = datetime(2024, 1, 15, 13, 45, 30, 123456)
+        parsed = {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45}
+        sensor_data = SensorData.from_parsed_dict("Sensor1", parsed, timestamp=timestamp)
+        
+        columns = CSVWriter.sensor_data_to_columns([sensor_data, sensor_data])
+        
+        assert len(columns['timestamp']) == 2
+        assert str(columns['timestamp'][0]) == "2024-01-15T13:45:30.123456"
+        assert columns['sensor_id'].tolist() == ["Sensor1", "Sensor1"]
+        assert columns['U'].tolist() == [2.45, 2.45]
+        assert columns['PI'].tolist() == [0.0, 0.0]
+
     def test_synchronize_timestamps_exact_match(self):
         """タイムスタンプが完全一致する場合の同期"""
         timestamp = datetime.now()
@@ -212,6 +275,33 @@ class TestCSVWriter:
         assert row2.get('Sensor1') is None
         assert row2['Sensor2'] is not None
 
+    def test_synchronize_timestamps_nearest_unsorted(self):
+        """未ソートのデータでも各タイムスタンプに最も近いデータを選択"""
+        base_time = datetime(2024, 1, 15, 13, 45, 30)
+        parsed = {'S': 5.0, 'D': 270.0, 'U': 2.0, 'V': -1.0, 'W': 0.1, 'T': 23.0}
+
+        sensor1_data = SensorData.from_parsed_dict("Sensor1", parsed, timestamp=base_time)
+        sensor2_data = [
+            SensorData.from_parsed_dict(
+                "Sensor2", parsed, timestamp=base_time + timedelta(milliseconds=ms)
+            )
+            for ms in (450, -400, 100)
+        ]
+
+        synchronized = CSVWriter._synchronize_timestamps({
+            'Sensor1': [sensor1_data],
+            'Sensor2': sensor2_data
+        })
+
+        # 全タイムスタンプ（4つ）が時刻順に並ぶ
+        assert [r['timestamp'] for r in synchronized] == sorted(
+            [base_time] + [d.timestamp for d in sensor2_data]
+        )
+
+        # base_timeの行: 最も近い+100msのデータ
+        row = next(r for r in synchronized if r['timestamp'] == base_time)
+        assert row['Sensor2'] is sensor2_data[2]
+
     def test_write_multi_sensor_success(self, tmp_path):
         """マルチセンサーCSVの正常な書き込み"""
         output_file = tmp_path / "multi_sensor.csv"
@@ -319,6 +409,59 @@ class TestCSVWriter:
         assert success is False
         assert "No data" in message
 
+    def test_write_multi_sensor_low_memory_limit(self, tmp_path, monkeypatch):
+        """メモリ上限超過時はバッチを縮小しても同一のファイルを生成する"""
+        monkeypatch.setattr(CSVWriter, 'CHUNK_ROWS', 4)
+        monkeypatch.setattr(CSVWriter, 'MIN_CHUNK_ROWS', 1)
+        monkeypatch.setattr(CSVWriter, 'MEMORY_CHECK_CHUNKS', 1)
+        base_time = datetime(2024, 1, 15, 13, 45, 30)
+        parsed = {'S': 5.0, 'D': 270.0, 'U': 2.0, 'V': -1.0, 'W': 0.1, 'T': 23.0}
+        data_dict = {
+            sensor_id: [
+                SensorData.from_parsed_dict(
+                    sensor_id, parsed, timestamp=base_time + timedelta(milliseconds=100 * i + offset)
+                )
+                for i in range(20)
+            ]
+            for sensor_id, offset in (('Sensor1', 0), ('Sensor2', 30))
+        }
+        normal_file = tmp_path / "normal.csv"
+        limited_file = tmp_path / "limited.csv"
+        
+        CSVWriter.write_multi_sensor(str(normal_file), data_dict)
+        CSVWriter.write_multi_sensor(str(limited_file), data_dict, max_memory_mb=0)
+        
+        assert CSVWriter._adapt_chunk_rows(4, max_memory_mb=0) == 2
+        assert CSVWriter._adapt_chunk_rows(2, max_memory_mb=float('inf')) == 4
+        assert limited_file.read_bytes() == normal_file.read_bytes()
+
+    def test_adapt_chunk_rows_without_psutil(self, monkeypatch):
+        """psutilが無い環境ではバッチサイズを変更しない"""
+        monkeypatch.setattr("src.utils.csv_writer.psutil", None)
+        
+        assert CSVWriter._adapt_chunk_rows(4, max_memory_mb=0) == 4
+
+    def test_write_per_sensor(self, tmp_path):
+        """センサーごとに個別のCSVファイルを並列書き込み"""
+        parsed = {'S': 5.0, 'D': 270.0, 'U': 2.0, 'V': -1.0, 'W': 0.1, 'T': 23.0}
+        data_dict = {
+            'Sensor1': [SensorData.from_parsed_dict("Sensor1", parsed)],
+            'Sensor2': [SensorData.from_parsed_dict("Sensor2", parsed)] * 2
+        }
+        
+        results = CSVWriter.write_per_sensor(str(tmp_path / "run_{sensor_id}.csv"), data_dict)
+        
+        assert results['Sensor1'][0] is True
+        assert results['Sensor2'][0] is True
+        with open(tmp_path / "run_Sensor2.csv", 'r', encoding='utf-8-sig') as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 3  # ヘッダー + データ2行
+        assert rows[1][1] == "Sensor2"
+        
+        # {sensor_id}がないパターンは全センサー失敗
+        results = CSVWriter.write_per_sensor(str(tmp_path / "run.csv"), data_dict)
+        assert not any(success for success, _ in results.values())
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -3,11 +3,23 @@ Test script for verifying sensor data reception
 Tests if sensor is sending valid data that can be parsed
 """
 
+import re
 import time
 import serial
 import sys
 from typing import Optional
 
+import pytest
+
+# Needs a sensor on a serial port: skipped unless pytest --hardware
+pytestmark = pytest.mark.hardware
+
+# Prefixes of sensor data lines
+DATA_PREFIXES = (b'S ', b's ')
+
+# Tag followed by its numeric value (e.g., "S  09.89", "DV  013", "U -04.52")
+_TAG_RE = re.compile(r'\b([A-Za-z][A-Za-z0-9]*)\s+([-+]?\d+(?:\.\d+)?)(?!\S)')
+
 
 def test_data_reception(port: str, baud: int = 115200, duration: int = 10):
     """
@@ -47,48 +59,62 @@ def test_data_reception(port: str, baud: int = 115200, duration: int = 10):
         time.sleep(1.0)
         
         # Read data for specified duration
-        start_time = time.time()
+        deadline = time.monotonic() + duration
         line_count = 0
         valid_data_lines = 0
         error_count = 0
         sample_lines = []
+        shown_lines = []  # Output for the first lines, printed after reading
+        buffer = bytearray()
+        
+        # Short timeout so the loop notices the end of the test promptly
+        ser.timeout = 0.1
         
         print(f"\n{'=' * 60}")
         print(f"Reading data (showing first 10 lines)...")
         print(f"{'=' * 60}\n")
         
-        while (time.time() - start_time) < duration:
-            if ser.in_waiting > 0:
-                try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
+        while time.monotonic() < deadline:
+            try:
+                # Take everything already received in one read (blocks for
+                # at least one byte), then split complete lines off the buffer
+                buffer += ser.read(max(ser.in_waiting, 1))
+            except Exception as e:
+                error_count += 1
+                if error_count <= 5:
+                    print(f"  ERROR reading data: {e}")
+                continue
+            
+            while (newline := buffer.find(b'\n')) >= 0:
+                raw = bytes(buffer[:newline]).strip()
+                del buffer[:newline + 1]
+                
+                if raw:
+                    line_count += 1
+                    show = len(sample_lines) < 10
                     
-                    if line:
-                        line_count += 1
+                    # Classify on bytes; decode only lines that are shown
+                    # (collected here, printed in one write after the loop)
+                    # TriSonica data typically starts with "S " and contains tags
+                    if raw.startswith(DATA_PREFIXES):
+                        valid_data_lines += 1
                         
-                        # Check if this looks like valid sensor data
-                        # TriSonica data typically starts with "S " and contains tags
-                        if line.startswith('S ') or line.startswith('s '):
-                            valid_data_lines += 1
-                            
-                            # Store first few samples
-                            if len(sample_lines) < 10:
-                                sample_lines.append(line)
-                                print(f"  Line {line_count}: {line}")
-                        elif line.startswith('{'):
+                        # Store first few samples
+                        if show:
+                            line = raw.decode('ascii', errors='ignore')
+                            sample_lines.append(line)
+                            shown_lines.append(f"  Line {line_count}: {line}")
+                    elif show:
+                        line = raw.decode('ascii', errors='ignore')
+                        if raw.startswith(b'{'):
                             # JSON response - might be leftover from initialization
-                            if len(sample_lines) < 10:
-                                print(f"  Line {line_count} (JSON): {line[:60]}...")
+                            shown_lines.append(f"  Line {line_count} (JSON): {line[:60]}...")
                         else:
                             # Unexpected format
-                            if len(sample_lines) < 10:
-                                print(f"  Line {line_count} (Unknown): {line}")
-                
-                except Exception as e:
-                    error_count += 1
-                    if error_count <= 5:
-                        print(f"  ERROR reading line: {e}")
-            
-            time.sleep(0.01)
+                            shown_lines.append(f"  Line {line_count} (Unknown): {line}")
+        
+        if shown_lines:
+            sys.stdout.write('\n'.join(shown_lines) + '\n')
         
         # Close serial port
         ser.close()
@@ -150,39 +176,27 @@ def analyze_data_line(line: str):
         if tokens[0].upper() != 'S':
             print(f"WARNING: Line does not start with 'S' (got '{tokens[0]}')")
         
-        # Parse tag-value pairs
-        print("Detected tags and values:")
-        i = 0
+        # Parse tag-value pairs in one regex pass; text between matches is
+        # reported afterwards (values without a tag, unknown tokens)
         tags_found = []
+        untagged = []
+        last_end = 0
         
-        while i < len(tokens):
-            token = tokens[i]
-            
-            # Check if this is a tag (alphabetic)
-            if token.isalpha() or token.replace('2', '').isalpha():
-                tag = token
-                
-                # Next token should be value
-                if i + 1 < len(tokens):
-                    try:
-                        value = float(tokens[i + 1])
-                        tags_found.append((tag, value))
-                        print(f"  {tag}: {value}")
-                        i += 2
-                    except ValueError:
-                        print(f"  {tag}: ERROR - invalid value '{tokens[i + 1]}'")
-                        i += 1
-                else:
-                    print(f"  {tag}: ERROR - no value")
-                    i += 1
-            else:
-                # Try to parse as float (might be value without tag)
-                try:
-                    value = float(token)
-                    print(f"  (No tag): {value}")
-                except ValueError:
-                    print(f"  UNKNOWN: '{token}'")
-                i += 1
+        for match in _TAG_RE.finditer(line):
+            untagged.extend(line[last_end:match.start()].split())
+            tags_found.append((match.group(1), float(match.group(2))))
+            last_end = match.end()
+        untagged.extend(line[last_end:].split())
+        
+        print("Detected tags and values:")
+        for tag, value in tags_found:
+            print(f"  {tag}: {value}")
+        
+        for token in untagged:
+            try:
+                print(f"  (No tag): {float(token)}")
+            except ValueError:
+                print(f"  UNKNOWN: '{token}'")
         
         print(f"\nTotal tags found: {len(tags_found)}")
         
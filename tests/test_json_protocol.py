@@ -9,8 +9,20 @@ import serial
 import sys
 from typing import Optional, Dict, Any
 
+import pytest
 
-def send_json_command(ser: serial.Serial, command: str, timeout: float = 3.0) -> Optional[Dict[str, Any]]:
+# Needs a sensor on a serial port: skipped unless pytest --hardware
+pytestmark = pytest.mark.hardware
+
+# Prefixes of sensor data lines
+DATA_PREFIXES = (b'S ', b's ')
+
+# Shared decoder: raw_decode() parses a JSON object embedded in other text
+_JSON_DECODER = json.JSONDecoder()
+
+
+def send_json_command(ser: serial.Serial, command: str, timeout: float = 3.0,
+                      slow_chars: bool = False) -> Optional[Dict[str, Any]]:
     """
     Send a JSON command to the sensor and parse response
     
@@ -18,6 +30,8 @@ def send_json_command(ser: serial.Serial, command: str, timeout: float = 3.0) ->
         ser: Serial port object
         command: JSON command string (e.g., "{json}", "{settings}")
         timeout: Response timeout in seconds
+        slow_chars: Send one character per 10 ms (for firmware that drops
+            characters arriving back to back); default is a single write
     
     Returns:
         dict: Parsed JSON response, or dict with 'error' key if failed
@@ -29,39 +43,42 @@ def send_json_command(ser: serial.Serial, command: str, timeout: float = 3.0) ->
         ser.reset_input_buffer()
         time.sleep(0.1)
         
-        # Send command character by character
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)  # 10ms delay between characters
+        if slow_chars:
+            # Send command character by character
+            for char in command:
+                ser.write(char.encode('ascii'))
+                time.sleep(0.01)  # 10ms delay between characters
+        else:
+            # Send the whole command in one write (the UART paces the bytes)
+            ser.write(command.encode('ascii'))
         
-        ser.flush()
-        time.sleep(0.1)  # Additional delay after flush
+        ser.flush()  # Blocks until the command has been transmitted
         
         # Read response
         response_lines = []
-        start_time = time.time()
+        # Monotonic deadline: immune to wall-clock (NTP) adjustments
+        deadline = time.monotonic() + timeout
         brace_count = 0
         in_json = False
         
-        while (time.time() - start_time) < timeout:
+        while time.monotonic() < deadline:
             if ser.in_waiting > 0:
                 try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
+                    raw = ser.readline().strip()
                     
-                    # Skip sensor data lines (start with "S ")
-                    if line.startswith('S ') or line.startswith('s '):
+                    # Skip sensor data lines (start with "S ") before decoding
+                    if raw.startswith(DATA_PREFIXES):
                         continue
                     
-                    if line:
+                    if raw:
+                        line = raw.decode('ascii', errors='ignore')
                         print(f"  Response line: {line}")
                         response_lines.append(line)
                         
                         # Track braces to detect complete JSON
-                        if '{' in line:
-                            in_json = True
-                            brace_count += line.count('{')
-                        if '}' in line:
-                            brace_count -= line.count('}')
+                        opened = raw.count(b'{')
+                        in_json = in_json or opened > 0
+                        brace_count += opened - raw.count(b'}')
                         
                         # Complete JSON received
                         if in_json and brace_count <= 0:
@@ -85,27 +102,19 @@ def send_json_command(ser: serial.Serial, command: str, timeout: float = 3.0) ->
             print(f"  ERROR: Command rejected")
             return {'error': 'Invalid command'}
         
-        # Try to parse as JSON
-        try:
-            # Handle nested JSON (outer braces may be wrapper)
-            if response_text.startswith('{') and response_text.endswith('}'):
-                try:
-                    parsed = json.loads(response_text)
-                    return parsed
-                except json.JSONDecodeError:
-                    # Try finding inner JSON
-                    inner_start = response_text.find('{', 1)
-                    inner_end = response_text.rfind('}', 0, -1)
-                    if inner_start > 0 and inner_end > inner_start:
-                        inner_json = response_text[inner_start:inner_end + 1]
-                        return json.loads(inner_json)
-            
-            # Return as raw text if not parseable as JSON
-            return {'raw': response_text}
-            
-        except json.JSONDecodeError as e:
-            print(f"  Could not parse as JSON: {e}")
-            return {'raw': response_text}
+        # Parse the first JSON object in the response; skip braces that do
+        # not start valid JSON (e.g., the echoed "{json}" command)
+        json_start = response_text.find('{')
+        while json_start >= 0:
+            try:
+                parsed, _ = _JSON_DECODER.raw_decode(response_text, json_start)
+                return parsed
+            except json.JSONDecodeError:
+                json_start = response_text.find('{', json_start + 1)
+        
+        # Return as raw text if not parseable as JSON
+        print("  Could not parse as JSON")
+        return {'raw': response_text}
     
     except Exception as e:
         print(f"  EXCEPTION: {e}")
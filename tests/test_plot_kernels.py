@@ -0,0 +1,122 @@
+"""
+plot_kernels単体テスト
+
+描画用配列カーネルの機能を検証:
+- peak_downsample()のピーク保持ダウンサンプリング
+- NaN（エラー値）の扱い
+- fit_ylim()のY軸範囲更新（ヒステリシス付き）
+"""
+
+import numpy as np
+from src.utils.plot_kernels import fit_ylim, peak_downsample
+
+
+class TestPeakDownsample:
+    """peak_downsample()のテストスイート"""
+
+    def test_small_input_returned_unchanged(self):
+        """サンプル数が2*target_n以下なら入力をそのまま返す"""
+        times = np.arange(100, dtype=float)
+        values = np.sin(times)
+        
+        t_out, v_out = peak_downsample(times, values, 50)
+        
+        assert t_out is times
+        assert v_out is values
+
+    def test_output_length(self):
+        """出力点数は約2*target_n"""
+        times = np.arange(1000, dtype=float)
+        values = np.sin(times)
+        
+        t_out, v_out = peak_downsample(times, values, 100)
+        
+        assert len(t_out) == 200
+        assert len(v_out) == 200
+
+    def test_peaks_preserved(self):
+        """スパイク（最大値・最小値）が保持される"""
+        times = np.arange(1000, dtype=float)
+        values = np.zeros(1000)
+        values[123] = 10.0
+        values[777] = -10.0
+        
+        t_out, v_out = peak_downsample(times, values, 100)
+        
+        assert 10.0 in v_out
+        assert -10.0 in v_out
+        assert 123.0 in t_out
+        assert 777.0 in t_out
+
+    def test_times_in_order(self):
+        """出力時刻は昇順"""
+        times = np.arange(1001, dtype=float)
+        values = np.random.default_rng(0).normal(size=1001)
+        
+        t_out, _ = peak_downsample(times, values, 250)
+        
+        assert np.all(np.diff(t_out) >= 0)
+
+    def test_nan_ignored(self):
+        """NaNは無視され、全NaNのバケットはNaN（線の途切れ）になる"""
+        times = np.arange(1000, dtype=float)
+        values = np.ones(1000)
+        values[0:10] = np.nan   # 1バケット全体がNaN
+        values[15] = np.nan     # 一部のみNaN
+        
+        _, v_out = peak_downsample(times, values, 100)
+        
+        assert np.isnan(v_out[0]) and np.isnan(v_out[1])
+        assert not np.isnan(v_out[2:]).any()
+
+
+class _Axes:
+    """get_ylim/set_ylimだけを持つ軸のスタブ"""
+
+    def __init__(self, y_lo, y_hi):
+        self.ylim = (y_lo, y_hi)
+
+    def get_ylim(self):
+        return self.ylim
+
+    def set_ylim(self, y_lo, y_hi):
+        self.ylim = (y_lo, y_hi)
+
+
+class TestFitYlim:
+    """fit_ylim()のテストスイート"""
+
+    def test_grows_when_data_exceeds_view(self):
+        """データが表示範囲を超えると10%マージンで拡大する"""
+        ax = _Axes(-1.0, 1.0)
+        
+        assert fit_ylim(ax, np.array([0.0, 10.0]))
+        assert ax.ylim == (-1.0, 11.0)
+
+    def test_unchanged_when_data_fits(self):
+        """データが範囲の半分以上を占めていれば範囲は変わらない"""
+        ax = _Axes(-1.0, 11.0)
+        
+        assert not fit_ylim(ax, np.array([0.0, 9.0]))
+        assert ax.ylim == (-1.0, 11.0)
+
+    def test_shrinks_after_spike(self):
+        """スパイクが窓から抜けて範囲の半分未満になると縮小する"""
+        ax = _Axes(-1.0, 11.0)
+        
+        assert fit_ylim(ax, np.array([0.0, 1.0]))
+        assert ax.ylim == (-0.1, 1.1)
+
+    def test_all_nan_ignored(self):
+        """全てNaN（エラー値）なら範囲を変更しない"""
+        ax = _Axes(-1.0, 1.0)
+        
+        assert not fit_ylim(ax, np.full(5, np.nan))
+        assert ax.ylim == (-1.0, 1.0)
+
+    def test_force_resets_limits(self):
+        """force=Trueなら範囲内のデータでも再設定する"""
+        ax = _Axes(-1.0, 1.0)
+        
+        assert fit_ylim(ax, np.array([0.5, 0.5]), force=True)
+        assert ax.ylim == (0.0, 1.0)
@@ -6,6 +6,14 @@ import time
 import serial
 import sys
 
+import pytest
+
+# Needs a sensor on a serial port: skipped unless pytest --hardware
+pytestmark = pytest.mark.hardware
+
+# Prefixes of sensor data lines
+DATA_PREFIXES = (b'S ', b's ')
+
 
 def test_save_command(port: str, baud: int = 115200):
     print(f"\n{'=' * 60}")
@@ -36,87 +44,88 @@ def test_save_command(port: str, baud: int = 115200):
         command = "{save}"
         print(f"Sending command: {command}")
         
-        for char in command:
-            ser.write(char.encode('ascii'))
-            time.sleep(0.01)
-        
+        # Single write: the UART frames each byte, no pacing needed
+        ser.write(command.encode('ascii'))
         ser.flush()
         
         # Read response
         print("\nWaiting for response (3 seconds)...\n")
-        start_time = time.time()
         response_lines = []
+        out = []  # Report lines, written in one go at the end
+        # Block in read_until() so each line is handled as soon as it arrives
+        # (monotonic deadline: immune to wall-clock adjustments)
+        ser.timeout = 0.1
+        deadline = time.monotonic() + 3.0
         
-        while (time.time() - start_time) < 3.0:
-            if ser.in_waiting > 0:
-                try:
-                    line = ser.readline().decode('ascii', errors='ignore').strip()
-                    
-                    # Skip sensor data lines
-                    if line.startswith('S ') or line.startswith('s '):
-                        continue
-                    
-                    if line:
-                        response_lines.append(line)
-                        print(f"  Line {len(response_lines)}: {line}")
+        while time.monotonic() < deadline:
+            try:
+                raw = ser.read_until(b'\n').strip()
+                
+                # Skip timeouts and sensor data lines
+                if not raw or raw.startswith(DATA_PREFIXES):
+                    continue
                 
-                except Exception as e:
-                    print(f"  Error reading: {e}")
+                line = raw.decode('ascii', errors='ignore')
+                response_lines.append(line)
+                out.append(f"  Line {len(response_lines)}: {line}")
             
-            time.sleep(0.05)
+            except Exception as e:
+                out.append(f"  Error reading: {e}")
         
         ser.close()
         
-        print(f"\n{'=' * 60}")
-        print(f"Response Summary")
-        print(f"{'=' * 60}")
-        print(f"Total lines received: {len(response_lines)}")
+        out.append(f"\n{'=' * 60}")
+        out.append(f"Response Summary")
+        out.append(f"{'=' * 60}")
+        out.append(f"Total lines received: {len(response_lines)}")
         
         if response_lines:
             full_response = '\n'.join(response_lines)
-            print(f"\nFull response:\n{full_response}")
+            out.append(f"\nFull response:\n{full_response}")
             
             # Analyze response
-            print(f"\n{'=' * 60}")
-            print(f"Analysis")
-            print(f"{'=' * 60}")
+            out.append(f"\n{'=' * 60}")
+            out.append(f"Analysis")
+            out.append(f"{'=' * 60}")
             
             response_lower = full_response.lower()
             
             if 'error' in response_lower:
-                print("❌ Contains 'error'")
+                out.append("❌ Contains 'error'")
             else:
-                print("✓ No 'error' found")
+                out.append("✓ No 'error' found")
             
             if 'invalid' in response_lower:
-                print("❌ Contains 'invalid'")
+                out.append("❌ Contains 'invalid'")
             else:
-                print("✓ No 'invalid' found")
+                out.append("✓ No 'invalid' found")
             
             if 'saved' in response_lower or 'ok' in response_lower:
-                print("✓ Contains success indicator ('saved' or 'ok')")
+                out.append("✓ Contains success indicator ('saved' or 'ok')")
             else:
-                print("⚠ No explicit success indicator")
+                out.append("⚠ No explicit success indicator")
             
             if len(response_lines) == 0 or (len(response_lines) == 1 and response_lines[0] == ''):
-                print("⚠ Empty or minimal response")
+                out.append("⚠ Empty or minimal response")
             
-            print(f"\n{'=' * 60}")
-            print(f"Recommendation")
-            print(f"{'=' * 60}")
+            out.append(f"\n{'=' * 60}")
+            out.append(f"Recommendation")
+            out.append(f"{'=' * 60}")
             
             if 'error' not in response_lower and 'invalid' not in response_lower:
-                print("✓ Response looks good - treat as SUCCESS")
+                out.append("✓ Response looks good - treat as SUCCESS")
             else:
-                print("❌ Response indicates failure")
+                out.append("❌ Response indicates failure")
         else:
-            print("\n❌ No response received")
-            print("\nThis could mean:")
-            print("  1. Command was accepted but no response sent")
-            print("  2. Response timeout too short")
-            print("  3. Command not supported")
+            out.append("\n❌ No response received")
+            out.append("\nThis could mean:")
+            out.append("  1. Command was accepted but no response sent")
+            out.append("  2. Response timeout too short")
+            out.append("  3. Command not supported")
+        
+        out.append(f"\n{'=' * 60}\n")
         
-        print(f"\n{'=' * 60}\n")
+        sys.stdout.write('\n'.join(out) + '\n')
         
     except Exception as e:
         print(f"\n✗ ERROR: {e}")
@@ -4,7 +4,7 @@ SensorData単体テスト
 SensorDataクラスの機能を検証:
 - from_parsed_dict()の完全/部分データテスト
 - is_valid属性のエラーコードテスト
-- to_csv_row()のフォーマットテスト
+- to_csv_row()/to_csv_rows()のフォーマットテスト
 - frozen dataclassの不変性テスト
 """
 
@@ -13,24 +13,42 @@ from datetime import datetime
 from src.models.sensor_data import SensorData
 
 
+@pytest.fixture
+def parsed_full():
+    """全8タグのパースデータ"""
+    return {
+        'S': 5.23,
+        'D': 270.15,
+        'U': 2.45,
+        'V': -1.33,
+        'W': 0.12,
+        'T': 23.45,
+        'PI': 45.2,
+        'RO': 1013.2
+    }
+
+
+@pytest.fixture
+def parsed_min():
+    """PI, ROを含まない6タグのパースデータ"""
+    return {
+        'S': 5.23,
+        'D': 270.15,
+        'U': 2.45,
+        'V': -1.33,
+        'W': 0.12,
+        'T': 23.45
+    }
+
+
 class TestSensorData:
     """SensorDataクラスのテストスイート"""
 
-    def test_from_parsed_dict_complete(self):
+    def test_from_parsed_dict_complete(self, parsed_full):
         """完全なパースデータからSensorData生成"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45,
-            'PI': 45.2,
-            'RO': 1013.2
-        }
         sensor_id = "Sensor1"
         
-        data = SensorData.from_parsed_dict(sensor_id, parsed)
+        data = SensorData.from_parsed_dict(sensor_id, parsed_full)
         
         assert data.sensor_id == "Sensor1"
         assert data.speed_2d == 5.23
@@ -44,19 +62,11 @@ class TestSensorData:
         assert isinstance(data.timestamp, datetime)
         assert data.is_valid is True
 
-    def test_from_parsed_dict_minimal_required(self):
+    def test_from_parsed_dict_minimal_required(self, parsed_min):
         """必須タグのみのパースデータ（PI, RO欠損時はデフォルト0.0）"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
         sensor_id = "Sensor2"
         
-        data = SensorData.from_parsed_dict(sensor_id, parsed)
+        data = SensorData.from_parsed_dict(sensor_id, parsed_min)
         
         assert data.sensor_id == "Sensor2"
         assert data.speed_2d == 5.23
@@ -81,93 +91,24 @@ class TestSensorData:
         }
         sensor_id = "Sensor3"
         
-        with pytest.raises(KeyError):
+        with pytest.raises(KeyError, match="Missing required tags: U"):
             SensorData.from_parsed_dict(sensor_id, parsed)
 
-    def test_is_valid_with_error_in_speed(self):
-        """速度にエラー値(-99.9)を含む場合、is_valid=False"""
-        parsed = {
-            'S': -99.9,  # エラー値
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
-        assert data.is_valid is False
-
-    def test_is_valid_with_error_in_temperature(self):
-        """温度にエラー値(-99.99)を含む場合、is_valid=False"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': -99.99  # エラー値
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
-        assert data.is_valid is False
-
-    def test_is_valid_with_multiple_errors(self):
-        """複数のフィールドにエラー値を含む場合、is_valid=False"""
-        parsed = {
-            'S': -99.9,   # エラー値
-            'D': -99.99,  # エラー値
-            'U': 2.45,
-            'V': -1.33,
-            'W': -99.9,   # エラー値
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
-        assert data.is_valid is False
-
-    def test_is_valid_no_errors(self):
-        """エラー値を含まない正常データ、is_valid=True"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
-        assert data.is_valid is True
-
-    def test_is_valid_normal_negative_values(self):
-        """正常な負の値はエラーとして扱わない"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': -2.45,
-            'V': -1.33,
-            'W': -0.12,
-            'T': -10.5
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
-        assert data.is_valid is True
+    @pytest.mark.parametrize("overrides, expected", [
+        ({'S': -99.9}, False),                            # 速度にエラー値
+        ({'T': -99.99}, False),                           # 温度にエラー値
+        ({'S': -99.9, 'D': -99.99, 'W': -99.9}, False),   # 複数のエラー値
+        ({}, True),                                       # 正常データ
+        ({'U': -2.45, 'W': -0.12, 'T': -10.5}, True),     # 正常な負の値
+    ])
+    def test_is_valid(self, parsed_min, overrides, expected):
+        """エラー値(-99.9, -99.99)を含む場合のみis_valid=False"""
+        data = SensorData.from_parsed_dict("Sensor1", {**parsed_min, **overrides})
+        assert data.is_valid is expected
 
-    def test_to_csv_row_complete_data(self):
+    def test_to_csv_row_complete_data(self, parsed_full):
         """完全なデータのCSV行変換"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45,
-            'PI': 45.2,
-            'RO': 1013.2
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
+        data = SensorData.from_parsed_dict("Sensor1", parsed_full)
         csv_row = data.to_csv_row()
         
         # CSV行は [timestamp, sensor_id, S, D, U, V, W, T, PI, RO] の順
@@ -183,18 +124,9 @@ class TestSensorData:
         assert csv_row[8] == "45.20"
         assert csv_row[9] == "1013.20"
 
-    def test_to_csv_row_minimal_data(self):
+    def test_to_csv_row_minimal_data(self, parsed_min):
         """オプショナルフィールド欠損時のCSV行（デフォルト0.0）"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor2", parsed)
+        data = SensorData.from_parsed_dict("Sensor2", parsed_min)
         csv_row = data.to_csv_row()
         
         assert len(csv_row) == 10
@@ -202,18 +134,9 @@ class TestSensorData:
         assert csv_row[8] == "0.00"  # PI default value
         assert csv_row[9] == "0.00"  # RO default value
 
-    def test_to_csv_row_timestamp_format(self):
+    def test_to_csv_row_timestamp_format(self, parsed_min):
         """タイムスタンプがISO 8601形式で出力される"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
+        data = SensorData.from_parsed_dict("Sensor1", parsed_min)
         csv_row = data.to_csv_row()
         
         # タイムスタンプは "YYYY-MM-DD HH:MM:SS.fff" 形式
@@ -224,18 +147,31 @@ class TestSensorData:
         # ISO形式のパースが可能か確認
         datetime.fromisoformat(timestamp_str.replace(' ', 'T'))
 
-    def test_frozen_dataclass_immutability(self):
-        """frozen dataclassは不変である"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
+    def test_to_csv_rows_matches_to_csv_row(self):
+        """to_csv_rows()は各レコードのto_csv_row()と一致する"""
+        records = [
+            SensorData.from_parsed_dict(
+                "Sensor1",
+                {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45},
+                timestamp=datetime(2024, 1, 1, 12, 0, 0, 123456)
+            ),
+            SensorData.from_parsed_dict(
+                "Sensor1",
+                {'S': -99.9, 'D': 10.0, 'U': 0.0, 'V': 0.0, 'W': 0.0, 'PI': 2.1},
+                timestamp=datetime(2024, 1, 1, 12, 0, 1)
+            ),
+        ]
         
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
+        rows = SensorData.to_csv_rows(records)
+        
+        assert rows == [record.to_csv_row() for record in records]
+        assert rows[0][0] == '2024-01-01 12:00:00.123'
+        assert rows[1][0] == '2024-01-01 12:00:01.000'
+        assert rows[1][2:] == ['-99.90', '10.00', '0.00', '0.00', '0.00', '0.00', '2.10', '0.00']
+
+    def test_frozen_dataclass_immutability(self, parsed_min):
+        """frozen dataclassは不変である"""
+        data = SensorData.from_parsed_dict("Sensor1", parsed_min)
         
         # フィールドの変更を試みるとFrozenInstanceErrorが発生
         with pytest.raises(Exception):  # dataclasses.FrozenInstanceError
@@ -244,37 +180,19 @@ class TestSensorData:
         with pytest.raises(Exception):
             data.temperature = 25.0
 
-    def test_sensor_data_equality(self):
+    def test_sensor_data_equality(self, parsed_min):
         """同じデータを持つSensorDataインスタンスは等価"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
         # 同一タイムスタンプで2つ生成
         timestamp = datetime.now()
-        data1 = SensorData.from_parsed_dict("Sensor1", parsed, timestamp=timestamp)
-        data2 = SensorData.from_parsed_dict("Sensor1", parsed, timestamp=timestamp)
+        data1 = SensorData.from_parsed_dict("Sensor1", parsed_min, timestamp=timestamp)
+        data2 = SensorData.from_parsed_dict("Sensor1", parsed_min, timestamp=timestamp)
         
         assert data1 == data2
 
-    def test_sensor_data_with_different_sensor_ids(self):
+    def test_sensor_data_with_different_sensor_ids(self, parsed_min):
         """異なるsensor_idのデータは区別される"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data1 = SensorData.from_parsed_dict("Sensor1", parsed)
-        data2 = SensorData.from_parsed_dict("Sensor2", parsed)
+        data1 = SensorData.from_parsed_dict("Sensor1", parsed_min)
+        data2 = SensorData.from_parsed_dict("Sensor2", parsed_min)
         
         assert data1.sensor_id != data2.sensor_id
         assert data1 != data2  # sensor_idが異なるため非等価
@@ -322,23 +240,34 @@ class TestSensorData:
         assert data.temperature == -40.0
         assert data.is_valid is True  # -40.0は-99.9や-99.99ではない
 
-    def test_is_error_value_method(self):
+    def test_is_error_value_method(self, parsed_min):
         """is_error_value()メソッドのテスト"""
-        parsed = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        
-        data = SensorData.from_parsed_dict("Sensor1", parsed)
+        data = SensorData.from_parsed_dict("Sensor1", parsed_min)
         
         assert data.is_error_value(-99.9) is True
         assert data.is_error_value(-99.99) is True
         assert data.is_error_value(5.23) is False
         assert data.is_error_value(0.0) is False
+    
+    def test_timestamp_epoch_matches_timestamp(self, parsed_min):
+        """timestamp_epochはtimestampのエポック秒（float）と一致する"""
+        timestamp = datetime(2024, 1, 15, 13, 45, 30, 123456)
+        
+        data = SensorData.from_parsed_dict("Sensor1", parsed_min, timestamp=timestamp)
+        
+        assert isinstance(data.timestamp_epoch, float)
+        assert data.timestamp_epoch == timestamp.timestamp()
+    
+    def test_from_parsed_dict_timestamp_ns(self):
+        """timestamp_ns（エポックナノ秒）からtimestampが生成される"""
+        parsed = {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12}
+        timestamp = datetime(2024, 1, 15, 13, 45, 30, 123456)
+        timestamp_ns = int(timestamp.timestamp()) * 1_000_000_000 + 123456 * 1000
+        
+        data = SensorData.from_parsed_dict("Sensor1", parsed, timestamp_ns=timestamp_ns)
+        
+        assert data.timestamp == timestamp
+        assert data.timestamp_epoch == timestamp.timestamp()
 
 
 if __name__ == '__main__':
@@ -13,17 +13,19 @@ import pytest
 from src.utils.serial_parser import SerialParser
 
 
+@pytest.fixture(scope="class")
+def parser():
+    """クラス内の全テストで共有するパーサー"""
+    return SerialParser()
+
+
 class TestSerialParser:
     """SerialParserクラスのテストスイート"""
 
-    def setup_method(self):
-        """各テストメソッドの前に実行"""
-        self.parser = SerialParser()
-
-    def test_parse_valid_line_single_space(self):
+    def test_parse_valid_line_single_space(self, parser):
         """有効なタグ付きデータのパース（単一スペース）"""
         line = "S 5.23 D 270.15 U 2.45 V -1.33 W 0.12 T 23.45 PI 45.2 RO 1013.2"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['S'] == 5.23
         assert result['D'] == 270.15
@@ -34,10 +36,10 @@ class TestSerialParser:
         assert result['PI'] == 45.2
         assert result['RO'] == 1013.2
 
-    def test_parse_valid_line_variable_spaces(self):
+    def test_parse_valid_line_variable_spaces(self, parser):
         """可変スペースに対応したパース"""
         line = "S  5.23   D 270.15 U    2.45  V -1.33    W 0.12 T  23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['S'] == 5.23
         assert result['D'] == 270.15
@@ -46,10 +48,10 @@ class TestSerialParser:
         assert result['W'] == 0.12
         assert result['T'] == 23.45
 
-    def test_parse_line_with_tabs(self):
+    def test_parse_line_with_tabs(self, parser):
         """タブ文字を含むデータのパース"""
         line = "S\t5.23\tD\t270.15\tU\t2.45\tV\t-1.33\tW\t0.12\tT\t23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['S'] == 5.23
         assert result['D'] == 270.15
@@ -58,10 +60,10 @@ class TestSerialParser:
         assert result['W'] == 0.12
         assert result['T'] == 23.45
 
-    def test_parse_line_missing_optional_tags(self):
+    def test_parse_line_missing_optional_tags(self, parser):
         """オプショナルタグ（PI, RO）が欠損している場合"""
         line = "S 5.23 D 270.15 U 2.45 V -1.33 W 0.12 T 23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['S'] == 5.23
         assert result['D'] == 270.15
@@ -72,26 +74,23 @@ class TestSerialParser:
         assert 'PI' not in result
         assert 'RO' not in result
 
-    def test_is_error_value_negative_99_9(self):
-        """エラー値-99.9の検出"""
-        assert self.parser.is_error_value(-99.9) is True
-        assert self.parser.is_error_value(-99.89) is False
-        assert self.parser.is_error_value(-99.91) is False
-
-    def test_is_error_value_negative_99_99(self):
-        """エラー値-99.99の検出"""
-        assert self.parser.is_error_value(-99.99) is True
-        assert self.parser.is_error_value(-99.98) is False
-        assert self.parser.is_error_value(-100.0) is False
-
-    def test_is_error_value_normal_values(self):
-        """正常な値はエラー値として検出されない"""
-        assert self.parser.is_error_value(0.0) is False
-        assert self.parser.is_error_value(5.23) is False
-        assert self.parser.is_error_value(-10.5) is False
-        assert self.parser.is_error_value(270.15) is False
-
-    def test_validate_data_all_required_tags(self):
+    @pytest.mark.parametrize("value, expected", [
+        (-99.9, True),      # エラー値-99.9
+        (-99.89, False),
+        (-99.91, False),
+        (-99.99, True),     # エラー値-99.99
+        (-99.98, False),
+        (-100.0, False),
+        (0.0, False),       # 正常な値
+        (5.23, False),
+        (-10.5, False),
+        (270.15, False),
+    ])
+    def test_is_error_value(self, parser, value, expected):
+        """エラー値(-99.9, -99.99)のみが検出される"""
+        assert parser.is_error_value(value) is expected
+
+    def test_validate_data_all_required_tags(self, parser):
         """必須タグ(S, D, U, V, W, T)が全て含まれる場合"""
         data = {
             'S': 5.23,
@@ -101,23 +100,21 @@ class TestSerialParser:
             'W': 0.12,
             'T': 23.45
         }
-        assert self.parser.validate_data(data) is True
+        assert parser.validate_data(data) is True
 
-    def test_validate_data_missing_required_tag(self):
+    @pytest.mark.parametrize("missing_tag", sorted(SerialParser.REQUIRED_TAGS))
+    def test_validate_data_missing_required_tag(self, parser, missing_tag):
         """必須タグが欠損している場合"""
-        # S欠損
-        data = {'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45}
-        assert self.parser.validate_data(data) is False
-        
-        # U欠損
-        data = {'S': 5.23, 'D': 270.15, 'V': -1.33, 'W': 0.12, 'T': 23.45}
-        assert self.parser.validate_data(data) is False
-        
-        # T欠損
+        data = {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45}
+        del data[missing_tag]
+        assert parser.validate_data(data) is False
+
+    def test_validate_data_missing_temperature(self, parser):
+        """T（温度）は必須ではなく、欠損していても検証に成功する"""
         data = {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12}
-        assert self.parser.validate_data(data) is False
+        assert parser.validate_data(data) is True
 
-    def test_validate_data_with_optional_tags(self):
+    def test_validate_data_with_optional_tags(self, parser):
         """オプショナルタグ含む完全なデータ"""
         data = {
             'S': 5.23,
@@ -129,120 +126,104 @@ class TestSerialParser:
             'PI': 45.2,
             'RO': 1013.2
         }
-        assert self.parser.validate_data(data) is True
+        assert parser.validate_data(data) is True
 
-    def test_parse_line_incomplete(self):
+    def test_parse_line_incomplete(self, parser):
         """不完全な行（値が欠損）"""
         line = "S 5.23 D U 2.45 V -1.33 W 0.12 T 23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         # Dの値が欠損しているためDキーは含まれない
         assert 'S' in result
         assert 'D' not in result  # 値がないため除外
         assert 'U' in result
 
-    def test_parse_line_non_numeric_value(self):
+    def test_parse_line_non_numeric_value(self, parser):
         """非数値変換の処理"""
         line = "S 5.23 D ABC U 2.45 V -1.33 W 0.12 T 23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         # ABCは数値に変換できないためDキーは除外
         assert 'S' in result
         assert 'D' not in result
         assert 'U' in result
 
-    def test_parse_empty_line(self):
+    def test_parse_empty_line(self, parser):
         """空行の処理（ParseError発生）"""
         line = ""
         with pytest.raises(Exception):  # ParseError
-            self.parser.parse_line(line)
+            parser.parse_line(line)
         
         line = "   "
         with pytest.raises(Exception):  # ParseError
-            self.parser.parse_line(line)
+            parser.parse_line(line)
 
-    def test_parse_line_single_tag(self):
+    def test_parse_line_single_tag(self, parser):
         """単一タグのみの行"""
         line = "S 5.23"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result == {'S': 5.23}
-        assert not self.parser.validate_data(result)  # 必須タグが足りない
+        assert not parser.validate_data(result)  # 必須タグが足りない
 
-    def test_parse_line_unknown_tags(self):
+    def test_parse_line_required_tags(self, parser):
+        """required_tags指定時、必須タグが欠けた行はNoneを返す"""
+        required = SerialParser.REQUIRED_TAGS
+        
+        assert parser.parse_line("S 5.23 D 270.15 U 2.45", required) is None
+        
+        result = parser.parse_line("S 5.23 D 270.15 U 2.45 V -1.33 W 0.12", required)
+        assert result['W'] == 0.12
+
+    def test_parse_line_unknown_tags(self, parser):
         """未知タグを含む行（既知タグのみパースされる）"""
         line = "S 5.23 D 270.15 U 2.45 V -1.33 W 0.12 T 23.45 UNKNOWN 99.9"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['S'] == 5.23
         assert result['D'] == 270.15
         # UNKNOWNタグは既知タグではないため含まれない
         assert 'UNKNOWN' not in result
 
-    def test_has_error_values_with_errors(self):
+    @pytest.mark.parametrize("errors, expected", [
+        ({'S': -99.9}, True),                # エラー値を含むデータ
+        ({'S': -99.9, 'D': -99.99}, True),   # 複数のエラー値
+        ({}, False),                         # エラー値を含まないデータ
+    ])
+    def test_has_error_values(self, parser, errors, expected):
         """エラー値を含むデータの検出"""
-        data = {
-            'S': -99.9,  # エラー値
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        assert self.parser.has_error_values(data) is True
-
-    def test_has_error_values_multiple_errors(self):
-        """複数のエラー値を含むデータ"""
-        data = {
-            'S': -99.9,  # エラー値
-            'D': -99.99,  # エラー値
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        assert self.parser.has_error_values(data) is True
-
-    def test_has_error_values_no_errors(self):
-        """エラー値を含まないデータ"""
-        data = {
-            'S': 5.23,
-            'D': 270.15,
-            'U': 2.45,
-            'V': -1.33,
-            'W': 0.12,
-            'T': 23.45
-        }
-        assert self.parser.has_error_values(data) is False
+        data = {'S': 5.23, 'D': 270.15, 'U': 2.45, 'V': -1.33, 'W': 0.12, 'T': 23.45}
+        data.update(errors)
+        assert parser.has_error_values(data) is expected
 
-    def test_parse_line_with_negative_values(self):
+    def test_parse_line_with_negative_values(self, parser):
         """負の値を含む正常なデータのパース"""
         line = "S 5.23 D 270.15 U -2.45 V -1.33 W -0.12 T -10.5"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert result['U'] == -2.45
         assert result['V'] == -1.33
         assert result['W'] == -0.12
         assert result['T'] == -10.5
-        assert not self.parser.has_error_values(result)
+        assert not parser.has_error_values(result)
 
-    def test_parse_line_with_scientific_notation(self):
+    def test_parse_line_with_scientific_notation(self, parser):
         """科学的記数法の処理（Pythonのfloat変換が対応）"""
         line = "S 5.23e0 D 2.7015e2 U 2.45E0 V -1.33 W 1.2e-1 T 23.45"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
         assert abs(result['S'] - 5.23) < 0.0001
         assert abs(result['D'] - 270.15) < 0.0001
         assert abs(result['W'] - 0.12) < 0.0001
 
-    def test_parse_line_realistic_sensor_output(self):
+    def test_parse_line_realistic_sensor_output(self, parser):
         """実際のTrisonicaセンサー出力に近いデータ"""
         # 実際のセンサーからの典型的な出力例
         line = "S 4.67 D 315.89 U 3.30 V -3.30 W 0.01 T 21.34 PI 50.12 RO 1013.25"
-        result = self.parser.parse_line(line)
+        result = parser.parse_line(line)
         
-        assert self.parser.validate_data(result) is True
-        assert not self.parser.has_error_values(result)
+        assert parser.validate_data(result) is True
+        assert not parser.has_error_values(result)
         assert result['S'] == 4.67
         assert result['D'] == 315.89
         assert result['PI'] == 50.12
@@ -0,0 +1,61 @@
+"""
+SingleSensorTab単体テスト
+
+ウィジェットを生成せずにフレームレート制御のロジックを検証:
+- _adapt_frame_rate()のタイマー間隔がノイズのある描画時間でも安定すること
+- 1フレーム周期を超えたフレームの次フレームをスキップすること
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5")
+from src.views.single_sensor_tab import SingleSensorTab
+
+
+class _Timer:
+    """setInterval()の呼び出しを記録するQTimerのスタブ"""
+
+    def __init__(self):
+        self.intervals = []
+
+    def setInterval(self, interval):
+        self.intervals.append(interval)
+
+
+def _frame_state():
+    """_adapt_frame_rate()が参照する属性だけを持つタブのスタブ"""
+    return SimpleNamespace(
+        TARGET_FPS=SingleSensorTab.TARGET_FPS,
+        DELAY_SMOOTHING=SingleSensorTab.DELAY_SMOOTHING,
+        _frame_delay=None,
+        _skip_next_frame=False,
+        update_timer=_Timer(),
+    )
+
+
+class TestAdaptFrameRate:
+    """_adapt_frame_rate()のテストスイート"""
+
+    def test_noisy_constant_delay_gives_stable_interval(self):
+        """平均10ms±2msの描画時間ではタイマー間隔が約23msで安定する"""
+        state = _frame_state()
+        delays = np.random.default_rng(0).normal(0.010, 0.002, size=300).clip(0.0)
+        
+        for delay in delays:
+            SingleSensorTab._adapt_frame_rate(state, float(delay))
+        
+        # 周期33ms - 平均10ms = 23ms から±2ms以内（上限・下限に張り付かない）
+        settled = state.update_timer.intervals[20:]
+        assert all(21 <= interval <= 25 for interval in settled)
+
+    def test_slow_frame_skips_next(self):
+        """1フレーム周期を超えた場合は次のフレームをスキップする"""
+        state = _frame_state()
+        
+        SingleSensorTab._adapt_frame_rate(state, 0.050)
+        
+        assert state._skip_next_frame
+        assert state.update_timer.intervals == [1]
@@ -4,7 +4,7 @@ Validators単体テスト
 Validatorsクラスの機能を検証:
 - validate_com_port()の有効/無効COMポート形式テスト
 - validate_baud_rate()の有効/無効ボーレートテスト
-- validate_csv_path()のパストラバーサル攻撃検出テスト
+- validate_csv_path()のパストラバーサル攻撃検出・キャッシュテスト
 - validate_output_rate()の範囲(1-10 Hz)テスト
 - validate_sensor_id()のセンサーID形式テスト
 """
@@ -14,62 +14,51 @@ from pathlib import Path
 from src.utils.validators import Validators
 
 
+@pytest.mark.parallel_safe
 class TestValidators:
     """Validatorsクラスのテストスイート"""
 
     # COM Port Validation Tests
-    def test_validate_com_port_valid(self):
-        """有効なCOMポート形式"""
-        assert Validators.validate_com_port("COM1") is True
-        assert Validators.validate_com_port("COM3") is True
-        assert Validators.validate_com_port("COM10") is True
-        assert Validators.validate_com_port("COM99") is True
-        assert Validators.validate_com_port("com5") is True  # 大文字小文字不問
-
-    def test_validate_com_port_invalid(self):
-        """無効なCOMポート形式"""
-        assert Validators.validate_com_port("USB0") is False
-        assert Validators.validate_com_port("COMA") is False
-        assert Validators.validate_com_port("COM") is False
-        assert Validators.validate_com_port("1COM") is False
-        assert Validators.validate_com_port("/dev/ttyUSB0") is False
-
-    def test_validate_com_port_empty_or_none(self):
-        """空またはNone"""
-        assert Validators.validate_com_port("") is False
-        assert Validators.validate_com_port(None) is False
-
-    def test_validate_com_port_invalid_type(self):
-        """無効な型"""
-        assert Validators.validate_com_port(123) is False
-        assert Validators.validate_com_port([]) is False
+    @pytest.mark.parametrize("port, expected", [
+        ("COM1", True),
+        ("COM3", True),
+        ("COM10", True),
+        ("COM99", True),
+        ("com5", True),             # 大文字小文字不問
+        ("USB0", False),
+        ("COMA", False),
+        ("COM", False),
+        ("1COM", False),
+        ("/dev/ttyUSB0", False),
+        ("", False),                # 空
+        (None, False),              # None
+        (123, False),               # 無効な型
+        ([], False),
+    ])
+    def test_validate_com_port(self, port, expected):
+        """COMポート形式の検証（有効/無効/空/無効な型）"""
+        assert Validators.validate_com_port(port) is expected
 
     # Baud Rate Validation Tests
-    def test_validate_baud_rate_valid(self):
+    @pytest.mark.parametrize("baud", sorted(Validators.VALID_BAUD_RATES))
+    def test_validate_baud_rate_valid(self, baud):
         """有効なボーレート"""
-        for baud in Validators.VALID_BAUD_RATES:
-            assert Validators.validate_baud_rate(baud) is True
-
-    def test_validate_baud_rate_as_string(self):
-        """文字列としての有効なボーレート"""
-        assert Validators.validate_baud_rate("115200") is True
-        assert Validators.validate_baud_rate("9600") is True
-
-    def test_validate_baud_rate_invalid(self):
-        """無効なボーレート"""
-        assert Validators.validate_baud_rate(9601) is False
-        assert Validators.validate_baud_rate(115201) is False
-        assert Validators.validate_baud_rate(0) is False
-        assert Validators.validate_baud_rate(-1) is False
-
-    def test_validate_baud_rate_invalid_string(self):
-        """無効な文字列"""
-        assert Validators.validate_baud_rate("abc") is False
-        assert Validators.validate_baud_rate("") is False
-
-    def test_validate_baud_rate_none(self):
-        """None値"""
-        assert Validators.validate_baud_rate(None) is False
+        assert Validators.validate_baud_rate(baud) is True
+
+    @pytest.mark.parametrize("baud, expected", [
+        ("115200", True),           # 文字列としての有効なボーレート
+        ("9600", True),
+        (9601, False),              # 無効なボーレート
+        (115201, False),
+        (0, False),
+        (-1, False),
+        ("abc", False),             # 無効な文字列
+        ("", False),
+        (None, False),              # None値
+    ])
+    def test_validate_baud_rate(self, baud, expected):
+        """ボーレートの検証（文字列/無効値/None）"""
+        assert Validators.validate_baud_rate(baud) is expected
 
     # CSV Path Validation Tests
     def test_validate_csv_path_valid(self):
@@ -90,6 +79,18 @@ class TestValidators:
         assert is_valid is False
         assert "traversal" in error_msg.lower()
 
+    def test_validate_csv_path_windows_traversal(self):
+        """バックスラッシュ区切りのパストラバーサルも検出（全プラットフォーム）"""
+        is_valid, error_msg = Validators.validate_csv_path("..\\..\\Windows\\out.csv")
+        assert is_valid is False
+        assert "traversal" in error_msg.lower()
+
+    def test_validate_csv_path_dots_in_name(self):
+        """名前の一部としての '..' はトラバーサルではない"""
+        is_valid, error_msg = Validators.validate_csv_path("run..2/data..v1.csv")
+        assert is_valid is True
+        assert error_msg == ""
+
     def test_validate_csv_path_no_extension(self):
         """拡張子なしのファイル"""
         is_valid, error_msg = Validators.validate_csv_path("output")
@@ -127,93 +128,79 @@ class TestValidators:
         is_valid, error_msg = Validators.validate_csv_path(Path("output.csv"))
         assert is_valid is True
 
+    def test_validate_csv_path_cached(self):
+        """同じパスの再検証はキャッシュされた結果を返す（strとPathで共有）"""
+        first = Validators.validate_csv_path("cached_output.csv")
+        
+        assert Validators.validate_csv_path("cached_output.csv") is first
+        assert Validators.validate_csv_path(Path("cached_output.csv")) is first
+
     # Output Rate Validation Tests
-    def test_validate_output_rate_valid_integer(self):
-        """有効な整数レート（1-10 Hz）"""
-        for rate in range(1, 11):
-            assert Validators.validate_output_rate(rate) is True
-
-    def test_validate_output_rate_valid_float(self):
-        """有効な浮動小数点レート"""
-        assert Validators.validate_output_rate(1.0) is True
-        assert Validators.validate_output_rate(5.5) is True
-        assert Validators.validate_output_rate(10.0) is True
-
-    def test_validate_output_rate_as_string(self):
-        """文字列としての有効なレート"""
-        assert Validators.validate_output_rate("5") is True
-        assert Validators.validate_output_rate("1.5") is True
-        assert Validators.validate_output_rate("10") is True
-
-    def test_validate_output_rate_out_of_range(self):
-        """範囲外のレート"""
-        assert Validators.validate_output_rate(0) is False
-        assert Validators.validate_output_rate(0.5) is False
-        assert Validators.validate_output_rate(11) is False
-        assert Validators.validate_output_rate(100) is False
-        assert Validators.validate_output_rate(-1) is False
-
-    def test_validate_output_rate_invalid_string(self):
-        """無効な文字列"""
-        assert Validators.validate_output_rate("abc") is False
-        assert Validators.validate_output_rate("") is False
-
-    def test_validate_output_rate_none(self):
-        """None値"""
-        assert Validators.validate_output_rate(None) is False
-
-    def test_validate_output_rate_boundary_values(self):
-        """境界値テスト"""
-        assert Validators.validate_output_rate(1.0) is True  # 下限
-        assert Validators.validate_output_rate(10.0) is True  # 上限
-        assert Validators.validate_output_rate(0.999) is False  # 下限未満
-        assert Validators.validate_output_rate(10.001) is False  # 上限超過
+    @pytest.mark.parametrize("rate, expected", [
+        *((rate, True) for rate in range(1, 11)),   # 有効な整数レート（1-10 Hz）
+        (1.0, True),                # 有効な浮動小数点レート（下限）
+        (5.5, True),
+        (10.0, True),               # 上限
+        ("5", True),                # 文字列としての有効なレート
+        ("1.5", True),
+        ("10", True),
+        (0, False),                 # 範囲外のレート
+        (0.5, False),
+        (11, False),
+        (100, False),
+        (-1, False),
+        (0.999, False),             # 下限未満
+        (10.001, False),            # 上限超過
+        ("abc", False),             # 無効な文字列
+        ("", False),
+        (None, False),              # None値
+    ])
+    def test_validate_output_rate(self, rate, expected):
+        """出力レート(1-10 Hz)の検証（範囲/境界値/文字列/None）"""
+        assert Validators.validate_output_rate(rate) is expected
 
     # Sensor ID Validation Tests
-    def test_validate_sensor_id_valid(self):
-        """有効なセンサーID"""
-        assert Validators.validate_sensor_id("Sensor1") is True
-        assert Validators.validate_sensor_id("Sensor2") is True
-        assert Validators.validate_sensor_id("COM3_Sensor") is True
-        assert Validators.validate_sensor_id("Trisonica_A") is True
-
-    def test_validate_sensor_id_alphanumeric(self):
-        """英数字とアンダースコア"""
-        assert Validators.validate_sensor_id("abc123") is True
-        assert Validators.validate_sensor_id("ABC_123") is True
-        assert Validators.validate_sensor_id("sensor_01") is True
-
-    def test_validate_sensor_id_invalid_characters(self):
-        """無効な文字を含むセンサーID"""
-        assert Validators.validate_sensor_id("Sensor-1") is False  # ハイフン
-        assert Validators.validate_sensor_id("Sensor 1") is False  # スペース
-        assert Validators.validate_sensor_id("Sensor.1") is False  # ドット
-        assert Validators.validate_sensor_id("Sensor@1") is False  # 記号
-
-    def test_validate_sensor_id_empty(self):
-        """空のセンサーID"""
-        assert Validators.validate_sensor_id("") is False
-
-    def test_validate_sensor_id_none(self):
-        """NoneセンサーID"""
-        assert Validators.validate_sensor_id(None) is False
-
-    def test_validate_sensor_id_too_long(self):
-        """長すぎるセンサーID（20文字制限）"""
-        assert Validators.validate_sensor_id("a" * 20) is True  # 20文字はOK
-        assert Validators.validate_sensor_id("a" * 21) is False  # 21文字はNG
-
-    def test_validate_sensor_id_single_character(self):
-        """単一文字のセンサーID"""
-        assert Validators.validate_sensor_id("A") is True
-        assert Validators.validate_sensor_id("1") is True
-        assert Validators.validate_sensor_id("_") is True
+    @pytest.mark.parametrize("sensor_id, expected", [
+        ("Sensor1", True),
+        ("Sensor2", True),
+        ("COM3_Sensor", True),
+        ("Trisonica_A", True),
+        ("abc123", True),           # 英数字とアンダースコア
+        ("ABC_123", True),
+        ("sensor_01", True),
+        ("A", True),                # 単一文字
+        ("1", True),
+        ("_", True),
+        ("a" * 20, True),           # 20文字はOK
+        ("a" * 21, False),          # 21文字はNG
+        ("Sensor-1", False),        # ハイフン
+        ("Sensor 1", False),        # スペース
+        ("Sensor.1", False),        # ドット
+        ("Sensor@1", False),        # 記号
+        ("Sensor1\n", False),       # 末尾の改行
+        ("", False),                # 空
+        (None, False),              # None
+    ])
+    def test_validate_sensor_id(self, sensor_id, expected):
+        """センサーID形式の検証（英数字・アンダースコア、1-20文字）"""
+        assert Validators.validate_sensor_id(sensor_id) is expected
 
     # VALID_BAUD_RATES constant test
     def test_valid_baud_rates_constant(self):
         """VALID_BAUD_RATES定数の検証"""
         expected_rates = [9600, 19200, 38400, 57600, 115200]
-        assert Validators.VALID_BAUD_RATES == expected_rates
+        assert sorted(Validators.VALID_BAUD_RATES) == expected_rates
+        assert list(Validators.VALID_BAUD_RATES_ORDERED) == expected_rates
+
+    # SENSOR_ID_PATTERN constant test
+    def test_sensor_id_pattern_constant(self):
+        """SENSOR_ID_PATTERN正規表現パターンの検証"""
+        import re
+        pattern = Validators.SENSOR_ID_PATTERN
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.fullmatch("Sensor_1") is not None
+        assert pattern.fullmatch("a" * 21) is None
+        assert pattern.fullmatch("Sensor-1") is None
 
     # COM_PORT_PATTERN constant test
     def test_com_port_pattern_constant(self):
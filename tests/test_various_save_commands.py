@@ -6,9 +6,26 @@ import time
 import serial
 import sys
 
+import pytest
 
-def test_command(ser, command, timeout=3.0):
-    """Test a single command and return response"""
+# Needs a sensor on a serial port: skipped unless pytest --hardware
+pytestmark = pytest.mark.hardware
+
+# Prefixes of sensor data lines
+DATA_PREFIXES = (b'S ', b's ')
+
+
+def test_command(ser, command, timeout=3.0, slow_chars=False):
+    """
+    Test a single command and return response
+    
+    Args:
+        ser: Open serial port
+        command: Command string (e.g., "{save}")
+        timeout: Response timeout in seconds
+        slow_chars: Send one character per 10 ms (for firmware that drops
+            characters arriving back to back); default is a single write
+    """
     print(f"\n{'=' * 60}")
     print(f"Testing: {command}")
     print(f"{'=' * 60}")
@@ -18,33 +35,36 @@ def test_command(ser, command, timeout=3.0):
     time.sleep(0.2)
     
     # Send command
-    for char in command:
-        ser.write(char.encode('ascii'))
-        time.sleep(0.01)
+    if slow_chars:
+        for char in command:
+            ser.write(char.encode('ascii'))
+            time.sleep(0.01)
+    else:
+        # Single write: the UART frames each byte, no pacing needed
+        ser.write(command.encode('ascii'))
     
     ser.flush()
     
-    # Read response
-    start_time = time.time()
+    # Read response: block in read_until() so each line is handled as soon
+    # as it arrives (monotonic deadline: immune to wall-clock adjustments)
     response_lines = []
+    ser.timeout = 0.1
+    deadline = time.monotonic() + timeout
     
-    while (time.time() - start_time) < timeout:
-        if ser.in_waiting > 0:
-            try:
-                line = ser.readline().decode('ascii', errors='ignore').strip()
-                
-                # Skip sensor data lines
-                if line.startswith('S ') or line.startswith('s '):
-                    continue
-                
-                if line:
-                    response_lines.append(line)
-                    print(f"  {line}")
+    while time.monotonic() < deadline:
+        try:
+            raw = ser.read_until(b'\n').strip()
+            
+            # Skip timeouts and sensor data lines before decoding them
+            if not raw or raw.startswith(DATA_PREFIXES):
+                continue
             
-            except Exception as e:
-                print(f"  Error: {e}")
+            line = raw.decode('ascii', errors='ignore')
+            response_lines.append(line)
+            print(f"  {line}")
         
-        time.sleep(0.05)
+        except Exception as e:
+            print(f"  Error: {e}")
     
     if not response_lines:
         print("  (No response)")
@@ -93,10 +113,11 @@ def test_save_commands(port: str, baud: int = 115200):
         
         ser.close()
         
-        # Summary
-        print(f"\n{'=' * 60}")
-        print(f"SUMMARY")
-        print(f"{'=' * 60}\n")
+        # Summary (collected, then written in one go)
+        out = []
+        out.append(f"\n{'=' * 60}")
+        out.append(f"SUMMARY")
+        out.append(f"{'=' * 60}\n")
         
         for cmd, response in results.items():
             response_text = ' '.join(response) if response else "(no response)"
@@ -110,12 +131,14 @@ def test_save_commands(port: str, baud: int = 115200):
             else:
                 status = "✓ Valid response"
             
-            print(f"{cmd:20s} : {status}")
+            out.append(f"{cmd:20s} : {status}")
             if response and len(response) <= 3:
                 for line in response:
-                    print(f"{'':22s}   {line}")
+                    out.append(f"{'':22s}   {line}")
+        
+        out.append(f"\n{'=' * 60}\n")
         
-        print(f"\n{'=' * 60}\n")
+        sys.stdout.write('\n'.join(out) + '\n')
         
     except Exception as e:
         print(f"\n✗ ERROR: {e}")